@@ -0,0 +1,353 @@
+# benchmarks/fake_toolchain/fake_toolchain.py
+"""Offline stand-ins for the npm/npx/sv and yarn commands svelte-pi runs
+
+Behaviour is tuned with environment variables:
+
+- FAKE_TOOLCHAIN_LATENCY   seconds each command takes (default 0.2; a
+                           --frozen-lockfile install skips resolution and
+                           takes half)
+- FAKE_TOOLCHAIN_LINES     output lines printed by an install (default 2000)
+- FAKE_TOOLCHAIN_PACKAGES  transitive packages written to node_modules (default 150)
+- FAKE_TOOLCHAIN_FAIL      command to fail with exit code 1 ("sv create",
+                           "sv add", "yarn", "npm")
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+SV_VERSION = "0.0.0-fake"
+YARN_VERSION = "1.22.22"
+NPM_VERSION = "10.8.2"
+
+# Installed as node_modules/sv/bin/sv by the fake `npm install sv@...`
+SV_BIN = """#!{python}
+import sys
+
+sys.path.insert(0, {toolchain_dir!r})
+
+from fake_toolchain import sv_main
+
+sys.exit(sv_main(sys.argv[1:]))
+"""
+
+APP_HTML = """<!doctype html>
+<html lang="en">
+\t<head>
+\t\t<meta charset="utf-8" />
+\t\t<link rel="icon" href="%sveltekit.assets%/favicon.png" />
+\t\t<meta name="viewport" content="width=device-width, initial-scale=1" />
+\t\t%sveltekit.head%
+\t</head>
+\t<body data-sveltekit-preload-data="hover">
+\t\t<div style="display: contents">%sveltekit.body%</div>
+\t</body>
+</html>
+"""
+
+SVELTE_CONFIG = """import adapter from '@sveltejs/adapter-auto';
+import { vitePreprocess } from '@sveltejs/vite-plugin-svelte';
+
+/** @type {import('@sveltejs/kit').Config} */
+const config = {
+\t// Consult https://svelte.dev/docs/kit/integrations
+\t// for more information about preprocessors
+\tpreprocess: vitePreprocess(),
+
+\tkit: {
+\t\t// adapter-auto only supports some environments, see https://svelte.dev/docs/kit/adapter-auto for a list.
+\t\t// If your environment is not supported, or you settled on a specific environment, switch out the adapter.
+\t\t// See https://svelte.dev/docs/kit/adapters for more information about adapters.
+\t\tadapter: adapter()
+\t}
+};
+
+export default config;
+"""
+
+VITE_CONFIG = """import { sveltekit } from '@sveltejs/kit/vite';
+import { defineConfig } from 'vite';
+
+export default defineConfig({
+\tplugins: [sveltekit()]
+});
+"""
+
+TSCONFIG = {
+    "extends": "./.svelte-kit/tsconfig.json",
+    "compilerOptions": {
+        "allowJs": True, "checkJs": True, "esModuleInterop": True, "forceConsistentCasingInFileNames": True,
+        "resolveJsonModule": True, "skipLibCheck": True, "sourceMap": True, "strict": True,
+        "moduleResolution": "bundler",
+    },
+}
+
+BASE_DEV_DEPENDENCIES = {
+    "@sveltejs/adapter-auto": "^6.0.0",
+    "@sveltejs/kit": "^2.22.0",
+    "@sveltejs/vite-plugin-svelte": "^6.0.0",
+    "svelte": "^5.0.0",
+    "svelte-check": "^4.0.0",
+    "typescript": "^5.0.0",
+    "vite": "^7.0.3",
+}
+
+
+def npx_main(args):
+    args = [arg for arg in args if arg not in ("--yes", "-y")]
+    if not args:
+        return _fail("npx: missing command")
+
+    package, args = args[0], args[1:]
+    if package.split("@")[0] != "sv" and package != "sv":
+        return _fail(f"fake npx only knows sv, not {package}")
+    return sv_main(args)
+
+
+def npm_main(args):
+    if args == ["--version"]:
+        print(NPM_VERSION)
+        return 0
+    if args[:1] not in (["install"], ["i"]):
+        return _fail(f"fake npm does not support: {' '.join(args)}")
+    if _should_fail("npm"):
+        return _fail("npm error code E404\nnpm error 404 Not Found - simulated failure")
+
+    prefix = Path(args[args.index("--prefix") + 1]) if "--prefix" in args else Path.cwd()
+    packages = [arg for index, arg in enumerate(args[1:], start=1)
+                if not arg.startswith("-") and args[index - 1] != "--prefix"]
+    if [package.split("@")[0] for package in packages] != ["sv"]:
+        return _fail(f"fake npm only installs sv, not {' '.join(packages)}")
+
+    version = packages[0].partition("@")[2] or SV_VERSION
+    package_dir = prefix / "node_modules" / "sv"
+    (package_dir / "bin").mkdir(parents=True, exist_ok=True)
+    (package_dir / "package.json").write_text(json.dumps({"name": "sv", "version": version, "bin": "bin/sv"}))
+    (package_dir / "bin" / "sv").write_text(SV_BIN.format(python=sys.executable,
+                                                          toolchain_dir=os.path.dirname(os.path.abspath(__file__))))
+    os.chmod(package_dir / "bin" / "sv", 0o755)
+
+    bin_dir = prefix / "node_modules" / ".bin"
+    bin_dir.mkdir(exist_ok=True)
+    if not (bin_dir / "sv").is_symlink():
+        os.symlink("../sv/bin/sv", bin_dir / "sv")
+    (prefix / "package.json").write_text(json.dumps({"dependencies": {"sv": f"^{version}"}}, indent=2) + "\n")
+
+    _emit([f"added 1 package in 0.2s"], 5)
+    return 0
+
+
+def sv_main(args):
+    if args == ["--version"]:
+        print(SV_VERSION)
+        return 0
+    if args[:1] == ["create"]:
+        return _sv_create(args[1:])
+    if args[:1] == ["add"]:
+        return _sv_add(args[1:])
+    return _fail(f"fake sv does not support: {' '.join(args)}")
+
+
+def yarn_main(args):
+    if args == ["--version"]:
+        print(YARN_VERSION)
+        return 0
+
+    command = args[0] if args and not args[0].startswith("-") else "install"
+    if command == "add":
+        packages = [arg for arg in args[1:] if not arg.startswith("-")]
+        dev = "-D" in args or "--dev" in args
+        return _yarn_install(Path.cwd(), add=packages, dev=dev)
+    if command == "install":
+        return _yarn_install(Path.cwd(), frozen="--frozen-lockfile" in args)
+    return _fail(f"fake yarn does not support: {' '.join(args)}")
+
+
+def _sv_create(args):
+    name = next((arg for arg in args if not arg.startswith("-")), None)
+    if name is None:
+        return _fail("sv create: missing project name")
+    if _should_fail("sv create"):
+        return _fail("sv create: simulated failure")
+
+    project = Path.cwd() / name
+    if project.exists() and any(project.iterdir()):
+        return _fail(f"sv create: directory {name} is not empty")
+
+    _emit(["┌  Welcome to the Svelte CLI!", f"◇  Project created in {name}"], 20)
+
+    (project / "src" / "routes").mkdir(parents=True)
+    (project / "src" / "lib").mkdir()
+    (project / "static").mkdir()
+    _write_package_json(project, {
+        "name": name,
+        "private": True,
+        "version": "0.0.1",
+        "type": "module",
+        "scripts": {
+            "dev": "vite dev",
+            "build": "vite build",
+            "preview": "vite preview",
+            "prepare": "svelte-kit sync || echo ''",
+            "check": "svelte-kit sync && svelte-check --tsconfig ./tsconfig.json",
+        },
+        "devDependencies": dict(BASE_DEV_DEPENDENCIES),
+    })
+    (project / "svelte.config.js").write_text(SVELTE_CONFIG)
+    (project / "vite.config.ts").write_text(VITE_CONFIG)
+    (project / "tsconfig.json").write_text(json.dumps(TSCONFIG, indent="\t") + "\n")
+    (project / "src" / "app.html").write_text(APP_HTML)
+    (project / "src" / "app.d.ts").write_text("declare global {\n\tnamespace App {}\n}\n\nexport {};\n")
+    (project / "src" / "lib" / "index.ts").write_text("// place files you want to import through the `$lib` alias in this folder.\n")
+    (project / "src" / "routes" / "+page.svelte").write_text("<h1>Welcome to SvelteKit</h1>\n")
+    (project / "static" / "favicon.png").write_bytes(bytes(range(256)) * 4)
+    (project / ".gitignore").write_text("node_modules\n.svelte-kit\nbuild\n")
+    (project / ".npmrc").write_text("engine-strict=true\n")
+
+    if "--install" in args:
+        return _yarn_install(project)
+    return 0
+
+
+def _sv_add(args):
+    if _should_fail("sv add"):
+        return _fail("sv add: simulated failure")
+    if "prettier" not in args:
+        return _fail(f"fake sv add only supports prettier, not {' '.join(args)}")
+
+    project = Path.cwd()
+    package_data = json.loads((project / "package.json").read_text())
+    package_data["devDependencies"].update({"prettier": "^3.4.2", "prettier-plugin-svelte": "^3.3.3"})
+    package_data["scripts"].update({"format": "prettier --write .", "lint": "prettier --check ."})
+    _write_package_json(project, package_data)
+    (project / ".prettierrc").write_text(json.dumps({
+        "useTabs": True, "singleQuote": True, "trailingComma": "none", "printWidth": 100,
+        "plugins": ["prettier-plugin-svelte"],
+    }, indent="\t") + "\n")
+    (project / ".prettierignore").write_text("package-lock.json\npnpm-lock.yaml\nyarn.lock\n")
+
+    _emit(["◆  Adding prettier", "└  You're all set!"], 10)
+    if "--no-install" not in args:
+        return _yarn_install(project)
+    return 0
+
+
+def _yarn_install(project, add=(), dev=True, frozen=False):
+    if _should_fail("yarn"):
+        return _fail("error An unexpected error occurred: simulated failure")
+
+    package_json = project / "package.json"
+    package_data = json.loads(package_json.read_text())
+    section = "devDependencies" if dev else "dependencies"
+    for package in add:
+        package_data.setdefault(section, {})[package] = "^1.89.0"
+    _write_package_json(project, package_data)
+
+    direct = sorted({*package_data.get("dependencies", {}), *package_data.get("devDependencies", {}),
+                     *_workspace_dependencies(project, package_data)})
+    transitive = [f"fake-dep-{index:04d}" for index in range(int(os.environ.get("FAKE_TOOLCHAIN_PACKAGES", "150")))]
+    packages = direct + transitive
+    volume = int(os.environ.get("FAKE_TOOLCHAIN_LINES", "2000"))
+
+    if frozen:
+        # A complete lockfile skips resolution: only fetch and link remain
+        locked = _locked_packages(project)
+        if any(package not in locked for package in direct):
+            return _fail("error Your lockfile needs to be updated, but yarn was run with `--frozen-lockfile`.")
+        lines = ["yarn install v" + YARN_VERSION, "[1/4] Resolving packages...", "success Already up-to-date."]
+        lines += ["[2/4] Fetching packages...", "[3/4] Linking dependencies...", "[4/4] Building fresh packages..."]
+        _emit(lines, volume // 2, share=0.5)
+    else:
+        lines = ["yarn install v" + YARN_VERSION, "[1/4] Resolving packages..."]
+        lines += [f"info Resolved \"{package}@^1.0.0\"" for package in packages]
+        lines += ["[2/4] Fetching packages...", "[3/4] Linking dependencies...", "[4/4] Building fresh packages..."]
+        _emit(lines, volume)
+
+    node_modules = project / "node_modules"
+    for package in packages:
+        _write_package(node_modules, package)
+
+    bin_dir = node_modules / ".bin"
+    bin_dir.mkdir(exist_ok=True)
+    if not (bin_dir / "vite").is_symlink():
+        os.symlink("../vite/bin/cli.js", bin_dir / "vite")
+    (node_modules / ".yarn-integrity").write_text(json.dumps({"flags": [], "modulesFolders": ["node_modules"]}))
+
+    lock = ["# THIS IS AN AUTOGENERATED FILE. DO NOT EDIT THIS FILE DIRECTLY.", "# yarn lockfile v1", ""]
+    for package in packages:
+        lock += [f"\"{package}@^1.0.0\":", "  version \"1.0.0\"",
+                 f"  resolved \"https://registry.yarnpkg.com/{package}/-/{package.split('/')[-1]}-1.0.0.tgz\"", ""]
+    (project / "yarn.lock").write_text("\n".join(lock))
+
+    print("success Saved lockfile.")
+    print("Done in 0.01s.")
+    return 0
+
+
+def _workspace_dependencies(project, package_data):
+    """Dependencies of every workspace member, all hoisted to the root"""
+    workspaces = package_data.get("workspaces", [])
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages", [])
+    if workspaces and not package_data.get("private"):
+        raise SystemExit(_fail("error Workspaces can only be enabled in private projects."))
+
+    found = set()
+    for pattern in workspaces:
+        for member_json in project.glob(f"{pattern}/package.json"):
+            member = json.loads(member_json.read_text())
+            found.update(member.get("dependencies", {}), member.get("devDependencies", {}))
+    return found
+
+
+def _locked_packages(project):
+    try:
+        lock = (project / "yarn.lock").read_text()
+    except FileNotFoundError:
+        return set()
+    return {line[1:].rsplit("@", 1)[0] for line in lock.splitlines() if line.startswith('"')}
+
+
+def _write_package(node_modules, package):
+    root = node_modules / package
+    (root / "lib").mkdir(parents=True, exist_ok=True)
+    (root / "package.json").write_text(json.dumps({"name": package, "version": "1.0.0", "main": "lib/index.js"}))
+    # Deterministic content so identical packages dedupe across projects
+    body = "".join(f"export const value{index} = '{package}:{index}';\n" for index in range(120))
+    (root / "lib" / "index.js").write_text(body)
+    (root / "README.md").write_text(f"# {package}\n\n" + "Lorem ipsum dolor sit amet. " * 40)
+    if package == "vite":
+        (root / "bin").mkdir(exist_ok=True)
+        (root / "bin" / "cli.js").write_text("#!/usr/bin/env node\n")
+        os.chmod(root / "bin" / "cli.js", 0o755)
+
+
+def _write_package_json(project, package_data):
+    (project / "package.json").write_text(json.dumps(package_data, indent="\t") + "\n")
+
+
+def _emit(lines, volume, share=1.0):
+    """Print roughly `volume` lines spread over `share` of FAKE_TOOLCHAIN_LATENCY seconds"""
+    latency = float(os.environ.get("FAKE_TOOLCHAIN_LATENCY", "0.2")) * share
+    lines = list(lines)
+    while len(lines) < volume:
+        lines.append(f"verbose {time.monotonic():.6f} Fetching chunk {len(lines)} of the package tarball cache")
+
+    pause = latency / max(1, len(lines))
+    for line in lines:
+        print(line, flush=pause > 0.001)
+        if pause > 0.001:
+            time.sleep(pause)
+    if pause <= 0.001:
+        time.sleep(latency)
+    sys.stdout.flush()
+
+
+def _should_fail(command):
+    return os.environ.get("FAKE_TOOLCHAIN_FAIL") == command
+
+
+def _fail(message):
+    print(message, file=sys.stderr)
+    return 1
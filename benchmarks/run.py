@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# benchmarks/run.py
+"""End-to-end benchmark suite for the svelte-pi CLI
+
+Runs the real CLI in fresh processes against the offline stand-ins in
+benchmarks/fake_toolchain (put first on PATH), with a throwaway HOME and
+cache directory, so nothing touches the network or the user's caches.
+
+Scenarios:
+
+- cold_create    `create --no-cache` (sv create, prettier, install) with
+                 no lockfile seed
+- seeded_create  `create --no-cache` installing from a lockfile seed
+- warm_create    `create` with the skeleton cache already populated
+- workspace_fleet  `create --spec` of 10 apps into one yarn workspace,
+                   installed by a single hoisted install
+- components     `component` with --components paths in one call, with rich
+                 output and with --quiet
+- startup        `svelte-pi --help`
+
+Each reports the best wall time of --runs processes; the create scenarios
+also report the peak RSS of the CLI and its children. Results are
+compared against benchmarks/baselines.json and a metric counts as a
+regression when it exceeds its baseline by more than --tolerance. Component
+timings are only compared when --components matches the baselines.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FAKE_TOOLCHAIN = Path(__file__).resolve().parent / "fake_toolchain"
+BASELINES = Path(__file__).resolve().parent / "baselines.json"
+
+SCENARIOS = ("cold_create", "seeded_create", "warm_create", "workspace_fleet", "components", "startup")
+COMPONENT_METRICS = ("components_ms", "components_quiet_ms")
+
+
+def run_cli(args, env, cwd):
+    """Run `svelte-pi ARGS`; return (wall_ms, peak_rss_kb, returncode, output)"""
+    output = tempfile.TemporaryFile()
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "svelte_pi.main", *args],
+                               cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                               stdout=output, stderr=subprocess.STDOUT)
+    # wait4 reports the peak RSS of this process tree alone
+    _, status, usage = os.wait4(process.pid, 0)
+    wall_ms = (time.perf_counter() - start) * 1000
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    output.seek(0)
+    text = output.read().decode(errors="replace")
+    output.close()
+    if sys.platform == "darwin":
+        return wall_ms, usage.ru_maxrss // 1024, process.returncode, text
+    return wall_ms, usage.ru_maxrss, process.returncode, text
+
+
+def hermetic_env(root):
+    home = root / "home"
+    home.mkdir(parents=True, exist_ok=True)
+    env = {key: value for key, value in os.environ.items()
+           if not key.startswith(("SVELTE_PI_", "XDG_"))}
+    env.update({
+        "HOME": str(home),
+        "XDG_CACHE_HOME": str(home / ".cache"),
+        "XDG_CONFIG_HOME": str(home / ".config"),
+        "SVELTE_PI_CACHE_DIR": str(root / "cache"),
+        "PATH": os.pathsep.join([str(FAKE_TOOLCHAIN), env.get("PATH", "")]),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])),
+        "TERM": "dumb",
+        "COLUMNS": "120",
+    })
+    env.setdefault("FAKE_TOOLCHAIN_LATENCY", "0.2")
+    return env
+
+
+def create_project(env, parent, name, *extra):
+    wall_ms, rss_kb, returncode, output = run_cli(
+        ["create", "--name", name, "--reset", "--dir", str(parent), "--no-input", *extra], env, parent)
+    if returncode != 0 or not (parent / name / "node_modules").is_dir():
+        raise RuntimeError(f"create {name} failed:\n{output}")
+    return wall_ms, rss_kb
+
+
+def bench_cold_create(env, work, runs):
+    samples = []
+    for run in range(runs):
+        # Each run would otherwise install from the seed the previous one saved
+        shutil.rmtree(Path(env["SVELTE_PI_CACHE_DIR"]) / "seeds", ignore_errors=True)
+        samples.append(create_project(env, work, f"cold-{run}", "--no-cache"))
+    return {"cold_create_ms": min(wall for wall, _ in samples),
+            "cold_create_peak_rss_kb": max(rss for _, rss in samples)}
+
+
+def bench_seeded_create(env, work, runs):
+    create_project(env, work, "seeded-seed", "--no-cache")
+    samples = [create_project(env, work, f"seeded-{run}", "--no-cache") for run in range(runs)]
+    return {"seeded_create_ms": min(wall for wall, _ in samples)}
+
+
+def bench_warm_create(env, work, runs):
+    create_project(env, work, "warm-seed")
+    samples = [create_project(env, work, f"warm-{run}") for run in range(runs)]
+    return {"warm_create_ms": min(wall for wall, _ in samples),
+            "warm_create_peak_rss_kb": max(rss for _, rss in samples)}
+
+
+def bench_workspace_fleet(env, work, runs, count=10):
+    spec = work / "workspace-fleet.json"
+    spec.write_text(json.dumps([f"app{index}" for index in range(count)]))
+    samples = []
+    for run in range(runs):
+        root = work / f"mono-{run}"
+        wall_ms, _, returncode, output = run_cli(["--quiet", "create", "--spec", str(spec), "--workspace", str(root)],
+                                                 env, work)
+        if returncode != 0 or not (root / "node_modules").is_dir():
+            raise RuntimeError(f"workspace fleet failed:\n{output}")
+        samples.append(wall_ms)
+    return {"workspace_fleet_ms": min(samples)}
+
+
+def bench_components(env, work, runs, count):
+    project = work / "components-app"
+    if not project.exists():
+        create_project(env, work, project.name)
+
+    paths = [f"bench/group{index // 20}/item{index}" for index in range(count)]
+    results = {}
+    for metric, options in zip(COMPONENT_METRICS, ([], ["--quiet"])):
+        samples = []
+        for _ in range(runs):
+            shutil.rmtree(project / "src" / "lib" / "components" / "bench", ignore_errors=True)
+            wall_ms, _, returncode, output = run_cli([*options, "component", *paths], env, project)
+            if returncode != 0:
+                raise RuntimeError(f"component failed:\n{output}")
+            samples.append(wall_ms)
+        results[metric] = min(samples)
+    return results
+
+
+def bench_startup(env, work, runs):
+    samples = [run_cli(["--help"], env, work)[0] for _ in range(runs)]
+    return {"startup_help_ms": min(samples)}
+
+
+def load_baselines():
+    if BASELINES.exists():
+        return json.loads(BASELINES.read_text())
+    return {"metrics": {}}
+
+
+def compare(results, baselines, tolerance):
+    """Return (metric, value, baseline, change) rows and the regressed metrics"""
+    rows, regressions = [], []
+    for metric, value in results.items():
+        baseline = baselines.get(metric)
+        change = None if not baseline else value / baseline - 1
+        rows.append((metric, value, baseline, change))
+        if change is not None and change > tolerance:
+            regressions.append(metric)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="processes per measurement")
+    parser.add_argument("--components", type=int, default=200, help="components per bulk call")
+    parser.add_argument("--only", action="append", choices=SCENARIOS, help="run only these scenarios")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown over the baseline (0.25 = 25%%)")
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="write these results to benchmarks/baselines.json")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch directory")
+    args = parser.parse_args(argv)
+
+    scenarios = args.only or SCENARIOS
+    root = Path(tempfile.mkdtemp(prefix="svelte-pi-bench-"))
+    env = hermetic_env(root)
+    work = root / "work"
+    work.mkdir()
+
+    results = {}
+    try:
+        for scenario in scenarios:
+            print(f"running {scenario}...", flush=True)
+            if scenario == "components":
+                results.update(bench_components(env, work, args.runs, args.components))
+            else:
+                results.update(globals()[f"bench_{scenario}"](env, work, args.runs))
+    except RuntimeError as error:
+        print(f"FAIL: {error}")
+        return 1
+    finally:
+        if args.keep:
+            print(f"scratch directory kept at {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    baselines = load_baselines()
+    comparable = dict(baselines["metrics"])
+    if args.components != baselines.get("components"):
+        # Timings for a different batch size say nothing about a regression
+        for metric in COMPONENT_METRICS:
+            comparable.pop(metric, None)
+        if "components" in scenarios and not args.update_baselines:
+            print(f"\nnote: baselines were measured with --components {baselines.get('components')}; "
+                  f"component timings are not compared")
+    rows, regressions = compare(results, comparable, args.tolerance)
+
+    print()
+    print(f"{'metric':28} {'value':>12} {'baseline':>12} {'change':>8}")
+    for metric, value, baseline, change in rows:
+        baseline_text = f"{baseline:12.1f}" if baseline else f"{'-':>12}"
+        change_text = f"{change:+8.1%}" if change is not None else f"{'-':>8}"
+        flag = "  REGRESSION" if metric in regressions else ""
+        print(f"{metric:28} {value:12.1f} {baseline_text} {change_text}{flag}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps({"metrics": results}, indent=2) + "\n")
+
+    if args.update_baselines:
+        baselines["metrics"].update({metric: round(value, 1) for metric, value in results.items()})
+        baselines["machine"] = {"python": platform.python_version(), "platform": platform.platform()}
+        if "components" in scenarios:
+            baselines["components"] = args.components
+        BASELINES.write_text(json.dumps(baselines, indent=2) + "\n")
+        print(f"\nbaselines written to {BASELINES.relative_to(REPO_ROOT)}")
+        return 0
+
+    if regressions:
+        print()
+        print(f"FAIL: {len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+        return 1
+
+    print()
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
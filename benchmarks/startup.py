@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# benchmarks/startup.py
+"""Cold-start benchmark for the svelte-pi CLI
+
+Measures, in fresh interpreters:
+
+- `import svelte_pi.main` with `python -X importtime`, listing the slowest
+  imports and svelte-pi's own share of the import time
+- wall-clock time of `svelte-pi --help` against a bare `python -c pass`
+
+Each figure is the best of --runs fresh processes.
+
+Fails (exit code 1) if rich or a command module is imported at startup,
+if svelte-pi's own import cost on top of click exceeds --own-budget-ms, or
+if `--help` costs more than --budget-ms over a bare interpreter.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Nothing below may be imported just to parse the command line
+LAZY_MODULES = (
+    "rich",
+    "svelte_pi.ui",
+    "svelte_pi.project_setup",
+    "svelte_pi.file_operations",
+    "svelte_pi.create_pipeline",
+)
+
+
+def run_python(args, capture=False):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE if capture else subprocess.DEVNULL,
+        text=True,
+    )
+
+
+def best_ms(args, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_python(args)
+        samples.append((time.perf_counter() - start) * 1000)
+    # The fastest run is the least disturbed by other load on the machine
+    return min(samples)
+
+
+def import_times(module):
+    """Run `python -X importtime` once; map module name -> (self_us, cumulative_us)"""
+    result = run_python(["-X", "importtime", "-c", f"import {module}"], capture=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        times[name.strip()] = (int(self_us), int(cumulative_us), name.rstrip())
+    return times
+
+
+def own_import_ms(runs):
+    """svelte-pi's own import cost: svelte_pi and svelte_pi.main minus click"""
+    samples = []
+    for _ in range(runs):
+        times = import_times("svelte_pi.main")
+        own = sum(times.get(name, (0, 0))[1] for name in ("svelte_pi", "svelte_pi.main"))
+        samples.append((own - times.get("click", (0, 0))[1]) / 1000)
+    return min(samples)
+
+
+def eagerly_imported():
+    script = (
+        "import sys, svelte_pi.main\n"
+        f"print('\\n'.join(m for m in sys.modules if m.split('.')[0] == 'rich' or m in {LAZY_MODULES!r}))"
+    )
+    result = run_python(["-c", script], capture=True)
+    return sorted({name.split(".")[0] if name.startswith("rich") else name
+                   for name in result.stdout.split()})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="processes per measurement")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="allowed `svelte-pi --help` time over a bare interpreter")
+    parser.add_argument("--own-budget-ms", type=float, default=15.0,
+                        help="allowed import time of svelte-pi's own modules")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args(argv)
+
+    failures = []
+
+    print("Slowest imports for svelte_pi.main (cumulative):")
+    slowest = sorted(import_times("svelte_pi.main").values(), key=lambda row: row[1], reverse=True)
+    for self_us, cumulative_us, label in slowest[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {label}")
+
+    eager = eagerly_imported()
+    if eager:
+        failures.append(f"imported at startup: {', '.join(eager)}")
+
+    bare = best_ms(["-c", "pass"], args.runs)
+    help_run = best_ms(["-m", "svelte_pi.main", "--help"], args.runs)
+    own_cost = own_import_ms(args.runs)
+    help_cost = help_run - bare
+
+    print()
+    print(f"python -c pass             {bare:8.1f} ms")
+    print(f"svelte-pi --help           {help_run:8.1f} ms  (over bare {help_cost:+.1f} ms, budget {args.budget_ms} ms)")
+    print(f"svelte-pi own imports      {own_cost:8.1f} ms  (excluding click, budget {args.own_budget_ms} ms)")
+
+    if own_cost > args.own_budget_ms:
+        failures.append(f"svelte_pi.main import costs {own_cost:.1f} ms over click")
+    if help_cost > args.budget_ms:
+        failures.append(f"--help costs {help_cost:.1f} ms over a bare interpreter")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+
+    print()
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
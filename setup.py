@@ -12,9 +12,14 @@ setup(
         "rich>=13.0.0",
         "click>=8.0.0",
     ],
+    extras_require={
+        "yaml": ["pyyaml>=6.0"],
+        "zstd": ["zstandard>=0.21"],
+    },
     entry_points={
         "console_scripts": [
             "svelte-pi=svelte_pi.main:cli",
+            "svelte-pi-client=svelte_pi.client:main",
         ],
     },
     python_requires=">=3.9",
@@ -0,0 +1,257 @@
+# bundles.py
+import fnmatch
+import json
+import os
+import re
+import shutil
+import tarfile
+from contextlib import ExitStack, contextmanager
+from pathlib import Path, PurePosixPath
+
+from .console import console, print_error
+from .tracing import record_files
+
+MANIFEST_FILE = "svelte-pi.bundle.json"
+
+# Steps a bundle may still need after extraction, in the order create runs them
+POST_STEPS = ("add_prettier", "install_sass", "tokens", "reset")
+
+# Files in which {{project_name}} and {{bundle_version}} are replaced
+DEFAULT_SUBSTITUTE = ("*.json", "*.js", "*.cjs", "*.mjs", "*.ts", "*.svelte", "*.html", "*.css", "*.scss",
+                      "*.md", "*.txt", "*.yaml", "*.yml", ".env*")
+
+# Version-control metadata is never copied out of a directory bundle
+SKIPPED_DIRS = (".git", ".hg", ".svn")
+
+CHUNK_SIZE = 1024 * 1024
+
+_PLACEHOLDER = re.compile(rb"\{\{\s*(project_name|bundle_version)\s*\}\}")
+
+
+class Bundle:
+    """A local project template: a directory, .tar.gz/.tgz or .tar.zst archive
+
+    The bundle root is the directory holding svelte-pi.bundle.json, which
+    gives the bundle's name and version, the post_steps create still has to
+    run (all of POST_STEPS when omitted) and optionally the `substitute`
+    globs of files to replace placeholders in.
+    """
+
+    def __init__(self, path, manifest, prefix=""):
+        self.path = Path(path)
+        self.manifest = manifest
+        self.prefix = prefix
+        self.name = str(manifest.get("name") or self.path.name)
+        self.version = str(manifest.get("version", "0"))
+        self.post_steps = tuple(manifest.get("post_steps", POST_STEPS))
+        self.substitute = tuple(manifest.get("substitute", DEFAULT_SUBSTITUTE))
+
+        unknown = [step for step in self.post_steps if step not in POST_STEPS]
+        if unknown:
+            raise ValueError(f"Unknown post_steps in {MANIFEST_FILE}: {', '.join(unknown)} "
+                             f"(expected some of {', '.join(POST_STEPS)})")
+
+    def needs(self, step):
+        return step in self.post_steps
+
+
+def load_bundle(path):
+    """Read a bundle's manifest; raises ValueError if it is not a bundle
+
+    Archives are streamed only until the manifest is found, so an archive
+    that lists it first is not decompressed any further.
+    """
+    path = Path(path)
+    if path.is_dir():
+        manifest_path = path / MANIFEST_FILE
+        if not manifest_path.is_file():
+            raise ValueError(f"{path} is not a bundle: no {MANIFEST_FILE}")
+        return Bundle(path, _parse_manifest(manifest_path.read_bytes()))
+
+    try:
+        with _open_archive(path) as archive:
+            for member in archive:
+                name = _member_name(member)
+                if PurePosixPath(name).name == MANIFEST_FILE and member.isfile() and name.count("/") <= 1:
+                    prefix = name[:-len(MANIFEST_FILE)]
+                    return Bundle(path, _parse_manifest(archive.extractfile(member).read()), prefix)
+    except (OSError, tarfile.TarError) as e:
+        raise ValueError(f"Could not read bundle {path}: {str(e)}")
+    raise ValueError(f"{path} is not a bundle: no {MANIFEST_FILE} at its root")
+
+
+def extract_bundle(bundle, project_path, project_name):
+    """Write a bundle's files into a new project directory, replacing placeholders
+
+    Archive members are streamed straight into place, with no staging
+    copy; directory bundles are reflinked or copied file by file. Paths
+    that would escape the project are refused. On failure the partly
+    written project is removed. Returns the project path, or None.
+    """
+    project_path = Path(project_path)
+    console.print(f"[cyan]Creating project from bundle {bundle.name} {bundle.version} in {project_path}...[/cyan]")
+
+    if project_path.exists():
+        print_error(f"Error: {project_path} already exists")
+        return None
+
+    variables = {b"project_name": project_name.encode(), b"bundle_version": bundle.version.encode()}
+    try:
+        project_path.mkdir(parents=True)
+        if bundle.path.is_dir():
+            count = _copy_directory(bundle, project_path, variables)
+        else:
+            count = _extract_archive(bundle, project_path, variables)
+        console.print(f"[green]✓[/green] {count} files written from {bundle.name} {bundle.version}")
+        return project_path
+
+    except Exception as e:
+        print_error(f"Error extracting bundle:")
+        print_error(f"{str(e)}")
+        shutil.rmtree(project_path, ignore_errors=True)
+        return None
+
+
+def _extract_archive(bundle, project_path, variables):
+    root = project_path.resolve()
+    count = 0
+    with _open_archive(bundle.path) as archive:
+        for member in archive:
+            name = _member_name(member)
+            if not name.startswith(bundle.prefix):
+                continue
+            relative = name[len(bundle.prefix):]
+            if relative in ("", MANIFEST_FILE):
+                continue
+            target = _safe_target(root, relative)
+
+            if member.isdir():
+                target.mkdir(parents=True, exist_ok=True)
+            elif member.isfile():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                source = archive.extractfile(member)
+                _write_member(source, target, relative, bundle, variables)
+                os.chmod(target, 0o755 if member.mode & 0o111 else 0o644)
+                record_files(target)
+                count += 1
+            elif member.issym():
+                _check_link(root, target, member.linkname, relative)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.symlink(member.linkname, target)
+            else:
+                raise ValueError(f"Unsupported archive member {relative!r} (only files, directories and "
+                                 f"symlinks are allowed)")
+    return count
+
+
+def _copy_directory(bundle, project_path, variables):
+    from .skeleton_cache import _FileCloner
+
+    cloner = _FileCloner("reflink")
+    root = project_path.resolve()
+    count = 0
+    for directory, dirs, files in os.walk(bundle.path):
+        dirs[:] = [name for name in dirs if name not in SKIPPED_DIRS]
+        relative_dir = Path(directory).relative_to(bundle.path)
+        if relative_dir.parts:
+            _safe_target(root, relative_dir.as_posix()).mkdir(parents=True, exist_ok=True)
+        for name in dirs + files:
+            source = Path(directory) / name
+            relative = (relative_dir / name).as_posix()
+            if source.is_symlink():
+                target = _safe_target(root, relative)
+                _check_link(root, target, os.readlink(source), relative)
+                os.symlink(os.readlink(source), target)
+                if name in dirs:
+                    dirs.remove(name)
+            elif name in files and relative != MANIFEST_FILE:
+                target = _safe_target(root, relative)
+                if _substitutes(bundle, relative):
+                    with open(source, "rb") as handle:
+                        _write_member(handle, target, relative, bundle, variables)
+                    shutil.copymode(source, target)
+                else:
+                    cloner.clone(source, target, False)
+                record_files(target)
+                count += 1
+    return count
+
+
+def _write_member(source, target, relative, bundle, variables):
+    """Stream one file into place, replacing placeholders in text files"""
+    with open(target, "wb") as output:
+        if _substitutes(bundle, relative):
+            output.write(_PLACEHOLDER.sub(lambda match: variables[match.group(1)], source.read()))
+        else:
+            shutil.copyfileobj(source, output, CHUNK_SIZE)
+
+
+def _substitutes(bundle, relative):
+    name = PurePosixPath(relative).name
+    return any(fnmatch.fnmatch(name, pattern) for pattern in bundle.substitute)
+
+
+def _safe_target(root, relative):
+    """Resolve a member path inside the project, refusing absolute paths and `..`
+
+    The parent is resolved on disk as well, so a member cannot be written
+    through symlinks extracted earlier (`s -> .`, `t -> s/..`, `t/x`), and
+    an existing symlink is never written through.
+    """
+    path = PurePosixPath(relative)
+    if path.is_absolute() or ".." in path.parts or "\\" in relative:
+        raise ValueError(f"Refusing to write {relative!r} outside the project")
+    target = root.joinpath(*path.parts)
+    if not _inside(root, os.path.realpath(target.parent)) or target.is_symlink():
+        raise ValueError(f"Refusing to write {relative!r} through a symlink")
+    return target
+
+
+def _check_link(root, target, link, relative):
+    resolved = os.path.realpath(os.path.join(os.path.realpath(os.path.dirname(target)), link))
+    if os.path.isabs(link) or not _inside(root, resolved):
+        raise ValueError(f"Refusing symlink {relative!r} -> {link!r}, which points outside the project")
+
+
+def _inside(root, path):
+    return os.path.commonpath([path, str(root)]) == str(root)
+
+
+def _member_name(member):
+    name = member.name
+    while name.startswith("./"):
+        name = name[2:]
+    return name.rstrip("/")
+
+
+def _parse_manifest(data):
+    try:
+        manifest = json.loads(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid {MANIFEST_FILE}: {str(e)}")
+    if not isinstance(manifest, dict):
+        raise ValueError(f"Invalid {MANIFEST_FILE}: expected an object")
+    return manifest
+
+
+@contextmanager
+def _open_archive(path):
+    """Open a .tar.gz/.tgz/.tar.zst/.tar as a forward-only tar stream"""
+    path = Path(path)
+    suffixes = "".join(path.suffixes[-2:]).lower()
+    with ExitStack() as stack:
+        handle = stack.enter_context(open(path, "rb"))
+        if suffixes.endswith((".tar.zst", ".tzst")):
+            try:
+                import zstandard
+            except ImportError:
+                raise ValueError("zstd bundles need zstandard: pip install zstandard")
+            handle = stack.enter_context(zstandard.ZstdDecompressor().stream_reader(handle))
+            mode = "r|"
+        elif suffixes.endswith((".tar.gz", ".tgz")):
+            mode = "r|gz"
+        elif suffixes.endswith(".tar"):
+            mode = "r|"
+        else:
+            raise ValueError(f"Unsupported bundle {path.name}: expected a directory, .tar.gz, .tgz or .tar.zst")
+        yield stack.enter_context(tarfile.open(fileobj=handle, mode=mode))
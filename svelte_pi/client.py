@@ -0,0 +1,96 @@
+# client.py
+"""Thin svelte-pi entry point that hands commands to `svelte-pi serve`
+
+Only the standard library is imported on the fast path. When no daemon
+is listening, or the command needs a terminal (prompts), the command runs
+in this process exactly as `svelte-pi` would run it.
+"""
+import json
+import os
+import socket
+import sys
+
+# Commands the daemon runs; anything else always runs in-process
+DAEMON_COMMANDS = ("component", "components", "patch", "templates")
+
+# Options of daemon commands that take a value
+_VALUE_OPTIONS = ("--from", "--trace", "--stylesheet", "--preconnect", "--preload", "--alias")
+
+
+def socket_path():
+    """Return the daemon socket path (SVELTE_PI_SOCKET, else in the cache dir)"""
+    override = os.environ.get("SVELTE_PI_SOCKET")
+    if override:
+        return os.path.expanduser(override)
+
+    # Mirrors paths.cache_dir() without importing pathlib
+    cache = os.environ.get("SVELTE_PI_CACHE_DIR")
+    if not cache:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache = os.path.join(base, "svelte-pi")
+    return os.path.join(os.path.expanduser(cache), "daemon.sock")
+
+
+def send_request(request, path=None, timeout=60):
+    """Send one JSON request; return the decoded reply, or None if no daemon answered"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path or socket_path())
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as replies:
+                reply = replies.readline()
+    except OSError:
+        return None
+    try:
+        return json.loads(reply) if reply else None
+    except ValueError:
+        return None
+
+
+def needs_terminal(argv):
+    """True if the command would prompt (e.g. the component wizard)"""
+    if argv[:1] != ["component"]:
+        return False
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in _VALUE_OPTIONS:
+            if arg == "--from":
+                return False
+            next(args, None)
+        elif not arg.startswith("-"):
+            return False
+    return True
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    if argv[:1] and argv[0] in DAEMON_COMMANDS and "--help" not in argv and not needs_terminal(argv):
+        reply = send_request({
+            "command": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "width": _terminal_width(),
+            "color": sys.stdout.isatty() and "NO_COLOR" not in os.environ,
+        })
+        # Every daemon command is idempotent, so if the daemon went away
+        # mid-request, running it again here is safe
+        if reply is not None and "exit_code" in reply:
+            sys.stdout.write(reply["output"])
+            sys.stdout.flush()
+            return reply["exit_code"]
+
+    from .main import cli
+    return cli.main(args=argv, prog_name="svelte-pi")
+
+
+def _terminal_width():
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        return int(os.environ.get("COLUMNS", 80))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
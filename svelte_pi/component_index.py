@@ -0,0 +1,182 @@
+# component_index.py
+import fnmatch
+import json
+import os
+from pathlib import Path
+
+from .paths import PROJECT_STATE_DIR, ignore_project_state
+
+INDEX_VERSION = 1
+INDEX_FILE = Path(PROJECT_STATE_DIR) / "components.json"
+COMPONENTS_DIR = Path("src") / "lib" / "components"
+
+
+class ComponentIndex:
+    """Component name -> .svelte files under src/lib/components, kept in the project
+
+    The index records the mtime of every directory it has seen. A
+    directory's mtime changes whenever an entry is added, removed or
+    renamed inside it, so refresh() only stats the known directories and
+    re-scans the ones that changed; a full walk happens only when there is
+    no usable index yet.
+    """
+
+    def __init__(self, project_root):
+        self.project_root = Path(project_root)
+        self.components_dir = self.project_root / COMPONENTS_DIR
+        self._base = str(self.components_dir)
+        # relative dir -> [mtime_ns, {.svelte file name: mtime_ns}]
+        self.dirs = {}
+        self.changed = False
+        self._names = None
+
+    @classmethod
+    def load(cls, project_root):
+        """Read the index from disk without checking it against the tree"""
+        index = cls(project_root)
+        try:
+            data = json.loads((index.project_root / INDEX_FILE).read_text())
+            if data.get("version") == INDEX_VERSION:
+                index.dirs = data["dirs"]
+        except (OSError, ValueError, KeyError, TypeError):
+            index.dirs = {}
+        return index
+
+    def refresh(self, max_workers=8):
+        """Bring the index up to date with the tree; returns True if anything changed"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if not self.dirs:
+                stale = [""]
+            else:
+                # One stat per directory; cheaper in a plain loop than as
+                # thousands of pool tasks
+                stale = []
+                for relative, mtime in [(relative, self._dir_mtime(relative)) for relative in self.dirs]:
+                    if mtime is None:
+                        # Descendants of a removed directory are missing too
+                        del self.dirs[relative]
+                        self.changed = True
+                    elif mtime != self.dirs[relative][0]:
+                        stale.append(relative)
+
+            # Re-scan changed directories, then any new subdirectories they
+            # contain, a level at a time across the pool
+            while stale:
+                subdirectories = []
+                for relative, scan in zip(stale, executor.map(self._scan, stale)):
+                    if scan is None:
+                        self._forget(relative)
+                        continue
+                    mtime, svelte_files, children = scan
+                    self.changed = True
+                    self.dirs[relative] = [mtime, svelte_files]
+                    subdirectories.extend(child for child in children if child not in self.dirs)
+                stale = subdirectories
+
+        if self.changed:
+            self._names = None
+        return self.changed
+
+    def names(self):
+        """Map component name -> sorted relative .svelte paths"""
+        if self._names is None:
+            names = {}
+            for relative, (_, svelte_files) in self.dirs.items():
+                prefix = f"{relative}/" if relative else ""
+                for file_name in svelte_files:
+                    names.setdefault(file_name[:-len(".svelte")], []).append(prefix + file_name)
+            self._names = {name: sorted(paths) for name, paths in names.items()}
+        return self._names
+
+    def find(self, pattern):
+        """Return (name, path) pairs whose name matches a glob, case-insensitively"""
+        if not any(char in pattern for char in "*?["):
+            pattern = f"*{pattern}*"
+        pattern = pattern.lower()
+        return [(name, path) for name, paths in sorted(self.names().items())
+                if fnmatch.fnmatchcase(name.lower(), pattern) for path in paths]
+
+    def conflicts(self, name, own_file):
+        """Other .svelte files that already use this component name"""
+        return [path for path in self.names().get(name, []) if path != own_file]
+
+    def record(self, svelte_files):
+        """Add freshly written .svelte files (absolute paths) without re-scanning"""
+        for svelte_file in svelte_files:
+            relative = self.relative(svelte_file)
+            try:
+                file_mtime = os.stat(svelte_file).st_mtime_ns
+            except OSError:
+                continue
+            # The writes changed these directories; record their new mtimes
+            parts = relative.split("/")
+            for depth in range(len(parts)):
+                directory = "/".join(parts[:depth])
+                mtime = self._dir_mtime(directory)
+                if mtime is not None:
+                    self.dirs.setdefault(directory, [mtime, {}])[0] = mtime
+            self.dirs["/".join(parts[:-1])][1][parts[-1]] = file_mtime
+            self.changed = True
+        self._names = None
+
+    def save(self):
+        """Write the index if it changed"""
+        if not self.changed:
+            return
+        index_file = self.project_root / INDEX_FILE
+        try:
+            ignore_project_state(self.project_root, INDEX_FILE.name)
+            temp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps({"version": INDEX_VERSION, "dirs": self.dirs}))
+            os.replace(temp_file, index_file)
+            self.changed = False
+        except OSError:
+            # The index is an optimization only; it is rebuilt when missing
+            pass
+
+    def relative(self, path):
+        return Path(path).relative_to(self.components_dir).as_posix()
+
+    def _absolute(self, relative):
+        return self.components_dir / relative if relative else self.components_dir
+
+    def _dir_mtime(self, relative):
+        # Plain string paths: this runs once per indexed directory on every refresh
+        base = self._base
+        try:
+            return os.stat(f"{base}/{relative}" if relative else base).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan(self, relative):
+        """Return (mtime, {svelte file name: mtime}, [subdirectories]) or None if gone"""
+        directory = self._absolute(relative)
+        prefix = f"{relative}/" if relative else ""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            svelte_files, children = {}, []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        children.append(prefix + entry.name)
+                    elif entry.name.endswith(".svelte"):
+                        svelte_files[entry.name] = entry.stat().st_mtime_ns
+        except OSError:
+            return None
+        return mtime, svelte_files, children
+
+    def _forget(self, relative):
+        prefix = f"{relative}/" if relative else ""
+        for directory in [directory for directory in self.dirs if directory == relative or directory.startswith(prefix)]:
+            del self.dirs[directory]
+            self.changed = True
+
+
+def load_index(project_root, max_workers=8):
+    """Load the project's component index, refresh it and save any changes"""
+    index = ComponentIndex.load(project_root)
+    index.refresh(max_workers=max_workers)
+    index.save()
+    return index
@@ -0,0 +1,167 @@
+# console.py
+import json
+import re
+import sys
+import threading
+
+_console = None
+_lock = threading.Lock()
+_mode = "rich"
+
+OUTPUT_MODES = ("rich", "json", "quiet")
+
+# Rich markup tags such as [red], [/red], [bold cyan] or [/]
+_MARKUP_TAG = re.compile(r"\[/?[a-z][a-z0-9_ #]*\]|\[/\]")
+
+
+def get_console():
+    """Return the shared rich Console, importing rich on first use"""
+    global _console
+    if _console is None:
+        with _lock:
+            if _console is None:
+                from rich.console import Console
+                _console = Console()
+    return _console
+
+
+def use_console(new_console):
+    """Route all svelte-pi output to a different Console (e.g. a log file)
+
+    Returns the previous console (None if none was built yet) so callers
+    can restore it.
+    """
+    global _console
+    with _lock:
+        previous, _console = _console, new_console
+    return previous
+
+
+def output_mode():
+    """Return the active output mode (one of OUTPUT_MODES)"""
+    return _mode
+
+
+def set_output_mode(mode):
+    """Switch between rich output and the plain json/quiet modes
+
+    The json and quiet modes replace the shared Console with one that never
+    imports rich: ordinary messages are dropped, and only errors (printed
+    with print_error) come through, as JSON events or as plain text on
+    stderr. Returns (previous mode, previous console) for restore_output_mode.
+    """
+    global _mode
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode: {mode}")
+
+    previous_mode = _mode
+    previous_console = use_console(None if mode == "rich" else _PlainConsole(mode))
+    _mode = mode
+
+    from .tracing import add_trace_sink, remove_trace_sink
+    if mode == "json":
+        add_trace_sink(_emit_trace_event)
+    else:
+        remove_trace_sink(_emit_trace_event)
+    return previous_mode, previous_console
+
+
+def restore_output_mode(previous):
+    """Undo set_output_mode with the value it returned"""
+    global _mode
+    previous_mode, previous_console = previous
+    set_output_mode(previous_mode)
+    use_console(previous_console)
+
+
+def emit(event):
+    """Write one newline-delimited JSON event to stdout (json mode only)"""
+    if _mode == "json":
+        sys.stdout.write(json.dumps(event, default=str) + "\n")
+        sys.stdout.flush()
+
+
+def print_error(message, markup=True):
+    """Print an error: in red with rich, and the only output of the json and quiet modes
+
+    With markup=False the message is printed verbatim (e.g. a tool's output).
+    """
+    target = get_console()
+    if isinstance(target, _PlainConsole):
+        target.error(_MARKUP_TAG.sub("", message) if markup else message)
+    elif markup:
+        target.print(f"[red]{message}[/red]")
+    else:
+        target.print(message, markup=False, highlight=False, style="red")
+
+
+def _emit_trace_event(event):
+    # File writes are reported through the files of their enclosing step
+    if event["cat"] == "write":
+        return
+    args = event["args"]
+    step = {
+        "event": "step",
+        "name": event["name"],
+        "category": event["cat"],
+        "status": args.get("status"),
+        "duration_s": args.get("wall_s"),
+        "files": args.get("files", []),
+    }
+    if args.get("errors"):
+        step["errors"] = args["errors"]
+    emit(step)
+
+
+class _PlainConsole:
+    """Console stand-in for the json and quiet modes
+
+    Understands the calls svelte-pi makes (print and status) without
+    rendering anything through rich.
+    """
+
+    is_terminal = False
+
+    def __init__(self, mode):
+        self.mode = mode
+
+    def print(self, *objects, **kwargs):
+        # Progress and tables; errors arrive through print_error instead
+        pass
+
+    def error(self, message):
+        from .tracing import record_error
+
+        if self.mode == "quiet":
+            sys.stderr.write(message + "\n")
+        elif not record_error(message):
+            # Not inside a step: report the error on its own
+            emit({"event": "error", "message": message})
+
+    def status(self, *args, **kwargs):
+        return _NoStatus()
+
+
+class _NoStatus:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+class _LazyConsole:
+    """Module-level stand-in for the shared Console
+
+    Importing a svelte_pi module no longer pulls in rich; the real Console
+    is built the first time anything is printed.
+    """
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
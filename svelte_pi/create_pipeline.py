@@ -0,0 +1,353 @@
+# create_pipeline.py
+import shutil
+from pathlib import Path
+
+from .console import console, print_error
+from .scheduler import Step, run_steps, resolve_dependencies, topological_order
+from .package_store import link_node_modules
+from .project_setup import (create_sveltekit_project, add_prettier, install_sass, install_workspace,
+                            skeleton_profile)
+from .skeleton_cache import (CAPTURED_SOURCES, capture_sources, lookup_skeleton, store_skeleton,
+                             materialize_skeleton)
+from .file_operations import (RESET_CSS_HREF, RESET_CSS_IMPORT, create_reset_css, update_app_html,
+                              inline_reset_css, import_reset_css, create_tokens_scss)
+from .journal import StepJournal
+from .seeds import lookup_seed, apply_seed, store_seed
+from .perf_preset import PERF_PRESET_VERSION, apply_perf_preset
+from .bundles import extract_bundle
+from .workspace import add_workspace_members, declare_sass
+
+DEFAULT_JOBS = 4
+
+
+def build_create_steps(project_name, parent_dir, use_reset_css, use_cache=True, use_store=True, journal=None,
+                       use_seed=True, reset_mode="link", perf=False, bundle=None, workspace=None,
+                       join_workspace=True, touch_cache=True):
+    """Describe the create flow as a DAG of steps
+
+    sv create runs without installing and prettier is added with
+    --no-install, so the sass-embedded install is the single
+    resolve-and-link pass for all of them. reset.css, the app.html patch
+    and the design-tokens partial only need the scaffolded sources and
+    overlap with the install; with the cache on, src/ is first copied
+    aside for the skeleton snapshot.
+    With use_store the installed files are swapped for hardlinks into the
+    shared package store once the skeleton snapshot is taken; this saves
+    disk only and does not shorten the install. With
+    use_seed the install starts from the profile's lockfile seed, and the
+    first unseeded install becomes the seed.
+
+    reset_mode picks how the reset reaches the page (see RESET_MODES):
+    linked from app.html, minified and inlined in app.html, or imported
+    by the root layout. With perf the build-tuning preset is applied once
+    the install has finished writing package.json.
+
+    A bundle (see bundles.py) replaces sv create and the skeleton cache;
+    only the post steps its manifest lists run after extraction, and its
+    installs start without a seed.
+
+    With a workspace root the project becomes a member of that yarn
+    workspace: sass-embedded is only declared, and with join_workspace the
+    project is registered in the root package.json and installed by one
+    hoisted install from the root (see workspace_steps). Without
+    join_workspace the caller does both, once for many members. The
+    skeleton cache, package store and seeds all hold per-project
+    node_modules, so they are off in this mode.
+
+    When resuming from a journal, the project keeps to the path its first
+    run took (cached skeleton or sv create) whatever the cache holds now.
+    With touch_cache=False a skeleton hit is not recorded as a use, so
+    planning leaves the cache's pruning order alone.
+    """
+    project_path = Path(parent_dir) / project_name
+    profile = skeleton_profile()
+    steps = []
+
+    if bundle is not None:
+        use_cache = use_seed = False
+    if workspace is not None:
+        use_cache = use_seed = use_store = False
+
+    cached_tree = lookup_skeleton(profile, touch=touch_cache) if use_cache else None
+    if journal is not None and (journal.completed("sv_create") or journal.completed("materialize")):
+        from_cache = journal.completed("materialize")
+    else:
+        from_cache = cached_tree is not None
+
+    if bundle is not None:
+        # Whatever the bundle does not leave to a post step, it ships itself
+        provided = ("project_dir", "package_json", "app_html")
+        if not bundle.needs("add_prettier"):
+            provided += ("prettier_config",)
+        if not bundle.needs("install_sass"):
+            provided += ("node_modules",)
+        steps.append(Step(
+            "bundle",
+            lambda: extract_bundle(bundle, project_path, project_name),
+            outputs=provided,
+            params={"name": project_name, "bundle": str(bundle.path), "version": bundle.version},
+        ))
+    elif from_cache:
+        steps.append(Step(
+            "materialize",
+            lambda: materialize_skeleton(cached_tree, project_path, project_name),
+            outputs=("project_dir", "package_json", "app_html", "prettier_config", "node_modules"),
+            params={"name": project_name, "profile": profile},
+        ))
+    else:
+        steps.append(Step(
+            "sv_create",
+            lambda: create_sveltekit_project(project_name, parent_dir, install=False),
+            outputs=("project_dir", "package_json", "app_html"),
+            params={"name": project_name, "profile": profile},
+        ))
+
+    if not from_cache and (bundle is None or bundle.needs("add_prettier")):
+        steps.append(Step(
+            "add_prettier",
+            lambda: add_prettier(project_path),
+            inputs=("package_json",),
+            outputs=("prettier_config",),
+            params={"profile": profile},
+        ))
+    # What the perf preset waits for: the last step writing package.json
+    dependencies_ready = "node_modules"
+    link_store = False
+    if workspace is not None:
+        steps.append(Step(
+            "declare_sass",
+            lambda: declare_sass(project_path),
+            inputs=("package_json", "prettier_config"),
+            outputs=("dependencies",),
+        ))
+        dependencies_ready = "dependencies"
+        if join_workspace:
+            steps += workspace_steps(workspace, [project_path], inputs=("dependencies",))
+    elif not from_cache and (bundle is None or bundle.needs("install_sass")):
+        steps.append(Step(
+            "install",
+            lambda: _install(project_path, profile, use_seed),
+            inputs=("package_json", "prettier_config"),
+            outputs=("node_modules",),
+            params={"profile": profile},
+        ))
+        link_store = use_store
+
+    # A fresh skeleton must hold the sources as sv create left them: they are
+    # copied aside before reset.css and the tokens touch src/, so those steps
+    # overlap the install; the rest of the tree is only edited after the snapshot
+    reset_inputs = snapshot_inputs = ()
+    if use_cache and not from_cache:
+        steps.append(Step(
+            "capture_src",
+            lambda: capture_sources(project_path),
+            inputs=("project_dir", "app_html"),
+            outputs=("captured_src",),
+        ))
+        steps.append(Step(
+            "snapshot",
+            lambda: _snapshot(project_path, profile),
+            inputs=("node_modules", "prettier_config", "captured_src"),
+            outputs=("skeleton",),
+            params={"profile": profile},
+        ))
+        reset_inputs = ("captured_src",)
+        snapshot_inputs = ("skeleton",)
+
+    # Deduplication only saves disk, so it runs last and delays nothing
+    if link_store:
+        steps.append(Step(
+            "link_store",
+            lambda: _link_store(project_path),
+            inputs=("node_modules",) + snapshot_inputs,
+            outputs=("shared_node_modules",),
+        ))
+
+    if bundle is not None and not bundle.needs("reset"):
+        use_reset_css = False
+
+    if bundle is None or bundle.needs("tokens"):
+        # reset_css also writes into src/lib/styles; one writer at a time
+        shares_styles_dir = use_reset_css and reset_mode != "inline"
+        steps.append(Step(
+            "tokens",
+            lambda: create_tokens_scss(project_path),
+            inputs=("project_dir",) + reset_inputs + (("reset_css",) if shares_styles_dir else ()),
+            outputs=("tokens_scss",),
+        ))
+
+    if perf:
+        steps.append(Step(
+            "perf",
+            lambda: apply_perf_preset(project_path),
+            inputs=(dependencies_ready,) + snapshot_inputs,
+            outputs=("perf_preset",),
+            params={"version": PERF_PRESET_VERSION},
+        ))
+
+    if use_reset_css and reset_mode == "inline":
+        steps.append(Step(
+            "app_html",
+            lambda: inline_reset_css(project_path),
+            inputs=("app_html",) + reset_inputs,
+            outputs=("app_html_style",),
+            params={"mode": reset_mode},
+        ))
+    elif use_reset_css:
+        steps.append(Step(
+            "reset_css",
+            lambda: create_reset_css(project_path),
+            inputs=("project_dir",) + reset_inputs,
+            outputs=("reset_css",),
+        ))
+        if reset_mode == "layout":
+            steps.append(Step(
+                "layout",
+                lambda: import_reset_css(project_path),
+                inputs=("project_dir",) + reset_inputs,
+                outputs=("layout_import",),
+                params={"mode": reset_mode, "import": RESET_CSS_IMPORT},
+            ))
+        else:
+            steps.append(Step(
+                "app_html",
+                lambda: update_app_html(project_path),
+                inputs=("app_html",) + reset_inputs,
+                outputs=("app_html_link",),
+                params={"href": RESET_CSS_HREF},
+            ))
+
+    return steps
+
+
+def workspace_steps(root, project_paths, inputs=()):
+    """Register members in a yarn workspace, then install it once from the root"""
+    root = str(Path(root).expanduser())
+    members = [str(path) for path in project_paths]
+    return [
+        Step(
+            "workspace",
+            lambda: add_workspace_members(root, members),
+            inputs=inputs,
+            outputs=("workspace_member",),
+            params={"root": root, "members": members},
+        ),
+        Step(
+            "workspace_install",
+            lambda: install_workspace(root),
+            inputs=inputs + ("workspace_member",),
+            outputs=("node_modules",),
+            params={"root": root},
+        ),
+    ]
+
+
+def run_create_pipeline(project_name, parent_dir, use_reset_css, use_cache=True, jobs=None, use_store=True,
+                        resume=False, use_seed=True, reset_mode="link", perf=False, bundle=None, workspace=None,
+                        join_workspace=True):
+    """Scaffold a project; returns its path, or None if any step failed
+
+    Every completed step is recorded in the project's step journal. With
+    resume=True the journal of an earlier, failed run is read back and the
+    steps it already completed are skipped.
+    """
+    project_path = Path(parent_dir) / project_name
+    if resume:
+        journal = StepJournal.load(project_path)
+        if project_path.exists() and not journal.exists():
+            print_error(f"Error: {project_path} exists but has no step journal to resume from")
+            return None
+    else:
+        journal = StepJournal(project_path)
+
+    steps = build_create_steps(project_name, parent_dir, use_reset_css, use_cache, use_store, journal=journal,
+                               use_seed=use_seed, reset_mode=reset_mode, perf=perf,
+                               bundle=bundle, workspace=workspace, join_workspace=join_workspace)
+    if not run_steps(steps, jobs=jobs or DEFAULT_JOBS, journal=journal):
+        if journal.exists():
+            console.print(f"[yellow]Run the same command with --resume to continue from the failed step[/yellow]")
+        return None
+    return project_path
+
+
+def plan_create_pipeline(project_name, parent_dir, use_reset_css, use_cache=True, use_store=True, resume=False,
+                         use_seed=True, reset_mode="link", perf=False, bundle=None, workspace=None):
+    """Describe the steps a create would run, with durations predicted from history
+
+    Returns (rows, estimate). Each row has the step name, the steps it waits
+    for, whether the journal already holds it, and its history prediction
+    (None without history). The estimate is the critical path through the
+    step graph, using medians and p95s respectively.
+    """
+    from .history import predict
+
+    journal = StepJournal.load(Path(parent_dir) / project_name) if resume else None
+    steps = build_create_steps(project_name, parent_dir, use_reset_css, use_cache, use_store, journal=journal,
+                               use_seed=use_seed, reset_mode=reset_mode, perf=perf,
+                               bundle=bundle, workspace=workspace, touch_cache=False)
+    dependencies = resolve_dependencies(steps)
+    predictions = predict([step.name for step in steps])
+
+    rows = []
+    finish = {}
+    for step in topological_order(steps):
+        done = journal is not None and journal.completed(step.name)
+        prediction = None if done else predictions.get(step.name)
+        # When the slowest dependency finishes, by median and by p95
+        start = [max((finish[name][index] for name in dependencies[step.name]), default=0) for index in (0, 1)]
+        cost = (prediction["median"], prediction["p95"]) if prediction else (0, 0)
+        finish[step.name] = (start[0] + cost[0], start[1] + cost[1])
+        rows.append({"step": step.name, "needs": sorted(dependencies[step.name]), "done": done,
+                     "prediction": prediction})
+
+    estimate = {
+        "median": max((times[0] for times in finish.values()), default=0),
+        "p95": max((times[1] for times in finish.values()), default=0),
+        "unknown": [row["step"] for row in rows if not row["done"] and row["prediction"] is None],
+    }
+    return rows, estimate
+
+
+def _install(project_path, profile, use_seed):
+    """Install from the lockfile seed when there is one, else resolve and save a seed"""
+    seed_dir = lookup_seed(profile) if use_seed else None
+    if seed_dir and apply_seed(seed_dir, project_path):
+        if install_sass(project_path, seeded=True):
+            return True
+        # A stale seed must not fail the create; resolve as if there were none
+        console.print(f"[yellow]Seeded install failed; resolving dependencies from scratch "
+                      f"(run `svelte-pi seeds refresh`)[/yellow]")
+        (project_path / "yarn.lock").unlink(missing_ok=True)
+
+    if not install_sass(project_path):
+        return False
+    if use_seed and seed_dir is None:
+        store_seed(project_path, profile)
+    return True
+
+
+def _snapshot(project_path, profile):
+    """Cache the skeleton from the captured sources, then drop the capture (best effort)"""
+    sources = Path(project_path) / CAPTURED_SOURCES
+    store_skeleton(project_path, profile, sources=sources)
+    shutil.rmtree(sources, ignore_errors=True)
+    return True
+
+
+def _link_store(project_path):
+    """Deduplicate node_modules against the package store (best effort)
+
+    This runs after yarn's full install and saves disk only; the install
+    itself is shortened by lockfile seeds and the skeleton cache.
+    """
+    console.print(f"[cyan]Linking node_modules into the package store...[/cyan]")
+    try:
+        stats = link_node_modules(project_path)
+    except OSError as e:
+        console.print(f"[yellow]Could not link node_modules into the package store: {str(e)}[/yellow]")
+        return True
+
+    if stats is not None:
+        console.print(f"[green]✓[/green] {stats['linked']} of {stats['files']} package files shared "
+                      f"({stats['bytes_saved'] / 1024 / 1024:.1f} MB saved)")
+    return True
@@ -0,0 +1,48 @@
+# css.py
+import re
+
+# Strings are matched first so that comment-like or whitespace-heavy text
+# inside them is never touched
+_STRING_OR_COMMENT = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S)
+_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""", re.S)
+_AROUND_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_AFTER_COLON = re.compile(r":\s+")
+_LAST_SEMICOLON = re.compile(r";+}")
+
+_SCSS_LINE_COMMENT = re.compile(r"(?<![:\w])//[^\n]*")
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+# property: value; (or the last one in a block, before `}`); a `{` in
+# between means it was a selector such as `a:hover {`
+_DECLARATION = re.compile(r"(?<![\w$@#-])(-{0,2}[A-Za-z][\w-]*)\s*:\s*([^;{}]+?)\s*(?:;|(?=\}))")
+
+
+def minify_css(text):
+    """Strip comments and insignificant whitespace from a stylesheet
+
+    Whitespace goes around `{ } ; , >` and after `:`, never before it
+    (`a :hover` and `a:hover` select different elements). The last
+    semicolon of each block is dropped. Strings are kept as written.
+    """
+    text = _STRING_OR_COMMENT.sub(lambda match: match.group(1) or " ", text)
+
+    parts = _STRING.split(text)
+    for index in range(0, len(parts), 2):
+        part = " ".join(parts[index].split())
+        part = _AROUND_PUNCTUATION.sub(r"\1", part)
+        parts[index] = _AFTER_COLON.sub(":", part)
+    return _LAST_SEMICOLON.sub("}", "".join(parts)).strip()
+
+
+def scss_declarations(text):
+    """Return the `property:value` declarations of a stylesheet, normalized, in order
+
+    Sass variables, map entries and at-rule conditions are skipped.
+    """
+    text = _SCSS_LINE_COMMENT.sub("", _BLOCK_COMMENT.sub(" ", text))
+    declarations = []
+    for match in _DECLARATION.finditer(text):
+        value = " ".join(match.group(2).split())
+        if value.count("(") != value.count(")"):
+            continue
+        declarations.append(f"{match.group(1).lower()}:{value}")
+    return declarations
@@ -0,0 +1,182 @@
+# daemon.py
+import io
+import json
+import os
+import socketserver
+import threading
+import time
+
+from .client import DAEMON_COMMANDS, needs_terminal, socket_path, send_request
+from .console import console, print_error, use_console
+
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+
+class Daemon:
+    """Run svelte-pi commands for `svelte-pi-client` over a Unix socket
+
+    Requests and replies are single JSON lines. The interpreter, click,
+    rich, the command modules, compiled templates and the project-root
+    memo stay loaded between requests, so a component request costs the
+    file work plus a few stat calls. Requests run one at a time because
+    each one changes to the client's working directory.
+    """
+
+    def __init__(self, path=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.path = str(path or socket_path())
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self.started = time.time()
+        self.last_request = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def serve(self):
+        """Listen until shut down, idle for idle_timeout seconds, or interrupted"""
+        self._server = _bind(self.path)
+        self._server.daemon_state = self
+        _warm_up()
+
+        if self.idle_timeout:
+            threading.Thread(target=self._watch_idle, daemon=True).start()
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def shutdown(self):
+        if self._server is not None:
+            # shutdown() blocks until serve_forever returns, so not from a handler thread
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def handle(self, request):
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "requests": self.requests,
+                    "uptime": round(time.time() - self.started, 1)}
+        if command == "shutdown":
+            self.shutdown()
+            return {"ok": True}
+        if command == "run":
+            return self.run(request.get("argv") or [], request.get("cwd") or os.getcwd(),
+                            request.get("width") or 80, bool(request.get("color")))
+        return {"error": f"Unknown request: {command!r}"}
+
+    def run(self, argv, cwd, width, color):
+        """Run a command as if `svelte-pi ARGV` had been started in cwd"""
+        if not argv or argv[0] not in DAEMON_COMMANDS:
+            return {"fallback": f"{(argv or [''])[0]!r} is not served by the daemon"}
+        if needs_terminal(argv):
+            return {"fallback": "command needs a terminal"}
+
+        from rich.console import Console
+        from .templates import reset_registries
+        from .tracing import reset_trace
+
+        buffer = io.StringIO()
+        captured = Console(file=buffer, force_terminal=color, no_color=not color, width=width)
+
+        with self._lock:
+            self.requests += 1
+            self.last_request = time.monotonic()
+            started = time.perf_counter()
+            previous_console = use_console(captured)
+            previous_cwd = os.getcwd()
+            try:
+                os.chdir(cwd)
+                # Template directories may have changed since the last request;
+                # unchanged files are not re-read
+                reset_registries(keep_compiled=True)
+                reset_trace()
+                exit_code = _invoke(argv)
+            except OSError as e:
+                captured.print(f"[red]Error: {str(e)}[/red]")
+                exit_code = 1
+            finally:
+                os.chdir(previous_cwd)
+                use_console(previous_console)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        return {"exit_code": exit_code, "output": buffer.getvalue(), "elapsed_ms": round(elapsed_ms, 3)}
+
+    def _watch_idle(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 5))
+            if time.monotonic() - self.last_request > self.idle_timeout:
+                self.shutdown()
+                return
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                reply = self.server.daemon_state.handle(request)
+            except (ValueError, AttributeError, TypeError):
+                reply = {"error": "Invalid request"}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def daemon_status(path=None):
+    """Return the ping reply of a running daemon, or None"""
+    return send_request({"command": "ping"}, path=path, timeout=2)
+
+
+def stop_daemon(path=None):
+    """Ask a running daemon to exit; returns True if one answered"""
+    return send_request({"command": "shutdown"}, path=path, timeout=2) is not None
+
+
+def _bind(path):
+    if os.path.exists(path):
+        if daemon_status(path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        # Left behind by a daemon that did not exit cleanly
+        os.unlink(path)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    server = _Server(path, _Handler)
+    # Only this user may ask the daemon to write files
+    os.chmod(path, 0o600)
+    return server
+
+
+def _warm_up():
+    """Import and build everything a request would otherwise pay for"""
+    from . import main, file_operations, patching  # noqa: F401
+    from .console import get_console
+    from .templates import builtin_registry
+    from .file_templates import BUILTIN_TEMPLATES
+
+    get_console()
+    for name in BUILTIN_TEMPLATES:
+        builtin_registry().get(name)
+
+
+def _invoke(argv):
+    import click
+    from .main import cli
+
+    try:
+        result = cli.main(args=list(argv), prog_name="svelte-pi", standalone_mode=False)
+        return result if isinstance(result, int) else 0
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        console.print(f"Error: {e.format_message()}", markup=False, highlight=False)
+        return e.exit_code
+    except click.exceptions.Abort:
+        return 1
+    except Exception as e:
+        print_error(f"Error: {str(e)}")
+        return 1
@@ -1,9 +1,22 @@
 # file_operations.py
 from pathlib import Path
-from rich.console import Console
-from .file_templates import RESET_CSS_CONTENT, get_svelte_component_template, get_scss_module_template
+from .console import console, print_error
+from .tracing import trace_step
+from .write_plan import WritePlan, WritePlanError, CREATE, UPDATE, UNCHANGED
+from .project_root import find_project_root, is_sveltekit_directory
+from .templates import get_registry
+from .patching import apply_patches, stylesheet_link, inline_style, svelte_import
+from .css import minify_css
+from .component_index import COMPONENTS_DIR, load_index
 
-console = Console()
+RESET_CSS_HREF = "/src/lib/styles/reset.css"
+RESET_CSS_IMPORT = "$lib/styles/reset.css"
+RESET_STYLE_ID = "reset-css"
+TOKENS_SCSS = Path("src") / "lib" / "styles" / "_tokens.scss"
+
+# How the reset reaches the page: a <link> in app.html, a minified <style>
+# inlined in app.html, or an import in the root layout that Vite bundles
+RESET_MODES = ("link", "inline", "layout")
 
 
 def create_reset_css(project_path):
@@ -11,20 +24,19 @@ def create_reset_css(project_path):
     console.print(f"[cyan]Creating reset.css...[/cyan]")
 
     try:
-        # Create styles directory
-        styles_dir = project_path / "src" / "lib" / "styles"
-        styles_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write reset.css file
-        reset_css_path = styles_dir / "reset.css"
-        reset_css_path.write_text(RESET_CSS_CONTENT)
-
-        console.print(f"[green]✓[/green] reset.css created successfully")
+        plan = WritePlan(project_path)
+        plan.add(project_path / "src" / "lib" / "styles" / "reset.css", get_registry(project_path).render("reset.css"))
+        (planned,) = plan.apply()
+
+        if planned.action == UNCHANGED:
+            console.print(f"[green]✓[/green] reset.css already up to date")
+        else:
+            console.print(f"[green]✓[/green] reset.css created successfully")
         return True
 
     except Exception as e:
-        console.print(f"[red]Error creating reset.css:[/red]")
-        console.print(f"[red]{str(e)}[/red]")
+        print_error(f"Error creating reset.css:")
+        print_error(f"{str(e)}")
         return False
 
 
@@ -33,98 +45,326 @@ def update_app_html(project_path):
     console.print(f"[cyan]Updating app.html to include reset.css...[/cyan]")
 
     try:
-        app_html_path = project_path / "src" / "app.html"
+        report = apply_patches(project_path / "src" / "app.html", [stylesheet_link(RESET_CSS_HREF)])
+
+        if not report.ok:
+            print_error(f"Error updating app.html:")
+            print_error(f"No <meta name=\"viewport\"> or %sveltekit.head% to place the link next to")
+            return False
+        if report.present:
+            console.print(f"[green]✓[/green] app.html already links reset.css")
+        else:
+            console.print(f"[green]✓[/green] app.html updated successfully")
+        return True
 
-        # Read current content
-        current_content = app_html_path.read_text()
+    except Exception as e:
+        print_error(f"Error updating app.html:")
+        print_error(f"{str(e)}")
+        return False
 
-        # Add reset.css link after the viewport meta tag
-        updated_content = current_content.replace(
-            '<meta name="viewport" content="width=device-width, initial-scale=1" />',
-            '<meta name="viewport" content="width=device-width, initial-scale=1" />\n\t<link rel="stylesheet" href="/src/lib/styles/reset.css" />'
-        )
 
-        # Write updated content
-        app_html_path.write_text(updated_content)
+def create_tokens_scss(project_path):
+    """Create the design-tokens partial that component modules @use"""
+    console.print(f"[cyan]Creating _tokens.scss...[/cyan]")
 
-        console.print(f"[green]✓[/green] app.html updated successfully")
+    try:
+        plan = WritePlan(project_path)
+        plan.add(project_path / TOKENS_SCSS, get_registry(project_path).render("_tokens.scss"))
+        (planned,) = plan.apply()
+
+        if planned.action == UNCHANGED:
+            console.print(f"[green]✓[/green] _tokens.scss already up to date")
+        else:
+            console.print(f"[green]✓[/green] _tokens.scss created successfully")
         return True
 
     except Exception as e:
-        console.print(f"[red]Error updating app.html:[/red]")
-        console.print(f"[red]{str(e)}[/red]")
+        print_error(f"Error creating _tokens.scss:")
+        print_error(f"{str(e)}")
         return False
 
 
-def create_component(component_path):
-    """Create a new component with .svelte and .module.scss files"""
-    try:
-        # Get current working directory
-        current_dir = Path.cwd()
-
-        # Check if we're in a SvelteKit project
-        if not is_sveltekit_project(current_dir):
-            console.print(f"[red]Error: Not in a SvelteKit project directory[/red]")
-            console.print(f"[yellow]Make sure you're in a directory that contains:[/yellow]")
-            console.print(f"[yellow]  - package.json with '@sveltejs/kit' dependency[/yellow]")
-            console.print(f"[yellow]  - src/ directory[/yellow]")
-            return False
-
-        # Extract component name from path (last part)
-        component_name = component_path.split('/')[-1]
-        component_name_capitalized = component_name.capitalize()
+def inline_reset_css(project_path):
+    """Inline the minified reset in app.html as critical CSS"""
+    console.print(f"[cyan]Inlining reset.css in app.html...[/cyan]")
 
-        # Build the full component directory path
-        full_component_path = current_dir / "src" / "lib" / "components" / component_path
+    try:
+        css = minify_css(get_registry(project_path).render("reset.css"))
+        report = apply_patches(project_path / "src" / "app.html", [inline_style(RESET_STYLE_ID, css)])
 
-        # Create the component directory
-        full_component_path.mkdir(parents=True, exist_ok=True)
+        if not report.ok:
+            print_error(f"Error updating app.html:")
+            print_error(f"No <meta name=\"viewport\"> or %sveltekit.head% to place the style next to")
+            return False
+        if report.present:
+            console.print(f"[green]✓[/green] app.html already inlines reset.css")
+        else:
+            console.print(f"[green]✓[/green] reset.css inlined in app.html ({len(css)} bytes)")
+        return True
 
-        # Create the .svelte file
-        svelte_file = full_component_path / f"{component_name_capitalized}.svelte"
-        svelte_content = get_svelte_component_template(component_name_capitalized)
-        svelte_file.write_text(svelte_content)
+    except Exception as e:
+        print_error(f"Error updating app.html:")
+        print_error(f"{str(e)}")
+        return False
 
-        # Create the .module.scss file
-        scss_file = full_component_path / f"{component_name_capitalized}.module.scss"
-        scss_content = get_scss_module_template()
-        scss_file.write_text(scss_content)
 
-        console.print(f"[dim]Created: {svelte_file.relative_to(current_dir)}[/dim]")
-        console.print(f"[dim]Created: {scss_file.relative_to(current_dir)}[/dim]")
+def import_reset_css(project_path):
+    """Import reset.css from the root layout so Vite bundles it"""
+    console.print(f"[cyan]Importing reset.css in the root layout...[/cyan]")
+    layout = project_path / "src" / "routes" / "+layout.svelte"
 
+    try:
+        if not layout.exists():
+            plan = WritePlan(project_path)
+            plan.add(layout, get_registry(project_path).render("layout.svelte", reset_import=RESET_CSS_IMPORT))
+            plan.apply()
+            console.print(f"[green]✓[/green] +layout.svelte created successfully")
+            return True
+
+        report = apply_patches(layout, [svelte_import(RESET_CSS_IMPORT)])
+        if report.present:
+            console.print(f"[green]✓[/green] +layout.svelte already imports reset.css")
+        else:
+            console.print(f"[green]✓[/green] +layout.svelte updated successfully")
         return True
 
     except Exception as e:
-        console.print(f"[red]Error creating component:[/red]")
-        console.print(f"[red]{str(e)}[/red]")
+        print_error(f"Error updating +layout.svelte:")
+        print_error(f"{str(e)}")
         return False
 
 
-def is_sveltekit_project(directory):
-    """Check if the current directory is a SvelteKit project"""
+def create_component(component_path, dry_run=False, force=False):
+    """Create a new component with .svelte and .module.scss files"""
+    with trace_step(f"component {component_path}", category="component") as details:
+        created = _create_component(component_path, dry_run, force)
+        if not created:
+            details["status"] = "failed"
+        return created
+
+
+def _create_component(component_path, dry_run=False, force=False):
     try:
-        # Check for package.json
-        package_json = directory / "package.json"
-        if not package_json.exists():
+        # Find the project root from the working directory or any parent
+        current_dir = find_project_root(Path.cwd())
+        if current_dir is None:
+            _print_not_in_project()
             return False
 
-        # Check if package.json contains SvelteKit dependency
-        import json
-        with open(package_json, 'r') as f:
-            package_data = json.load(f)
+        files = _component_files(current_dir, component_path)
+        svelte_file = files[0][0]
+
+        # Refuse to reuse a component name that lives at another path
+        index = load_index(current_dir)
+        conflicts = [] if force else index.conflicts(svelte_file.stem, index.relative(svelte_file))
+        if conflicts:
+            print_error(f"Error: A component named {svelte_file.stem} already exists:")
+            for path in conflicts:
+                print_error(f"  {COMPONENTS_DIR.as_posix()}/{path}")
+            console.print(f"[yellow]Use --force to create it anyway[/yellow]")
+            return False
+
+        plan = WritePlan(current_dir)
+        for file_path, content in files + _missing_tokens_file(current_dir):
+            plan.add(file_path, content)
+
+        if dry_run:
+            _print_plan(plan, plan.diff())
+            return True
 
-        # Check dependencies and devDependencies for SvelteKit
-        dependencies = package_data.get('dependencies', {})
-        dev_dependencies = package_data.get('devDependencies', {})
+        labels = {CREATE: "Created", UPDATE: "Updated", UNCHANGED: "Unchanged"}
+        for entry in plan.apply():
+            console.print(f"[dim]{labels[entry.action]}: {plan.relative(entry.path)}[/dim]")
 
-        has_sveltekit = '@sveltejs/kit' in dependencies or '@sveltejs/kit' in dev_dependencies
+        index.record([svelte_file])
+        index.save()
+        return True
 
-        # Check for src directory
-        src_dir = directory / "src"
-        has_src = src_dir.exists() and src_dir.is_dir()
+    except Exception as e:
+        print_error(f"Error creating component:")
+        print_error(f"{str(e)}")
+        return False
 
-        return has_sveltekit and has_src
 
-    except Exception:
+def create_components(component_paths, max_workers=8, dry_run=False, force=False):
+    """Create many components with one project check and one write plan
+
+    Returns a list of (component_path, written_files, error) tuples in the
+    order the paths were given, or None if not inside a SvelteKit project.
+    Files whose content is already on disk are not written again; if any
+    file cannot be written, no file is and every component reports the error.
+    Unless force is set, a component whose name is already used at another
+    path (in the project or earlier in the batch) is skipped with an error.
+    """
+    current_dir = find_project_root(Path.cwd())
+    if current_dir is None:
+        _print_not_in_project()
+        return None
+
+    # Drop duplicates and surrounding slashes while keeping the given order
+    unique_paths = [path for path in dict.fromkeys(path.strip().strip('/') for path in component_paths) if path]
+
+    index = load_index(current_dir, max_workers=max_workers)
+    plan = WritePlan(current_dir)
+    owners = {}
+    errors = {}
+    batch_names = {}
+    svelte_files = []
+    for component_path in unique_paths:
+        files = _component_files(current_dir, component_path)
+        svelte_file = files[0][0]
+        if not force:
+            conflicts = index.conflicts(svelte_file.stem, index.relative(svelte_file))
+            earlier = batch_names.get(svelte_file.stem)
+            if conflicts or earlier:
+                errors[component_path] = f"{svelte_file.stem} already exists at {(conflicts or [earlier])[0]}"
+                continue
+            batch_names[svelte_file.stem] = index.relative(svelte_file)
+        svelte_files.append(svelte_file)
+        for file_path, content in files:
+            plan.add(file_path, content)
+            owners[file_path] = component_path
+
+    # Projects created before the tokens partial get it with their first components
+    if svelte_files:
+        for file_path, content in _missing_tokens_file(current_dir):
+            plan.add(file_path, content)
+
+    written = {component_path: [] for component_path in unique_paths}
+    with trace_step("components", category="component", count=len(unique_paths)) as details:
+        try:
+            if dry_run:
+                planned = plan.diff(max_workers)
+                _print_plan(plan, planned)
+            else:
+                planned = plan.apply(max_workers)
+                index.record(svelte_files)
+                index.save()
+            for entry in planned:
+                if entry.action != UNCHANGED and entry.path in owners:
+                    written[owners[entry.path]].append(plan.relative(entry.path))
+        except (OSError, WritePlanError) as e:
+            details["status"] = "failed"
+            errors.update({component_path: str(e) for component_path in owners.values()})
+
+    return [(component_path, written[component_path], errors.get(component_path)) for component_path in unique_paths]
+
+
+def patch_project(patches_by_file, dry_run=False):
+    """Apply patches to files of the current project, one pass per file
+
+    `patches_by_file` maps paths relative to the project root to lists of
+    patches. Prints what was applied, already present or could not be
+    placed (one `patch` event per file with --json), and returns True if
+    every patch is applied or present.
+    """
+    from .console import emit
+
+    project_root = find_project_root(Path.cwd())
+    if project_root is None:
+        _print_not_in_project()
         return False
+
+    ok = True
+    for relative, patches in patches_by_file.items():
+        try:
+            report = apply_patches(project_root / relative, patches, dry_run=dry_run)
+        except Exception as e:
+            print_error(f"✗ {relative}: {str(e)}")
+            emit({"event": "patch", "file": relative, "status": "failed", "error": str(e)})
+            ok = False
+            continue
+
+        emit({"event": "patch", "file": relative, "status": "ok" if report.ok else "failed",
+              "applied": report.applied, "present": report.present, "failed": report.failed, "dry_run": dry_run})
+        console.print(f"[cyan]{relative}[/cyan]")
+        for name in report.applied:
+            console.print(f"  [green]✓[/green] {name}" + (" [dim](dry run)[/dim]" if dry_run else ""))
+        for name in report.present:
+            console.print(f"  [dim]= {name} (already present)[/dim]")
+        for name in report.failed:
+            print_error(f"  ✗ {name} (no anchor found in {relative})")
+        ok = ok and report.ok
+    return ok
+
+
+def load_component_manifest(manifest_path):
+    """Read component paths from a JSON or YAML manifest
+
+    The manifest is either a list of paths or a mapping with a "components"
+    list; each entry is a path string or a mapping with a "path" key.
+    """
+    manifest_path = Path(manifest_path)
+    text = manifest_path.read_text()
+
+    if manifest_path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML manifests need PyYAML: pip install pyyaml")
+        data = yaml.safe_load(text)
+    else:
+        import json
+        data = json.loads(text)
+
+    if isinstance(data, dict):
+        data = data.get("components", [])
+    if not isinstance(data, list):
+        raise ValueError("Manifest must be a list of component paths")
+
+    paths = []
+    for entry in data:
+        if isinstance(entry, dict):
+            entry = entry.get("path")
+        if not isinstance(entry, str) or not entry.strip():
+            raise ValueError(f"Invalid manifest entry: {entry!r}")
+        paths.append(entry)
+    return paths
+
+
+def _print_plan(plan, planned):
+    for line in plan.describe(planned):
+        console.print(line)
+    changed = sum(entry.action != UNCHANGED for entry in planned)
+    console.print(f"[cyan]Dry run:[/cyan] {changed} of {len(planned)} files would be written")
+
+
+def _print_not_in_project():
+    print_error(f"Error: Not in a SvelteKit project directory")
+    console.print(f"[yellow]Make sure you're in (or below) a directory that contains:[/yellow]")
+    console.print(f"[yellow]  - package.json with '@sveltejs/kit' dependency[/yellow]")
+    console.print(f"[yellow]  - src/ directory[/yellow]")
+
+
+def _component_files(project_root, component_path):
+    """Return [(svelte_file, content), (scss_file, content)] for a component path"""
+    # Extract component name from path (last part)
+    component_name = component_path.split('/')[-1]
+    component_name_capitalized = component_name.capitalize()
+
+    # Build the full component directory path
+    full_component_path = project_root / "src" / "lib" / "components" / component_path
+
+    # Templates come from the project, the user config or the built-ins,
+    # compiled once per run however many components are rendered
+    templates = get_registry(project_root)
+    variables = {"name": component_name_capitalized, "path": component_path}
+    return [
+        (full_component_path / f"{component_name_capitalized}.svelte",
+         templates.render("component.svelte", **variables)),
+        (full_component_path / f"{component_name_capitalized}.module.scss",
+         templates.render("component.module.scss", **variables)),
+    ]
+
+
+def _missing_tokens_file(project_root):
+    """[(path, content)] for the tokens partial the module template @uses, or [] if the project has it"""
+    path = project_root / TOKENS_SCSS
+    if path.exists():
+        return []
+    return [(path, get_registry(project_root).render("_tokens.scss"))]
+
+
+def is_sveltekit_project(directory):
+    """Check if the current directory is a SvelteKit project"""
+    return is_sveltekit_directory(directory)
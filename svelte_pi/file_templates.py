@@ -115,22 +115,218 @@ address {
 """
 
 
-def get_svelte_component_template(component_name):
-    """Generate Svelte component template with component name"""
-    return f"""<script lang="ts">
-  import styles from './{component_name}.module.scss';
+SVELTE_COMPONENT_TEMPLATE = """<script lang="ts">
+  import styles from './{{name}}.module.scss';
   // Component logic here
 </script>
 
-<div class={{styles.container}}>
-  <h1>{component_name}</h1>
+<div class={styles.container}>
+  <h1>{{name}}</h1>
 </div>
 """
 
+SCSS_MODULE_TEMPLATE = """@use '$lib/styles/tokens' as tokens;
 
-def get_scss_module_template():
-    """Generate SCSS module template"""
-    return """.container {
-  // Styles for the component
+.container {
+  // Styles for the component, e.g. padding: tokens.$space-4;
+}
+"""
+
+# Shared design tokens, @use'd by every component module. Sass variables,
+# maps and mixins produce no CSS until they are referenced, so the partial
+# costs nothing per component; it must never contain rule sets.
+TOKENS_SCSS_CONTENT = """// src/lib/styles/_tokens.scss - design tokens
+// Variables and mixins only: a rule set here would be copied into every component.
+
+$space-1: 0.25rem;
+$space-2: 0.5rem;
+$space-3: 0.75rem;
+$space-4: 1rem;
+$space-6: 1.5rem;
+$space-8: 2rem;
+
+$radius-sm: 0.25rem;
+$radius-md: 0.5rem;
+$radius-full: 9999px;
+
+$font-size-sm: 0.875rem;
+$font-size-md: 1rem;
+$font-size-lg: 1.25rem;
+$font-weight-bold: 600;
+
+$color-text: #1a1a1a;
+$color-muted: #6b7280;
+$color-surface: #ffffff;
+$color-border: #e5e7eb;
+$color-accent: #ff3e00;
+
+$breakpoint-md: 768px;
+$breakpoint-lg: 1024px;
+
+@mixin from($breakpoint) {
+  @media (min-width: $breakpoint) {
+    @content;
+  }
+}
+
+@mixin stack($gap: $space-4) {
+  display: flex;
+  flex-direction: column;
+  gap: $gap;
+}
+
+@mixin cluster($gap: $space-2) {
+  display: flex;
+  flex-wrap: wrap;
+  align-items: center;
+  gap: $gap;
 }
 """
+
+# Root layout for projects that import reset.css through Vite (--reset-mode layout)
+LAYOUT_TEMPLATE = """<script lang="ts">
+	import '{{ reset_import }}';
+
+	let { children } = $props();
+</script>
+
+{@render children()}
+"""
+
+# Build tuning added by `create --perf`; vite.config.ts imports it as a plugin
+VITE_PERF_TEMPLATE = """// vite.perf.ts - build tuning added by svelte-pi create --perf
+import { readdir, readFile, writeFile } from 'node:fs/promises';
+import { join } from 'node:path';
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib';
+import type { Plugin } from 'vite';
+
+// Assets below this size are inlined as data URLs instead of costing a request
+const ASSETS_INLINE_LIMIT = 8192;
+
+// Precompress text assets at least this large; smaller ones gain nothing
+const PRECOMPRESS_MIN_SIZE = 1024;
+const PRECOMPRESS_EXTENSIONS = /\\.(js|mjs|css|html|svg|json|txt|xml|wasm)$/;
+
+// Packages kept in their own long-lived chunks: they change far less often
+// than app code, so browsers keep them cached across deploys
+const CHUNK_GROUPS: Record<string, string[]> = {
+	svelte: ['svelte', '@sveltejs/kit', 'devalue', 'esm-env']
+};
+
+function packageName(id: string) {
+	// The last node_modules in the path, so pnpm's nested layout resolves too
+	const match = id.match(/.*[\\\\/]node_modules[\\\\/]((?:@[^\\\\/]+[\\\\/])?[^\\\\/]+)/);
+	return match?.[1].replace('\\\\', '/');
+}
+
+export function manualChunks(id: string) {
+	const name = packageName(id);
+	if (!name) return undefined;
+	for (const [chunk, packages] of Object.entries(CHUNK_GROUPS)) {
+		if (packages.includes(name)) return chunk;
+	}
+	return undefined;
+}
+
+async function* files(dir: string): AsyncGenerator<string> {
+	for (const entry of await readdir(dir, { withFileTypes: true })) {
+		const path = join(dir, entry.name);
+		if (entry.isDirectory()) yield* files(path);
+		else yield path;
+	}
+}
+
+/** Inline small assets, split long-lived chunks and write .br/.gz next to client assets */
+export function perf(): Plugin {
+	let ssr = false;
+
+	return {
+		name: 'svelte-pi-perf',
+		apply: 'build',
+		config: () => ({
+			build: {
+				assetsInlineLimit: ASSETS_INLINE_LIMIT,
+				rollupOptions: { output: { manualChunks } }
+			}
+		}),
+		configResolved(config) {
+			ssr = Boolean(config.build.ssr);
+		},
+		async writeBundle(options) {
+			// Only the client build is served to browsers
+			if (ssr || !options.dir) return;
+			for await (const path of files(options.dir)) {
+				if (!PRECOMPRESS_EXTENSIONS.test(path)) continue;
+				const data = await readFile(path);
+				if (data.length < PRECOMPRESS_MIN_SIZE) continue;
+				await writeFile(`${path}.gz`, gzipSync(data, { level: 9 }));
+				await writeFile(
+					`${path}.br`,
+					brotliCompressSync(data, { params: { [constants.BROTLI_PARAM_QUALITY]: 11 } })
+				);
+			}
+		}
+	};
+}
+"""
+
+# `yarn size`: raw, gzip and brotli sizes of the client build, largest first
+SIZE_REPORT_TEMPLATE = """// scripts/size-report.js - added by svelte-pi create --perf
+import { readdirSync, readFileSync } from 'node:fs';
+import { join, relative } from 'node:path';
+import { brotliCompressSync, gzipSync } from 'node:zlib';
+
+const root = process.argv[2] ?? '.svelte-kit/output/client';
+
+function* files(dir) {
+	for (const entry of readdirSync(dir, { withFileTypes: true })) {
+		const path = join(dir, entry.name);
+		if (entry.isDirectory()) yield* files(path);
+		else if (!/\\.(br|gz)$/.test(entry.name)) yield path;
+	}
+}
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`.padStart(10);
+
+const rows = [];
+for (const path of files(root)) {
+	const data = readFileSync(path);
+	rows.push({
+		path: relative(root, path),
+		raw: data.length,
+		gzip: gzipSync(data).length,
+		brotli: brotliCompressSync(data).length
+	});
+}
+rows.sort((a, b) => b.brotli - a.brotli);
+
+console.log(`${'raw'.padStart(10)}${'gzip'.padStart(10)}${'brotli'.padStart(10)}  file`);
+for (const row of rows) console.log(`${kb(row.raw)}${kb(row.gzip)}${kb(row.brotli)}  ${row.path}`);
+const total = (key) => rows.reduce((sum, row) => sum + row[key], 0);
+const totals = `${kb(total('raw'))}${kb(total('gzip'))}${kb(total('brotli'))}`;
+console.log(`${totals}  total (${rows.length} files in ${root})`);
+"""
+
+# Templates shipped with svelte-pi; user and project template directories
+# can override any of them by file name (see templates.py)
+BUILTIN_TEMPLATES = {
+    "reset.css": RESET_CSS_CONTENT,
+    "component.svelte": SVELTE_COMPONENT_TEMPLATE,
+    "component.module.scss": SCSS_MODULE_TEMPLATE,
+    "_tokens.scss": TOKENS_SCSS_CONTENT,
+    "layout.svelte": LAYOUT_TEMPLATE,
+    "vite.perf.ts": VITE_PERF_TEMPLATE,
+    "size-report.js": SIZE_REPORT_TEMPLATE,
+}
+
+
+def get_svelte_component_template(component_name):
+    """Generate Svelte component template with component name"""
+    from .templates import builtin_registry
+    return builtin_registry().render("component.svelte", name=component_name)
+
+
+def get_scss_module_template():
+    """Generate SCSS module template"""
+    from .templates import builtin_registry
+    return builtin_registry().render("component.module.scss")
@@ -0,0 +1,182 @@
+# fleet.py
+import json
+import os
+import time
+from pathlib import Path
+
+from .paths import cache_dir
+
+DEFAULT_PARENT_DIR = "~/dev"
+
+
+def load_fleet_spec(spec_path, parent_dir=None, reset_css=None, reset_mode=None, perf=None):
+    """Read a JSON or YAML spec listing the projects to create
+
+    The spec is either a list of projects or a mapping with "projects" and
+    optional "defaults". Each project is a name or a mapping with "name",
+    "parent_dir", "reset_css", "reset_mode" and "perf"; missing values come
+    from "defaults", then from the keyword arguments (the command-line
+    flags).
+    """
+    spec_path = Path(spec_path)
+    text = spec_path.read_text()
+
+    if spec_path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML specs need PyYAML: pip install pyyaml")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+
+    defaults = {}
+    if isinstance(data, dict):
+        defaults = data.get("defaults", {}) or {}
+        data = data.get("projects", [])
+    if not isinstance(data, list) or not data:
+        raise ValueError("Spec must list at least one project")
+
+    projects = []
+    for entry in data:
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict) or not str(entry.get("name", "")).strip():
+            raise ValueError(f"Invalid project entry: {entry!r}")
+        projects.append(project_spec(
+            entry["name"],
+            entry.get("parent_dir", defaults.get("parent_dir", parent_dir)),
+            entry.get("reset_css", defaults.get("reset_css", reset_css)),
+            entry.get("reset_mode", defaults.get("reset_mode", reset_mode)),
+            entry.get("perf", defaults.get("perf", perf)),
+        ))
+
+    seen = set()
+    for project in projects:
+        target = os.path.join(project["parent_dir"], project["name"])
+        if target in seen:
+            raise ValueError(f"Project listed twice: {target}")
+        seen.add(target)
+
+    return projects
+
+
+def project_spec(name, parent_dir=None, reset_css=None, reset_mode=None, perf=None):
+    """Normalize the answers for one project, filling in the prompt defaults"""
+    from .file_operations import RESET_MODES
+
+    if reset_mode is not None and reset_mode not in RESET_MODES:
+        raise ValueError(f"reset_mode must be one of {', '.join(RESET_MODES)}, not {reset_mode!r}")
+    return {
+        "name": str(name).strip(),
+        "parent_dir": os.path.expanduser(parent_dir or DEFAULT_PARENT_DIR),
+        "reset_css": True if reset_css is None else bool(reset_css),
+        "reset_mode": reset_mode or RESET_MODES[0],
+        "perf": bool(perf),
+    }
+
+
+def run_fleet(projects, workers=None, jobs=None, use_cache=True, log_dir=None, use_store=True, workspace=None):
+    """Create many projects in a process pool; returns one result per project
+
+    When the skeleton cache is cold, the first project is created on its
+    own so that every other project can be materialized from its snapshot.
+    With a workspace root the projects are only scaffolded as members;
+    registering them and the hoisted install are left to the caller, so
+    that they happen once for the whole fleet.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    log_dir = Path(log_dir) if log_dir else cache_dir() / "fleet" / time.strftime("%Y%m%d-%H%M%S")
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    if workspace is not None:
+        use_cache = False
+    tasks = [dict(project, jobs=jobs, use_cache=use_cache, use_store=use_store, workspace=workspace,
+                  log_path=str(log_dir / f"{index:03d}-{project['name']}.log"))
+             for index, project in enumerate(projects, start=1)]
+
+    results = []
+    if use_cache and len(tasks) > 1 and not _skeleton_is_warm():
+        results.append(scaffold_project(tasks[0]))
+        tasks = tasks[1:]
+
+    if not tasks:
+        return results
+
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        results.extend(executor.map(scaffold_project, tasks))
+
+    return results
+
+
+def scaffold_project(task):
+    """Process-pool entry point: create one project, logging to its own file"""
+    from rich.console import Console
+    from .console import restore_output_mode, set_output_mode, use_console
+    from .create_pipeline import run_create_pipeline
+    from .tracing import trace_events
+
+    started = time.time()
+    first_event = len(trace_events())
+    status = "failed"
+    error = None
+
+    with open(task["log_path"], "w") as log:
+        # The project run in-process to warm the cache reports like the pooled
+        # ones: only through its log and result, never as --json step events
+        previous_mode = set_output_mode("rich")
+        previous_console = use_console(Console(file=log, force_terminal=False, width=120))
+        try:
+            project_path = run_create_pipeline(
+                task["name"], task["parent_dir"], task["reset_css"],
+                use_cache=task["use_cache"], jobs=task["jobs"], use_store=task["use_store"],
+                reset_mode=task["reset_mode"], perf=task["perf"],
+                workspace=task.get("workspace"), join_workspace=False
+            )
+            if project_path:
+                status = "ok"
+        except Exception as e:
+            error = str(e)
+            log.write(f"Unexpected error: {error}\n")
+        finally:
+            use_console(previous_console)
+            restore_output_mode(previous_mode)
+
+    return {
+        "name": task["name"],
+        "path": os.path.join(task["parent_dir"], task["name"]),
+        "reset_css": task["reset_css"],
+        "reset_mode": task["reset_mode"],
+        "perf": task["perf"],
+        "status": status,
+        "error": error,
+        "duration": round(time.time() - started, 3),
+        "log": task["log_path"],
+        "trace_events": trace_events()[first_event:],
+    }
+
+
+def write_fleet_report(results, report_path, duration):
+    """Write the machine-readable result report"""
+    results = [{key: value for key, value in result.items() if key != "trace_events"}
+               for result in results]
+    report = {
+        "duration": round(duration, 3),
+        "succeeded": sum(1 for result in results if result["status"] == "ok"),
+        "failed": sum(1 for result in results if result["status"] != "ok"),
+        "projects": results,
+    }
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2) + "\n")
+    return report
+
+
+def _skeleton_is_warm():
+    from .project_setup import skeleton_profile
+    from .skeleton_cache import lookup_skeleton
+
+    return lookup_skeleton(skeleton_profile(), touch=False) is not None
@@ -0,0 +1,234 @@
+# history.py
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from contextlib import closing
+
+from .paths import cache_dir
+
+SCHEMA_VERSION = 1
+MAX_RUNS = 5000
+PREDICTION_SAMPLES = 50
+VERSIONS_MAX_AGE = 6 * 3600
+
+# Trace categories worth keeping: scheduler steps of create and component
+# batches. Individual file writes are too fine-grained to predict from.
+RECORDED_CATEGORIES = ("step", "component")
+
+# sv is not run: tool_versions() reports the version pinned in the toolchain
+VERSION_COMMANDS = {
+    "yarn": ["yarn", "--version"],
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL,
+    started REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    svelte_pi TEXT,
+    sv TEXT,
+    yarn TEXT
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    wall_s REAL NOT NULL,
+    cpu_s REAL,
+    child_cpu_s REAL,
+    ok INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_by_name ON steps (name, run_id);
+"""
+
+
+def history_path():
+    return cache_dir() / "history.sqlite3"
+
+
+def connect():
+    """Open the history database, creating it on first use"""
+    path = history_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=5)
+    # WAL without a sync per commit: recording a run must not cost a flush
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        connection.executescript(_SCHEMA)
+        connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return connection
+
+
+def record_runs(command, events, versions=None):
+    """Store trace events as history, one run per process that recorded them
+
+    Fleet creates merge the events of every worker process, so each worker
+    becomes its own run. Returns the number of runs stored; history is
+    best effort and never fails the command.
+    """
+    from . import __version__
+
+    by_process = {}
+    for event in events:
+        if event.get("cat") in RECORDED_CATEGORIES:
+            by_process.setdefault(event["pid"], []).append(event)
+    if not by_process:
+        return 0
+
+    versions = versions or {}
+    try:
+        with closing(connect()) as connection, connection:
+            for process_events in by_process.values():
+                steps = [(step_name(event), event["args"]) for event in process_events]
+                ok = all(args.get("status") == "ok" for _, args in steps)
+                run_id = connection.execute(
+                    "INSERT INTO runs (command, started, ok, svelte_pi, sv, yarn) VALUES (?, ?, ?, ?, ?, ?)",
+                    (command, min(event["ts"] for event in process_events) / 1_000_000, ok,
+                     __version__, versions.get("sv"), versions.get("yarn")),
+                ).lastrowid
+                connection.executemany(
+                    "INSERT INTO steps (run_id, name, wall_s, cpu_s, child_cpu_s, ok) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(run_id, name, args["wall_s"], args.get("cpu_s"), args.get("child_cpu_s"),
+                      args.get("status") == "ok") for name, args in steps],
+                )
+            connection.execute("DELETE FROM runs WHERE id <= (SELECT MAX(id) FROM runs) - ?", (MAX_RUNS,))
+    except sqlite3.Error:
+        return 0
+    return len(by_process)
+
+
+def step_name(event):
+    """History name of a trace event: `component ui/button` is recorded as `component`"""
+    if event.get("cat") == "component":
+        return event["name"].split(" ", 1)[0]
+    return event["name"]
+
+
+def predict(step_names, samples=PREDICTION_SAMPLES):
+    """Map step name -> {"median", "p95", "runs"} from recent successful runs
+
+    Steps with no history are left out.
+    """
+    predictions = {}
+    try:
+        with closing(connect()) as connection:
+            for name in step_names:
+                durations = [row[0] for row in connection.execute(
+                    "SELECT wall_s FROM steps WHERE name = ? AND ok ORDER BY run_id DESC LIMIT ?",
+                    (name, samples))]
+                if durations:
+                    predictions[name] = summarize(durations)
+    except sqlite3.Error:
+        pass
+    return predictions
+
+
+def trends(command=None):
+    """Per step and tool-version combination: runs, median and p95, oldest first
+
+    Returns a list of dicts with step, sv, yarn, first_seen, runs, median
+    and p95; only successful steps count.
+    """
+    query = ("SELECT steps.name, runs.sv, runs.yarn, runs.started, steps.wall_s FROM steps "
+             "JOIN runs ON runs.id = steps.run_id WHERE steps.ok")
+    params = ()
+    if command:
+        query += " AND runs.command = ?"
+        params = (command,)
+
+    groups = {}
+    try:
+        with closing(connect()) as connection:
+            for name, sv, yarn, started, wall_s in connection.execute(query + " ORDER BY runs.id", params):
+                group = groups.setdefault((name, sv, yarn), {"first_seen": started, "durations": []})
+                group["durations"].append(wall_s)
+    except sqlite3.Error:
+        return []
+
+    rows = []
+    for (name, sv, yarn), group in groups.items():
+        rows.append(dict(summarize(group["durations"]), step=name, sv=sv, yarn=yarn,
+                         first_seen=group["first_seen"]))
+    rows.sort(key=lambda row: (row["step"], row["first_seen"]))
+    return rows
+
+
+def summarize(durations):
+    """Median and nearest-rank 95th percentile of a list of durations"""
+    ordered = sorted(durations)
+    count = len(ordered)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    p95 = ordered[max(0, -(-95 * count // 100) - 1)]
+    return {"median": median, "p95": p95, "runs": count}
+
+
+def tool_versions(detect=True, max_age=VERSIONS_MAX_AGE):
+    """Return {"sv": ..., "yarn": ...}, re-detecting once the cached answer is stale
+
+    Detection runs the tools, so it is cached for a few hours; with
+    detect=False only the cached answer is used, however old. sv is
+    always the currently pinned version.
+    """
+    from .toolchain import sv_version
+
+    cache_file = cache_dir() / "tool-versions.json"
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        cached = None
+
+    if cached and (not detect or time.time() - cached.get("checked", 0) < max_age):
+        return dict(cached.get("versions", {}), sv=sv_version())
+    if not detect:
+        return {"sv": sv_version()}
+
+    versions = detect_tool_versions()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"checked": time.time(), "versions": versions}))
+    except OSError:
+        pass
+    return dict(versions, sv=sv_version())
+
+
+def detect_tool_versions():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(VERSION_COMMANDS)) as executor:
+        outputs = executor.map(_command_version, VERSION_COMMANDS.values())
+        return {tool: version for tool, version in zip(VERSION_COMMANDS, outputs) if version}
+
+
+def probe_tool_versions():
+    """Start tool_versions() in a background thread; returns a Future
+
+    create starts this first so detection overlaps with the scaffold.
+    """
+    from concurrent.futures import Future
+
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(tool_versions())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _command_version(cmd):
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, stdin=subprocess.DEVNULL,
+                                env=dict(os.environ, NO_COLOR="1"))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = result.stdout.strip().splitlines()
+    return lines[-1].strip() if result.returncode == 0 and lines else None
@@ -0,0 +1,77 @@
+# journal.py
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from .paths import PROJECT_STATE_DIR, ignore_project_state
+
+JOURNAL_VERSION = 1
+JOURNAL_FILE = Path(PROJECT_STATE_DIR) / "journal.json"
+
+
+def step_hash(name, params, upstream_hashes=()):
+    """Hash a step's parameters together with the hashes of the steps it depends on
+
+    Chaining the upstream hashes means a step that is re-run (because its
+    own inputs changed) invalidates everything downstream of it too.
+    """
+    encoded = json.dumps([name, params, sorted(upstream_hashes)], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+class StepJournal:
+    """Completed create steps and their inputs hashes, stored in the project
+
+    The journal is written after every successful step, so a run that
+    fails or is killed part-way leaves a record of how far it got.
+    """
+
+    def __init__(self, project_path):
+        self.project_path = Path(project_path)
+        self.path = self.project_path / JOURNAL_FILE
+        self.steps = {}
+
+    @classmethod
+    def load(cls, project_path):
+        """Read the journal of a project; an empty journal if there is none"""
+        journal = cls(project_path)
+        try:
+            data = json.loads(journal.path.read_text())
+            if data.get("version") == JOURNAL_VERSION:
+                journal.steps = dict(data["steps"])
+        except (OSError, ValueError, KeyError, TypeError):
+            journal.steps = {}
+        return journal
+
+    def exists(self):
+        return self.path.exists()
+
+    def is_complete(self, name, inputs_hash):
+        """True if the step finished before with the same inputs hash"""
+        entry = self.steps.get(name)
+        return entry is not None and entry.get("inputs") == inputs_hash
+
+    def completed(self, name):
+        """True if the step finished before, whatever its inputs were"""
+        return name in self.steps
+
+    def record(self, name, inputs_hash):
+        """Mark a step complete and write the journal"""
+        self.steps[name] = {"inputs": inputs_hash, "finished": round(time.time(), 3)}
+        self.save()
+
+    def save(self):
+        # Nothing to record into before the project directory exists
+        if not self.project_path.is_dir():
+            return
+        try:
+            ignore_project_state(self.project_path, JOURNAL_FILE.name)
+            temp_file = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps({"version": JOURNAL_VERSION, "steps": self.steps}, indent=2))
+            os.replace(temp_file, self.path)
+        except OSError:
+            # Losing the journal only costs re-running steps on --resume
+            pass
+
@@ -1,87 +1,924 @@
 # main.py
 import click
-from .ui import show_welcome, get_project_name, ask_reset_css, get_parent_directory, show_confirmation, show_summary
-from .project_setup import create_sveltekit_project, add_prettier, install_sass
-from .file_operations import create_reset_css, update_app_html, create_component
+
+# Command modules (and rich, through them) are imported inside each command
+# so that `--help` and editor-driven `component` calls start quickly.
 
 
 @click.group()
-def cli():
+@click.option('--json', 'json_output', is_flag=True,
+              help="Print one JSON event per step on stdout instead of rich output; implies --no-input")
+@click.option('--quiet', '-q', is_flag=True, help="Print nothing but errors; implies --no-input")
+@click.pass_context
+def cli(ctx, json_output, quiet):
     """SvelteKit project launcher with custom defaults"""
-    pass
+    if json_output and quiet:
+        raise click.UsageError("--json and --quiet cannot be combined")
+    if json_output or quiet:
+        from .console import set_output_mode, restore_output_mode
+
+        previous = set_output_mode("json" if json_output else "quiet")
+        ctx.call_on_close(lambda: restore_output_mode(previous))
 
 
 @cli.command()
-def create():
+@click.option('--name', 'project_name', help="Project name (skips the prompt)")
+@click.option('--reset/--no-reset', 'use_reset_css', default=None,
+              help="Include reset.css (skips the prompt)")
+@click.option('--reset-mode', type=click.Choice(["link", "inline", "layout"]), default="link", show_default=True,
+              help="Link reset.css from app.html, inline it minified in app.html, or import it in the root layout")
+@click.option('--bundle', 'bundle_path', type=click.Path(exists=True),
+              help="Create from a local template bundle (a directory, .tar.gz or .tar.zst) instead of sv create")
+@click.option('--perf', is_flag=True,
+              help="Tune the build: precompression, chunk splitting, inlined small assets, prerendering")
+@click.option('--workspace', type=click.Path(file_okay=False),
+              help="Add the project to the yarn workspace at this root (initialized if needed) and install "
+                   "once from the root")
+@click.option('--dir', 'parent_dir', type=click.Path(file_okay=False),
+              help="Parent directory for the project (skips the prompt)")
+@click.option('--no-input', is_flag=True,
+              help="Never prompt; missing answers use the prompt defaults")
+@click.option('--spec', type=click.Path(exists=True, dir_okay=False),
+              help="JSON or YAML file listing many projects to create in parallel")
+@click.option('--workers', type=click.IntRange(min=1), default=None,
+              help="Projects to create at once with --spec  [default: CPU count]")
+@click.option('--report', type=click.Path(dir_okay=False),
+              help="Where to write the JSON result report for --spec")
+@click.option('--cache/--no-cache', 'use_cache', default=True,
+              help="Reuse a cached project skeleton when one matches")
+@click.option('--store/--no-store', 'use_store', default=True,
+              help="Hardlink node_modules files from the shared package store")
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help="Maximum number of create steps to run concurrently  [default: 4]")
+@click.option('--trace', 'trace_path', type=click.Path(dir_okay=False),
+              help="Write per-step timings in Chrome trace-event format")
+@click.option('--resume', is_flag=True,
+              help="Continue a failed create, skipping the steps its journal records as done")
+@click.option('--plan', 'show_plan', is_flag=True,
+              help="Show the steps that would run and their predicted durations, then exit")
+@click.pass_context
+def create(ctx, project_name, use_reset_css, reset_mode, bundle_path, perf, workspace, parent_dir, no_input, spec,
+           workers, report, use_cache, use_store, jobs, trace_path, resume, show_plan):
     """Create a new SvelteKit project"""
+    import os
+
+    bundle = None
+    if bundle_path:
+        from .bundles import load_bundle
+
+        if spec:
+            raise click.UsageError("--bundle cannot be combined with --spec")
+        try:
+            bundle = load_bundle(bundle_path)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+
+    if workspace:
+        from .workspace import WORKSPACE_APPS_DIR
+
+        if bundle is not None:
+            raise click.UsageError("--bundle cannot be combined with --workspace")
+        workspace = os.path.abspath(os.path.expanduser(workspace))
+        parent_dir = parent_dir or os.path.join(workspace, WORKSPACE_APPS_DIR)
+
+    if show_plan:
+        _show_create_plan(project_name, parent_dir, use_reset_css, reset_mode, perf, use_cache, use_store, resume,
+                          bundle, workspace)
+        return
+
+    from .history import probe_tool_versions
+    _record_history(ctx, "create", probe_tool_versions())
+
+    if trace_path:
+        ctx.call_on_close(lambda: _write_trace(trace_path))
+
+    if spec:
+        if resume:
+            raise click.UsageError("--resume cannot be combined with --spec")
+        # Flags left at their defaults must not override the spec's own defaults
+        if ctx.get_parameter_source("reset_mode") == click.core.ParameterSource.DEFAULT:
+            reset_mode = None
+        _create_fleet(ctx, spec, workers, report, use_cache, use_store, jobs, workspace,
+                      parent_dir=parent_dir, use_reset_css=use_reset_css, reset_mode=reset_mode, perf=perf or None)
+        return
+
+    from .console import output_mode
+    from .ui import show_welcome, get_project_name, ask_reset_css, get_parent_directory, show_confirmation, show_summary
+    from .create_pipeline import run_create_pipeline
+    from .fleet import project_spec
+
+    # There is nobody to answer prompts when output is for machines
+    no_input = no_input or output_mode() != "rich"
+
     show_welcome()
 
+    if no_input and not project_name:
+        raise click.UsageError("--name is required with --no-input")
+
     # Step 1: Get project name
-    project_name = get_project_name()
+    project_name = project_name or get_project_name()
     show_confirmation("Project name", project_name)
 
-    # Step 2: Ask about reset.css
-    use_reset_css = ask_reset_css()
-    reset_status = "Yes" if use_reset_css else "No"
-    show_confirmation("Include reset.css", reset_status)
+    # Step 2: Ask about reset.css, unless the bundle ships its own styles
+    if bundle is not None and not bundle.needs("reset"):
+        use_reset_css = False
+    if use_reset_css is None and not no_input:
+        use_reset_css = ask_reset_css()
 
     # Step 3: Get parent directory
-    parent_dir = get_parent_directory()
+    if parent_dir is None and not no_input:
+        parent_dir = get_parent_directory()
+
+    answers = project_spec(project_name, parent_dir, use_reset_css, reset_mode, perf)
+    project_name, parent_dir, use_reset_css = answers["name"], answers["parent_dir"], answers["reset_css"]
+    show_confirmation("Include reset.css", f"Yes ({reset_mode})" if use_reset_css else "No")
+    if bundle is not None:
+        show_confirmation("Bundle", f"{bundle.name} {bundle.version}")
+    if perf:
+        show_confirmation("Perf preset", "Yes")
     show_confirmation("Project directory", parent_dir)
+    if workspace:
+        _check_workspace_member(workspace, os.path.join(parent_dir, project_name))
+        show_confirmation("Workspace", workspace)
+        os.makedirs(parent_dir, exist_ok=True)
 
-    # Step 4: Create the SvelteKit project
-    project_path = create_sveltekit_project(project_name, parent_dir)
+    # Step 4: Scaffold, install and style the project
+    project_path = run_create_pipeline(project_name, parent_dir, use_reset_css,
+                                       use_cache=use_cache, jobs=jobs, use_store=use_store, resume=resume,
+                                       reset_mode=reset_mode, perf=perf, bundle=bundle, workspace=workspace)
     if not project_path:
+        ctx.exit(1)
+
+    show_summary(project_name, use_reset_css, parent_dir)
+
+
+def _show_create_plan(project_name, parent_dir, use_reset_css, reset_mode, perf, use_cache, use_store, resume,
+                      bundle=None, workspace=None):
+    """Print the create steps with predicted durations, without prompting or running anything"""
+    from .console import emit, output_mode
+    from .create_pipeline import plan_create_pipeline
+    from .fleet import project_spec
+    from .ui import show_create_plan
+
+    # Only --resume needs the real project path; any name plans the same steps
+    answers = project_spec(project_name or "my-app", parent_dir, use_reset_css, reset_mode, perf)
+    rows, estimate = plan_create_pipeline(answers["name"], answers["parent_dir"], answers["reset_css"],
+                                          use_cache=use_cache, use_store=use_store, resume=resume,
+                                          reset_mode=reset_mode, perf=perf, bundle=bundle, workspace=workspace)
+    if output_mode() == "json":
+        for row in rows:
+            emit({"event": "planned_step", **row})
+        emit({"event": "estimate", **estimate})
         return
+    show_create_plan(rows, estimate)
+
+
+def _check_workspace_member(workspace, project_path):
+    """Refuse a project that would land outside its workspace"""
+    from .workspace import workspace_member_path
 
-    # Step 5: Add prettier
-    if not add_prettier(project_path):
+    try:
+        workspace_member_path(workspace, project_path)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+
+
+def _create_fleet(ctx, spec, workers, report, use_cache, use_store, jobs, workspace=None, parent_dir=None,
+                  use_reset_css=None, reset_mode=None, perf=None):
+    """Create every project listed in a spec file without prompting
+
+    --dir, --reset/--no-reset, --reset-mode and --perf apply to the
+    projects whose spec entry and defaults leave them unset. With a
+    workspace the projects are scaffolded in parallel without installing;
+    the members that succeeded are then registered and installed together
+    by a single hoisted install.
+    """
+    import os
+    import time
+    from pathlib import Path
+    from .console import console, emit, output_mode, print_error
+    from .fleet import load_fleet_spec, run_fleet, write_fleet_report
+
+    try:
+        projects = load_fleet_spec(spec, parent_dir=parent_dir, reset_css=use_reset_css, reset_mode=reset_mode,
+                                   perf=perf)
+    except (OSError, ValueError) as e:
+        raise click.UsageError(f"Could not read spec: {str(e)}")
+    if workspace:
+        for project in projects:
+            _check_workspace_member(workspace, os.path.join(project["parent_dir"], project["name"]))
+            os.makedirs(project["parent_dir"], exist_ok=True)
+
+    console.print(f"[cyan]Creating {len(projects)} projects...[/cyan]")
+    started = time.time()
+    results = run_fleet(projects, workers=workers, jobs=jobs, use_cache=use_cache, use_store=use_store,
+                        workspace=workspace)
+
+    installed = True
+    members = [result["path"] for result in results if result["status"] == "ok"]
+    if workspace and members:
+        from .create_pipeline import DEFAULT_JOBS, workspace_steps
+        from .scheduler import run_steps
+        installed = run_steps(workspace_steps(workspace, members), jobs=jobs or DEFAULT_JOBS)
+
+    from .tracing import add_trace_events
+    add_trace_events([event for result in results for event in result.get("trace_events", [])
+                      if event["pid"] != os.getpid()])
+
+    report_path = report or str(Path(results[0]["log"]).parent / "report.json")
+    write_fleet_report(results, report_path, time.time() - started)
+
+    if output_mode() == "rich":
+        from .ui import show_fleet_summary
+        if not show_fleet_summary(results, report_path) or not installed:
+            ctx.exit(1)
         return
 
-    # Step 6: Install sass-embedded
-    if not install_sass(project_path):
+    for result in results:
+        emit({"event": "project", **{key: value for key, value in result.items() if key != "trace_events"}})
+        if result["status"] != "ok" and output_mode() == "quiet":
+            print_error(f"✗ {result['path']}: {result['error'] or 'failed'} (log: {result['log']})")
+    if any(result["status"] != "ok" for result in results) or not installed:
+        ctx.exit(1)
+
+
+@cli.command()
+@click.argument('component_paths', nargs=-1)
+@click.option('--from', 'manifest', type=click.Path(exists=True, dir_okay=False),
+              help="JSON or YAML manifest listing component paths")
+@click.option('--trace', 'trace_path', type=click.Path(dir_okay=False),
+              help="Write per-file timings in Chrome trace-event format")
+@click.option('--dry-run', is_flag=True,
+              help="Show which files would be created or updated without writing them")
+@click.option('--force', is_flag=True,
+              help="Create components even if their name is already used at another path")
+@click.pass_context
+def component(ctx, component_paths, manifest, trace_path, dry_run, force):
+    """Create one or more components at the specified paths
+
+    `component list` and `component find PATTERN` are the same as
+    `components list` and `components find PATTERN`.
+    """
+    if component_paths and component_paths[0] in ("list", "find"):
+        _component_listing(ctx, component_paths)
         return
 
-    # Step 7: Add reset.css if requested
-    if use_reset_css:
-        if not create_reset_css(project_path):
-            return
-        if not update_app_html(project_path):
-            return
+    _record_history(ctx, "component")
 
-    show_summary(project_name, use_reset_css, parent_dir)
+    if trace_path:
+        ctx.call_on_close(lambda: _write_trace(trace_path))
 
+    from .console import console, get_console, output_mode, print_error
+    from .file_operations import create_component, create_components, load_component_manifest
 
-@cli.command()
-@click.argument('component_path', required=False)
-def component(component_path):
-    """Create a new component at the specified path"""
-    from rich.console import Console
-    from rich.prompt import Prompt
+    component_paths = list(component_paths)
 
-    console = Console()
+    if manifest:
+        try:
+            component_paths.extend(load_component_manifest(manifest))
+        except (OSError, ValueError) as e:
+            print_error(f"✗ Could not read manifest: {str(e)}")
+            ctx.exit(1)
+
+    if not component_paths and output_mode() != "rich":
+        raise click.UsageError("component paths are required with --json or --quiet")
 
     # If no path provided, launch interactive wizard
-    if not component_path:
+    if not component_paths:
+        from rich.prompt import Prompt
+
         console.print()
         console.print("✨ [light_blue1]Welcome to Component Creation Wizard[/light_blue1]")
         console.print()
 
         component_path = Prompt.ask(
             "[light_steel_blue1]Name of component (including path)[/light_steel_blue1]",
-            console=console
+            console=get_console()
         )
 
         if not component_path.strip():
-            console.print("[red]✗[/red] Component path cannot be empty")
-            return
+            print_error("✗ Component path cannot be empty")
+            ctx.exit(1)
+
+        component_paths = [component_path]
 
-    console.print(f"[cyan]Creating component:[/cyan] [bold]{component_path}[/bold]")
+    if len(component_paths) == 1:
+        component_path = component_paths[0]
+        console.print(f"[cyan]Creating component:[/cyan] [bold]{component_path}[/bold]")
 
-    if create_component(component_path):
-        console.print(f"[green]✓[/green] Component created successfully")
+        if not create_component(component_path, dry_run=dry_run, force=force):
+            print_error(f"✗ Failed to create component")
+            ctx.exit(1)
+        if not dry_run:
+            console.print(f"[green]✓[/green] Component created successfully")
+        return
+
+    console.print(f"[cyan]Creating {len(component_paths)} components...[/cyan]")
+    results = create_components(component_paths, dry_run=dry_run, force=force)
+    if results is None:
+        ctx.exit(1)
+    if not dry_run:
+        if output_mode() == "rich":
+            from .ui import show_component_summary
+            show_component_summary(results)
+        else:
+            _report_components(results)
+    if any(error for _, _, error in results):
+        ctx.exit(1)
+
+
+def _component_listing(ctx, arguments):
+    """Run `component list` / `component find PATTERN`; list and find are not component paths"""
+    command, patterns = arguments[0], arguments[1:]
+    if command == "list" and not patterns:
+        ctx.invoke(components_list)
+    elif command == "find" and len(patterns) == 1:
+        ctx.invoke(components_find, pattern=patterns[0])
     else:
-        console.print(f"[red]✗[/red] Failed to create component")
+        raise click.UsageError(f"'{command}' is reserved: use `component list` or `component find PATTERN`, "
+                               f"or give the component a directory (e.g. ui/{command})")
+
+
+def _report_components(results):
+    """One JSON event per component, or the failures alone in quiet mode"""
+    from .console import emit, output_mode, print_error
+
+    for component_path, written_files, error in results:
+        emit({"event": "component", "path": component_path, "status": "failed" if error else "ok",
+              "files": written_files, "error": error})
+        if error and output_mode() == "quiet":
+            print_error(f"✗ {component_path}: {error}")
+
+
+@cli.group()
+def components():
+    """List and search the components of the current project"""
+    pass
+
+
+@components.command(name="list")
+@click.pass_context
+def components_list(ctx):
+    """List every component under src/lib/components"""
+    _show_components(ctx, "components list",
+                     lambda index: [(name, path) for name, paths in sorted(index.names().items()) for path in paths])
+
+
+@components.command(name="find")
+@click.argument('pattern')
+@click.pass_context
+def components_find(ctx, pattern):
+    """Find components by name (substring or glob, case-insensitive)"""
+    _show_components(ctx, "components find", lambda index: index.find(pattern))
+
+
+def _show_components(ctx, command, select):
+    from pathlib import Path
+    from .console import console, emit, print_error
+    from .component_index import COMPONENTS_DIR, load_index
+    from .project_root import find_project_root
+
+    mode = _listing_mode(command)
+    project_root = find_project_root(Path.cwd())
+    if project_root is None:
+        print_error(f"Error: Not in a SvelteKit project directory")
+        ctx.exit(1)
+
+    matches = select(load_index(project_root))
+    if mode == "json":
+        for name, path in matches:
+            emit({"event": "component", "name": name, "path": f"{COMPONENTS_DIR.as_posix()}/{path}"})
+        return
+    if not matches:
+        console.print("[dim]No components found[/dim]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Components")
+    table.add_column("Name")
+    table.add_column("Path")
+    names = {}
+    for name, path in matches:
+        names[name] = names.get(name, 0) + 1
+        table.add_row(name, f"{COMPONENTS_DIR.as_posix()}/{path}")
+    console.print(table)
+
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    console.print(f"[dim]{len(matches)} component file(s)[/dim]")
+    if duplicates:
+        console.print(f"[yellow]Names used more than once: {', '.join(duplicates)}[/yellow]")
+
+
+@cli.command()
+@click.option('--stylesheet', 'stylesheets', multiple=True, metavar='HREF',
+              help="Link a stylesheet in app.html")
+@click.option('--preconnect', 'origins', multiple=True, metavar='ORIGIN',
+              help="Add a preconnect hint for an origin (e.g. a font CDN) to app.html")
+@click.option('--preload', 'preloads', multiple=True, metavar='HREF',
+              help="Add a preload hint to app.html; the type is inferred from the extension")
+@click.option('--alias', 'aliases', multiple=True, metavar='NAME=PATH',
+              help="Add a kit.alias entry to svelte.config.js")
+@click.option('--vite-scss', is_flag=True,
+              help="Use the modern Sass compiler API in vite.config.ts")
+@click.option('--dry-run', is_flag=True, help="Report what would change without writing")
+@click.pass_context
+def patch(ctx, stylesheets, origins, preloads, aliases, vite_scss, dry_run):
+    """Add links, hints and config entries to the current project"""
+    from . import patching
+    from .file_operations import patch_project
+
+    patches_by_file = {}
+    app_html = [patching.preconnect(origin) for origin in origins]
+    app_html += [patching.stylesheet_link(href) for href in stylesheets]
+    app_html += [patching.preload(href) for href in preloads]
+    if app_html:
+        patches_by_file["src/app.html"] = app_html
+
+    if aliases:
+        alias_patches = []
+        for alias in aliases:
+            name, separator, target = alias.partition("=")
+            if not separator or not name or not target:
+                raise click.BadParameter(f"expected NAME=PATH, got {alias!r}", param_hint="--alias")
+            alias_patches.append(patching.svelte_config_alias(name, target))
+        patches_by_file["svelte.config.js"] = alias_patches
+
+    if vite_scss:
+        patches_by_file["vite.config.ts"] = [patching.vite_scss_options()]
+
+    if not patches_by_file:
+        raise click.UsageError("Nothing to patch; see --help for the available edits")
+
+    if not patch_project(patches_by_file, dry_run=dry_run):
+        ctx.exit(1)
+
+
+@cli.group()
+def styles():
+    """Inspect the stylesheets of the current project"""
+    pass
+
+
+@styles.command(name="audit")
+@click.option('--min-files', type=click.IntRange(min=1), default=2, show_default=True,
+              help="Only report declarations found in at least this many files")
+@click.option('--top', type=click.IntRange(min=1), default=20, show_default=True,
+              help="How many duplicates to list")
+@click.pass_context
+def styles_audit(ctx, min_files, top):
+    """Report declarations duplicated across *.module.scss files"""
+    from pathlib import Path
+    from .console import console, emit, output_mode, print_error
+    from .project_root import find_project_root
+    from .styles_audit import audit_styles
+
+    project_root = find_project_root(Path.cwd())
+    if project_root is None:
+        print_error(f"Error: Not in a SvelteKit project directory")
+        ctx.exit(1)
+
+    report = audit_styles(project_root, min_files=min_files)
+    if output_mode() == "json":
+        for duplicate in report["duplicates"]:
+            emit({"event": "duplicate", **duplicate})
+        emit({"event": "audit", "files": report["files"], "declarations": report["declarations"],
+              "duplicates": len(report["duplicates"]), "bytes": report["bytes"]})
+        return
+
+    from rich.table import Table
+
+    if not report["duplicates"]:
+        console.print(f"[green]✓[/green] No duplicated declarations in {report['files']} module file(s)")
+        return
+
+    table = Table(title="Duplicated declarations")
+    table.add_column("Declaration")
+    table.add_column("Files", justify="right")
+    table.add_column("Copies", justify="right")
+    table.add_column("Savings", justify="right")
+    for duplicate in report["duplicates"][:top]:
+        table.add_row(duplicate["declaration"], str(len(duplicate["files"])), str(duplicate["occurrences"]),
+                      _format_size(duplicate["bytes"]))
+    console.print(table)
+
+    hidden = len(report["duplicates"]) - top
+    if hidden > 0:
+        console.print(f"[dim]…and {hidden} more (--top)[/dim]")
+    console.print(f"[cyan]{len(report['duplicates'])} duplicated declaration(s) in {report['files']} module file(s); "
+                  f"about {_format_size(report['bytes'])} before compression could move to shared tokens, "
+                  f"mixins or classes[/cyan]")
+
+
+@cli.command()
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False),
+              help="Unix socket to listen on  [default: ~/.cache/svelte-pi/daemon.sock]")
+@click.option('--idle-timeout', type=click.FloatRange(min=0), default=30, show_default=True,
+              help="Exit after this many idle minutes (0 = never)")
+@click.option('--status', is_flag=True, help="Report whether a daemon is running")
+@click.option('--stop', is_flag=True, help="Stop the running daemon")
+@click.pass_context
+def serve(ctx, socket_path, idle_timeout, status, stop):
+    """Keep svelte-pi warm for svelte-pi-client (component, patch, templates)"""
+    from .console import console
+    from .daemon import Daemon, daemon_status, stop_daemon
+
+    if status:
+        reply = daemon_status(socket_path)
+        if reply is None:
+            console.print("[dim]No daemon is running[/dim]")
+            ctx.exit(1)
+        console.print(f"[green]✓[/green] Daemon running (pid {reply['pid']}, "
+                      f"{reply['requests']} requests, up {reply['uptime']:.0f}s)")
+        return
+
+    if stop:
+        if stop_daemon(socket_path):
+            console.print("[green]✓[/green] Daemon stopped")
+        else:
+            console.print("[dim]No daemon is running[/dim]")
+        return
+
+    daemon = Daemon(socket_path, idle_timeout=idle_timeout * 60)
+    console.print(f"[cyan]Listening on {daemon.path}[/cyan] [dim](Ctrl+C to stop)[/dim]")
+    try:
+        daemon.serve()
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command()
+@click.option('--command', 'command', type=click.Choice(["create", "component"]),
+              help="Only runs of this command")
+@click.option('--step', 'step_name', help="Only this step (e.g. install)")
+def stats(command, step_name):
+    """Show step timings from past runs, per sv and yarn version"""
+    from .console import console, emit
+    from .history import history_path, trends
+
+    mode = _listing_mode("stats")
+    rows = [row for row in trends(command) if step_name in (None, row["step"])]
+    if mode == "json":
+        for row in rows:
+            emit({"event": "timing", **row})
+        return
+    if not rows:
+        console.print("[dim]No timing history yet; it is recorded by create and component[/dim]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Step timings")
+    table.add_column("Step")
+    table.add_column("sv")
+    table.add_column("yarn")
+    table.add_column("Since")
+    table.add_column("Runs", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Change", justify="right")
+
+    previous = {}
+    for row in rows:
+        # Change of the median against the step's previous tool versions
+        before = previous.get(row["step"])
+        change = "-"
+        if before:
+            ratio = row["median"] / before - 1
+            change = f"{ratio:+.0%}" if ratio <= 0.2 else f"[red]{ratio:+.0%}[/red]"
+        previous[row["step"]] = row["median"] or None
+        table.add_row(row["step"], row["sv"] or "?", row["yarn"] or "?", _format_age(row["first_seen"]),
+                      str(row["runs"]), f"{row['median']:.2f}s", f"{row['p95']:.2f}s", change)
+
+    console.print(table)
+    console.print(f"[dim]History: {history_path()}[/dim]")
+
+
+@cli.group()
+def cache():
+    """Inspect and prune the project skeleton cache"""
+    pass
+
+
+@cache.command(name="list")
+def cache_list():
+    """List cached project skeletons"""
+    from .console import console, emit
+    from .skeleton_cache import list_skeletons
+
+    mode = _listing_mode("cache list")
+    entries = list_skeletons()
+    if mode == "json":
+        for entry in entries:
+            emit({"event": "skeleton", **entry})
+        return
+
+    if not entries:
+        console.print("[dim]Skeleton cache is empty[/dim]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Cached skeletons")
+    table.add_column("Key")
+    table.add_column("Profile")
+    table.add_column("Size", justify="right")
+    table.add_column("Last used")
+
+    total = 0
+    for entry in entries:
+        profile = entry.get("profile", {})
+        size = entry.get("size", 0)
+        total += size
+        table.add_row(
+            entry["key"],
+            ", ".join(f"{key}={value}" for key, value in sorted(profile.items())),
+            _format_size(size),
+            _format_age(entry.get("last_used", 0)),
+        )
+
+    console.print(table)
+    console.print(f"[dim]{len(entries)} skeleton(s), {_format_size(total)} total[/dim]")
+
+
+@cache.command(name="prune")
+@click.option('--max-size', type=float, default=2048, show_default=True,
+              help="Evict least recently used skeletons above this size (MB)")
+@click.option('--max-age', type=float, default=30, show_default=True,
+              help="Evict skeletons unused for this many days")
+@click.option('--all', 'remove_all', is_flag=True, help="Remove every cached skeleton")
+def cache_prune(max_size, max_age, remove_all):
+    """Evict cached project skeletons"""
+    from .console import console
+    from .skeleton_cache import prune_skeletons
+
+    if remove_all:
+        removed = prune_skeletons(max_bytes=0, max_age_days=None)
+    else:
+        removed = prune_skeletons(max_bytes=int(max_size * 1024 * 1024), max_age_days=max_age)
+
+    freed = sum(entry.get("size", 0) for entry in removed)
+    console.print(f"[green]✓[/green] Removed {len(removed)} skeleton(s), freed {_format_size(freed)}")
+
+
+@cli.group()
+def store():
+    """Inspect and garbage-collect the shared package store"""
+    pass
+
+
+@store.command(name="stats")
+def store_stats_command():
+    """Show package store size and how much sharing saves"""
+    from .console import console, emit
+    from .package_store import store_stats, store_dir
+
+    mode = _listing_mode("store stats")
+    stats = store_stats()
+    if mode == "json":
+        emit({"event": "store", "path": store_dir(), **stats})
+        return
+    console.print(f"[cyan]Package store:[/cyan] {store_dir()}")
+    console.print(f"  Files: {stats['files']} ({stats['unreferenced']} unreferenced)")
+    console.print(f"  On disk: {_format_size(stats['bytes'])}")
+    console.print(f"  Saved by sharing: {_format_size(stats['bytes_saved'])}")
+
+
+@store.command(name="gc")
+def store_gc():
+    """Delete package files no project links to any more"""
+    from .console import console
+    from .package_store import gc_store
+
+    removed, freed = gc_store()
+    console.print(f"[green]✓[/green] Removed {removed} unreferenced file(s), freed {_format_size(freed)}")
+
+
+@cli.group()
+def seeds():
+    """Inspect and refresh the lockfile seeds used to skip dependency resolution"""
+    pass
+
+
+@seeds.command(name="list")
+def seeds_list():
+    """List stored lockfile seeds"""
+    from .console import console, emit
+    from .seeds import list_seeds
+
+    mode = _listing_mode("seeds list")
+    entries = list_seeds()
+    if mode == "json":
+        for entry in entries:
+            emit({"event": "seed", **entry})
+        return
+    if not entries:
+        console.print("[dim]No lockfile seeds yet; the next create saves one[/dim]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Lockfile seeds")
+    table.add_column("Key")
+    table.add_column("Profile")
+    table.add_column("Direct dependencies", justify="right")
+    table.add_column("Created")
+    for entry in entries:
+        profile = entry.get("profile", {})
+        table.add_row(
+            entry["key"],
+            ", ".join(f"{key}={value}" for key, value in sorted(profile.items())),
+            str(len(entry.get("dependencies", {})) + len(entry.get("devDependencies", {}))),
+            _format_age(entry.get("created", 0)),
+        )
+    console.print(table)
+
+
+@seeds.command(name="refresh")
+@click.pass_context
+def seeds_refresh(ctx):
+    """Re-resolve the current profile's dependencies and replace its seed"""
+    from .console import console, print_error
+    from .project_setup import skeleton_profile
+    from .seeds import refresh_seed
+    from .skeleton_cache import remove_skeleton
+
+    profile = skeleton_profile()
+    console.print(f"[cyan]Resolving dependencies for a fresh lockfile seed...[/cyan]")
+    if not refresh_seed(profile):
+        print_error(f"✗ Could not refresh the lockfile seed")
+        ctx.exit(1)
+
+    # The cached skeleton was installed from the old lockfile
+    if remove_skeleton(profile):
+        console.print(f"[dim]Dropped the cached skeleton built from the previous seed[/dim]")
+
+
+@cli.group()
+def toolchain():
+    """Manage the pinned sv installed in the tool cache"""
+    pass
+
+
+@toolchain.command(name="show")
+def toolchain_show():
+    """Show the pinned sv version and where it is installed"""
+    from .console import console, emit
+    from .toolchain import sv_binary, sv_version
+
+    mode = _listing_mode("toolchain show")
+    binary = sv_binary()
+    if mode == "json":
+        emit({"event": "toolchain", "sv": sv_version(), "path": binary, "installed": binary.exists()})
+        return
+    console.print(f"sv {sv_version()}: {binary if binary.exists() else '[dim]not installed yet[/dim]'}")
+
+
+@toolchain.command(name="update")
+@click.option('--version', 'version', help="Install and pin this sv version instead of reinstalling the pinned one")
+@click.pass_context
+def toolchain_update(ctx, version):
+    """Install the pinned sv into the tool cache, replacing any existing install"""
+    from .console import print_error
+    from .toolchain import update_toolchain
+
+    if not update_toolchain(version):
+        print_error(f"✗ Could not update the toolchain")
+        ctx.exit(1)
+
+
+@cli.group()
+def templates():
+    """List and customize the file templates"""
+    pass
+
+
+@templates.command(name="list")
+def templates_list():
+    """Show which source each template is loaded from"""
+    from pathlib import Path
+    from .console import console, emit
+    from .project_root import find_project_root
+    from .templates import get_registry
+
+    mode = _listing_mode("templates list")
+    registry = get_registry(find_project_root(Path.cwd()))
+    if mode == "json":
+        for name, source, path in registry.list_templates():
+            emit({"event": "template", "name": name, "source": source, "path": path})
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Templates")
+    table.add_column("Template")
+    table.add_column("Source")
+    table.add_column("Path")
+    for name, source, path in registry.list_templates():
+        table.add_row(name, source, str(path or "-"))
+
+    console.print(table)
+    for label, directory in registry.sources():
+        console.print(f"[dim]{label} templates: {directory}[/dim]")
+
+
+@templates.command(name="eject")
+@click.argument('name')
+@click.option('--project', 'to_project', is_flag=True,
+              help="Copy into this project's .svelte-pi/templates instead of the user config")
+@click.pass_context
+def templates_eject(ctx, name, to_project):
+    """Copy a built-in template into a template directory to edit it"""
+    from pathlib import Path
+    from .console import console, print_error
+    from .file_templates import BUILTIN_TEMPLATES
+    from .paths import config_dir
+    from .project_root import find_project_root
+    from .templates import PROJECT_TEMPLATES_DIR
+
+    if name not in BUILTIN_TEMPLATES:
+        print_error(f"✗ No built-in template named {name}")
+        console.print(f"[dim]Built-in templates: {', '.join(sorted(BUILTIN_TEMPLATES))}[/dim]")
+        ctx.exit(1)
+
+    if to_project:
+        project_root = find_project_root(Path.cwd())
+        if project_root is None:
+            print_error(f"Error: Not in a SvelteKit project directory")
+            ctx.exit(1)
+        target = project_root / PROJECT_TEMPLATES_DIR / name
+    else:
+        target = config_dir() / "templates" / name
+
+    if target.exists():
+        print_error(f"✗ {target} already exists; leaving it alone")
+        ctx.exit(1)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(BUILTIN_TEMPLATES[name])
+    console.print(f"[green]✓[/green] Wrote {target}")
+
+
+def _listing_mode(command):
+    """Output mode of a command that only prints a listing
+
+    --quiet would leave nothing to print, so it is refused rather than
+    printing an empty result that looks like an empty listing.
+    """
+    from .console import output_mode
+
+    if output_mode() == "quiet":
+        raise click.UsageError(f"{command} only prints a listing; use --json instead of --quiet")
+    return output_mode()
+
+
+def _record_history(ctx, command, versions=None):
+    """Append this command's step timings to the history database when it exits"""
+    from .tracing import trace_events
+
+    first_event = len(trace_events())
+
+    def record():
+        from .history import record_runs, tool_versions
+
+        detected = None
+        if versions is not None:
+            try:
+                # Detection may still be fetching sv (warm creates finish first);
+                # fall back to the last versions detected
+                detected = versions.result(timeout=1)
+            except Exception:
+                pass
+        record_runs(command, trace_events()[first_event:], detected or tool_versions(detect=False))
+
+    ctx.call_on_close(record)
+
+
+def _write_trace(trace_path):
+    from .console import console
+    from .tracing import write_chrome_trace
+
+    write_chrome_trace(trace_path)
+    console.print(f"[dim]Trace written to {trace_path}[/dim]")
+
+
+def _format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def _format_age(timestamp):
+    import time
+    seconds = max(0, time.time() - timestamp)
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m ago"
+    if seconds < 86400:
+        return f"{seconds / 3600:.0f}h ago"
+    return f"{seconds / 86400:.0f}d ago"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+# package_store.py
+import hashlib
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .console import console
+from .paths import cache_dir
+
+HASH_CHUNK = 1024 * 1024
+
+
+def store_dir():
+    """Directory holding package files, addressed by content hash"""
+    return cache_dir() / "store" / "files"
+
+
+def link_node_modules(project_path, max_workers=8):
+    """Replace every file in a project's node_modules with a store hardlink
+
+    Files are keyed by the SHA-256 of their content plus their executable
+    bit. A file already in the store is swapped for a link to it; a new one
+    is added to the store by linking it in, so nothing is copied. The net
+    effect is that identical package files across all projects share one
+    inode on disk.
+
+    Entries directly under node_modules whose name starts with a dot
+    (.bin, .vite, .cache, .yarn-integrity) are tool-managed and mutable,
+    so they are left alone. Returns a stats dict, or None when the store
+    and the project are on different filesystems.
+    """
+    node_modules = Path(project_path) / "node_modules"
+    if not node_modules.is_dir():
+        return {"files": 0, "linked": 0, "added": 0, "bytes_saved": 0}
+
+    root = store_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    if os.stat(root).st_dev != os.stat(node_modules).st_dev:
+        console.print(f"[yellow]Package store is on a different filesystem than {project_path}; "
+                      f"skipping deduplication[/yellow]")
+        return None
+
+    files = list(_package_files(node_modules))
+    stats = {"files": len(files), "linked": 0, "added": 0, "bytes_saved": 0}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for outcome, size in executor.map(_link_into_store, files):
+            if outcome == "linked":
+                stats["linked"] += 1
+                stats["bytes_saved"] += size
+            elif outcome == "added":
+                stats["added"] += 1
+
+    return stats
+
+
+def store_stats():
+    """Summarize the store: files, bytes on disk and bytes saved by sharing"""
+    stats = {"files": 0, "bytes": 0, "unreferenced": 0, "bytes_saved": 0}
+    for store_file in _store_files():
+        file_stat = os.lstat(store_file)
+        stats["files"] += 1
+        stats["bytes"] += file_stat.st_size
+        references = file_stat.st_nlink - 1
+        if references <= 0:
+            stats["unreferenced"] += 1
+        else:
+            stats["bytes_saved"] += file_stat.st_size * (references - 1)
+    return stats
+
+
+def gc_store():
+    """Delete store files no project links to any more; returns (files, bytes)"""
+    removed = 0
+    freed = 0
+    for store_file in _store_files():
+        file_stat = os.lstat(store_file)
+        # The store's own entry is the only remaining link
+        if file_stat.st_nlink <= 1:
+            os.unlink(store_file)
+            removed += 1
+            freed += file_stat.st_size
+
+    for bucket in store_dir().glob("*"):
+        try:
+            bucket.rmdir()
+        except OSError:
+            pass
+
+    return removed, freed
+
+
+def _package_files(node_modules):
+    for entry in os.scandir(node_modules):
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            for root, dirs, files in os.walk(entry.path):
+                for name in files:
+                    path = os.path.join(root, name)
+                    if stat.S_ISREG(os.lstat(path).st_mode):
+                        yield path
+        elif entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _store_files():
+    root = store_dir()
+    if not root.is_dir():
+        return
+    for bucket in os.scandir(root):
+        if bucket.is_dir(follow_symlinks=False):
+            for entry in os.scandir(bucket.path):
+                if entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
+def _store_path(path, file_stat):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    key = digest.hexdigest()
+    if file_stat.st_mode & 0o111:
+        key += "-x"
+    return store_dir() / key[:2] / key[2:]
+
+
+def _link_into_store(path):
+    """Return ("linked" | "added" | "shared", size) for one project file"""
+    file_stat = os.lstat(path)
+    store_file = _store_path(path, file_stat)
+
+    try:
+        existing = os.lstat(store_file)
+    except FileNotFoundError:
+        existing = None
+
+    if existing and existing.st_ino == file_stat.st_ino:
+        return "shared", file_stat.st_size
+
+    if existing is None:
+        store_file.parent.mkdir(exist_ok=True)
+        try:
+            os.link(path, store_file)
+            return "added", file_stat.st_size
+        except FileExistsError:
+            # Another process stored the same content first
+            pass
+
+    temp_path = f"{path}.svelte-pi-link"
+    os.link(store_file, temp_path)
+    os.replace(temp_path, path)
+    return "linked", file_stat.st_size
@@ -0,0 +1,272 @@
+# patching.py
+import re
+from pathlib import Path
+
+from .write_plan import WritePlan, UNCHANGED
+
+
+class Anchor:
+    """Where a patch goes: a regex, and whether to insert after or before its line
+
+    Inserted lines take the anchor line's indentation plus `indent`.
+    `text` overrides the patch's text for this anchor (for example to
+    create a missing block instead of adding to an existing one).
+    """
+
+    def __init__(self, pattern, position="after", indent="", text=None):
+        if position not in ("after", "before"):
+            raise ValueError(f"position must be 'after' or 'before', not {position!r}")
+        self.pattern = re.compile(pattern)
+        self.position = position
+        self.indent = indent
+        self.text = text
+
+
+class Patch:
+    """An idempotent edit anchored on a pattern in a text file
+
+    A patch is already present when `marker` (a plain substring) is in the
+    text. Otherwise its text is inserted on its own line next to the line
+    holding the first anchor that matches; anchors are tried in order and
+    may be given as plain regex strings.
+    """
+
+    def __init__(self, name, marker, text, anchors):
+        self.name = name
+        self.marker = marker
+        self.text = text
+        self.anchors = [anchor if isinstance(anchor, Anchor) else Anchor(anchor) for anchor in anchors]
+
+    def __repr__(self):
+        return f"Patch({self.name!r})"
+
+    def is_present(self, content):
+        return self.marker in content
+
+    def apply(self, content):
+        """Return the patched content, or None if no anchor matches"""
+        for anchor in self.anchors:
+            match = anchor.pattern.search(content)
+            if match:
+                break
+        else:
+            return None
+
+        line_start = content.rfind("\n", 0, match.start()) + 1
+        line_indent = re.match(r"[ \t]*", content[line_start:]).group()
+        text = self.text if anchor.text is None else anchor.text
+        lines = "\n".join(line_indent + anchor.indent + line if line else line
+                          for line in text.split("\n"))
+
+        if anchor.position == "before":
+            return content[:line_start] + lines + "\n" + content[line_start:]
+
+        line_end = content.find("\n", match.end())
+        if line_end == -1:
+            return content + "\n" + lines
+        return content[:line_end] + "\n" + lines + content[line_end:]
+
+
+class Substitution(Patch):
+    """An idempotent in-line edit: the first match of `pattern` is rewritten by `replace(match)`
+
+    For edits inside a line, such as adding an element to an array literal,
+    which line-anchored patches cannot express.
+    """
+
+    def __init__(self, name, marker, pattern, replace):
+        super().__init__(name, marker, None, [])
+        self.pattern = re.compile(pattern)
+        self.replace = replace
+
+    def apply(self, content):
+        match = self.pattern.search(content)
+        if match is None:
+            return None
+        return content[:match.start()] + self.replace(match) + content[match.end():]
+
+
+class PatchReport:
+    """What patching one file did: names of applied, present and failed patches"""
+
+    def __init__(self, path, applied=(), present=(), failed=()):
+        self.path = path
+        self.applied = list(applied)
+        self.present = list(present)
+        self.failed = list(failed)
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def __repr__(self):
+        return (f"PatchReport({str(self.path)!r}, applied={self.applied}, "
+                f"present={self.present}, failed={self.failed})")
+
+
+def patch_text(content, patches):
+    """Apply patches to a string in order; return (content, PatchReport)"""
+    report = PatchReport(None)
+    for patch in patches:
+        if patch.is_present(content):
+            report.present.append(patch.name)
+            continue
+        patched = patch.apply(content)
+        if patched is None:
+            report.failed.append(patch.name)
+        else:
+            content = patched
+            report.applied.append(patch.name)
+    return content, report
+
+
+def apply_patches(path, patches, dry_run=False):
+    """Patch a file with one read and at most one write
+
+    Patches whose anchors are missing are reported as failed; the others
+    are still applied. The file is rewritten (through a write plan) only
+    when something changed.
+    """
+    path = Path(path)
+    content, report = patch_text(path.read_text(), patches)
+    report.path = path
+    if report.applied and not dry_run:
+        plan = WritePlan(path.parent)
+        plan.add(path, content)
+        (planned,) = plan.apply()
+        # Another process may have made the same edit in the meantime
+        if planned.action == UNCHANGED:
+            report.present.extend(report.applied)
+            report.applied.clear()
+    return report
+
+
+# app.html
+
+_VIEWPORT = r"<meta\s+name=[\"']viewport[\"'][^>]*>"
+_CHARSET = r"<meta\s+charset=[^>]*>"
+_HEAD_OPEN = r"<head(\s[^>]*)?>"
+_SVELTEKIT_HEAD = r"%sveltekit\.head%"
+
+
+def stylesheet_link(href):
+    """<link rel="stylesheet"> after the viewport meta, or before %sveltekit.head%"""
+    return Patch(f"stylesheet {href}", f'rel="stylesheet" href="{href}"', f'<link rel="stylesheet" href="{href}" />',
+                 [_VIEWPORT, Anchor(_SVELTEKIT_HEAD, position="before")])
+
+
+def inline_style(style_id, css):
+    """<style id=...> where stylesheet_link would put a <link>; the id marks it as present"""
+    return Patch(f"inline style {style_id}", f'<style id="{style_id}">', f'<style id="{style_id}">{css}</style>',
+                 [_VIEWPORT, Anchor(_SVELTEKIT_HEAD, position="before")])
+
+
+def preconnect(origin, crossorigin=True):
+    """<link rel="preconnect"> early in <head>, where it can start soonest"""
+    attributes = " crossorigin" if crossorigin else ""
+    return Patch(f"preconnect {origin}", f'rel="preconnect" href="{origin}"',
+                 f'<link rel="preconnect" href="{origin}"{attributes} />',
+                 [_CHARSET, Anchor(_HEAD_OPEN, indent="\t")])
+
+
+def preload(href, as_type=None, mime_type=None, crossorigin=None):
+    """<link rel="preload"> just before %sveltekit.head%
+
+    `as`, `type` and `crossorigin` are inferred from the extension when not
+    given (fonts must be preloaded with crossorigin to be reused).
+    """
+    inferred = _PRELOAD_TYPES.get(Path(href).suffix.lower(), ("fetch", None))
+    as_type = as_type or inferred[0]
+    mime_type = mime_type or inferred[1]
+    if crossorigin is None:
+        crossorigin = as_type in ("font", "fetch")
+    attributes = f' as="{as_type}"'
+    if mime_type:
+        attributes += f' type="{mime_type}"'
+    if crossorigin:
+        attributes += " crossorigin"
+    return Patch(f"preload {href}", f'rel="preload" href="{href}"',
+                 f'<link rel="preload" href="{href}"{attributes} />',
+                 [Anchor(_SVELTEKIT_HEAD, position="before")])
+
+
+_PRELOAD_TYPES = {
+    ".woff2": ("font", "font/woff2"),
+    ".woff": ("font", "font/woff"),
+    ".css": ("style", None),
+    ".js": ("script", None),
+    ".avif": ("image", "image/avif"),
+    ".webp": ("image", "image/webp"),
+    ".png": ("image", None),
+    ".jpg": ("image", None),
+    ".svg": ("image", None),
+}
+
+
+# Svelte components
+
+# The instance script; <script context="module"> and <script module> run once per module
+_INSTANCE_SCRIPT_OPEN = r"<script(?![^>]*\b(?:context|module)\b)(\s[^>]*)?>"
+
+
+def svelte_import(module):
+    """Side-effect import in a component's instance script; creates the script when there is none"""
+    statement = f"import '{module}';"
+    return Patch(f"import {module}", f"'{module}'", statement, [
+        Anchor(_INSTANCE_SCRIPT_OPEN, indent="\t"),
+        Anchor(r"\A", position="before", text=f"<script>\n\t{statement}\n</script>\n"),
+    ])
+
+
+# TypeScript and JavaScript modules
+
+# The last import statement, however many lines it spans
+_LAST_IMPORT = r"(?ms)^import\b[^;]*?['\"][^'\"]+['\"];?(?!.*^import\b)"
+
+
+def module_import(statement, module):
+    """An import statement after the module's last import (or at the top)"""
+    return Patch(f"import {module}", f"'{module}'", statement,
+                 [_LAST_IMPORT, Anchor(r"\A", position="before")])
+
+
+def export_const(name, value):
+    """`export const name = value;` after the imports, e.g. page options in a +layout.ts"""
+    return Patch(f"export {name}", f"export const {name} ", f"export const {name} = {value};",
+                 [_LAST_IMPORT, Anchor(r"\A", position="before")])
+
+
+# svelte.config.js and vite.config.ts
+
+def svelte_config_alias(name, target):
+    """kit.alias entry; creates the alias block when there is none"""
+    entry = f"'{name}': '{target}'"
+    return Patch(f"alias {name}", entry, entry + ",", [
+        Anchor(r"\balias:\s*\{", indent="\t"),
+        Anchor(r"\bkit:\s*\{", indent="\t", text=f"alias: {{\n\t{entry}\n}},"),
+    ])
+
+
+def svelte_kit_option(name, value):
+    """A kit option in svelte.config.js, e.g. inlineStyleThreshold"""
+    return Patch(f"kit {name}", f"{name}:", f"{name}: {value},", [Anchor(r"\bkit:\s*\{", indent="\t")])
+
+
+def vite_plugin(call):
+    """Append a plugin call such as `perf()` to the Vite config's plugins array"""
+    def append(match):
+        items = match.group("items")
+        items = f"{items}, {call}" if items.strip() else call
+        return f"plugins: [{items}{match.group('end')}]"
+
+    return Substitution(f"vite plugin {call}", call, r"plugins:\s*\[(?P<items>[^\]]*?)(?P<end>,?\s*)\]", append)
+
+
+def vite_scss_options(api="modern-compiler"):
+    """css.preprocessorOptions.scss in the Vite config"""
+    return Patch(
+        "vite scss options",
+        marker="preprocessorOptions",
+        text=f"css: {{\n\tpreprocessorOptions: {{\n\t\tscss: {{ api: '{api}' }}\n\t}}\n}},",
+        anchors=[Anchor(r"defineConfig\(\{", indent="\t")],
+    )
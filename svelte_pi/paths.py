@@ -0,0 +1,45 @@
+# paths.py
+import os
+from pathlib import Path
+
+# Per-project directory for svelte-pi templates and local state
+PROJECT_STATE_DIR = ".svelte-pi"
+
+
+def cache_dir():
+    """Return the directory svelte-pi uses for caches and local state"""
+    override = os.environ.get("SVELTE_PI_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "svelte-pi"
+
+
+def config_dir():
+    """Return the directory svelte-pi reads user configuration from"""
+    override = os.environ.get("SVELTE_PI_CONFIG_DIR")
+    if override:
+        return Path(override).expanduser()
+
+    xdg_config = os.environ.get("XDG_CONFIG_HOME")
+    base = Path(xdg_config).expanduser() if xdg_config else Path.home() / ".config"
+    return base / "svelte-pi"
+
+
+def ignore_project_state(project_root, file_name):
+    """Create a project's .svelte-pi directory and keep a local-state file out of git
+
+    Only the named state files are ignored; templates next to them are
+    meant to be committed.
+    """
+    state_dir = Path(project_root) / PROJECT_STATE_DIR
+    state_dir.mkdir(parents=True, exist_ok=True)
+    ignore_file = state_dir / ".gitignore"
+    try:
+        ignored = ignore_file.read_text().splitlines()
+    except FileNotFoundError:
+        ignored = []
+    if file_name not in ignored:
+        ignore_file.write_text("".join(f"{line}\n" for line in ignored + [file_name]))
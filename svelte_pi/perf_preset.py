@@ -0,0 +1,77 @@
+# perf_preset.py
+import json
+from pathlib import Path
+
+from .console import console, print_error
+from .patching import patch_text, export_const, module_import, svelte_kit_option, vite_plugin
+from .templates import get_registry
+from .write_plan import WritePlan
+
+# Bump when the preset changes, so --resume re-applies it
+PERF_PRESET_VERSION = 1
+
+# Stylesheets below this many bytes are inlined into the page <head>
+INLINE_STYLE_THRESHOLD = 5120
+
+SIZE_REPORT_SCRIPT = "scripts/size-report.js"
+PERF_SCRIPTS = {
+    "size": f"node {SIZE_REPORT_SCRIPT}",
+    "build:size": f"vite build && node {SIZE_REPORT_SCRIPT}",
+}
+
+
+def apply_perf_preset(project_path):
+    """Tune the generated build for production
+
+    Adds vite.perf.ts (precompression, long-lived chunks, inlined small
+    assets) as a Vite plugin, inlines small stylesheets through
+    kit.inlineStyleThreshold, prerenders by default from the root
+    +layout.ts, and adds the `size` and `build:size` scripts. Every edit is
+    planned first and written in one go, so a config that cannot be
+    patched leaves the project untouched.
+    """
+    console.print(f"[cyan]Applying the perf preset...[/cyan]")
+    project_path = Path(project_path)
+
+    try:
+        vite_config = next((project_path / name for name in ("vite.config.ts", "vite.config.js")
+                            if (project_path / name).exists()), None)
+        if vite_config is None:
+            print_error(f"Error applying the perf preset:")
+            print_error(f"No vite.config.ts or vite.config.js in {project_path}")
+            return False
+
+        edits = [
+            (vite_config, [module_import("import { perf } from './vite.perf';", "./vite.perf"), vite_plugin("perf()")]),
+            (project_path / "svelte.config.js", [svelte_kit_option("inlineStyleThreshold", INLINE_STYLE_THRESHOLD)]),
+            (project_path / "src" / "routes" / "+layout.ts", [export_const("prerender", "'auto'")]),
+        ]
+
+        registry = get_registry(project_path)
+        plan = WritePlan(project_path)
+        plan.add(project_path / "vite.perf.ts", registry.render("vite.perf.ts"))
+        plan.add(project_path / SIZE_REPORT_SCRIPT, registry.render("size-report.js"))
+
+        for path, patches in edits:
+            content, report = patch_text(path.read_text() if path.exists() else "", patches)
+            if not report.ok:
+                print_error(f"Error applying the perf preset:")
+                print_error(f"Could not place {', '.join(report.failed)} in {plan.relative(path)}")
+                return False
+            plan.add(path, content)
+
+        package_json = project_path / "package.json"
+        package_data = json.loads(package_json.read_text())
+        scripts = package_data.setdefault("scripts", {})
+        for name, command in PERF_SCRIPTS.items():
+            scripts.setdefault(name, command)
+        plan.add(package_json, json.dumps(package_data, indent="\t") + "\n")
+
+        plan.apply()
+        console.print(f"[green]✓[/green] perf preset applied [dim](yarn build:size to see the result)[/dim]")
+        return True
+
+    except Exception as e:
+        print_error(f"Error applying the perf preset:")
+        print_error(f"{str(e)}")
+        return False
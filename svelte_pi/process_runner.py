@@ -0,0 +1,172 @@
+# process_runner.py
+import queue
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+
+from .console import console, print_error
+from .paths import cache_dir
+
+DEFAULT_IDLE_TIMEOUT = 120
+DEFAULT_TAIL_LINES = 40
+# Logs are pruned by age, so a failure's log survives however many commands run after it
+MAX_LOG_AGE_DAYS = 7
+
+
+class RunResult:
+    """Outcome of a streamed command"""
+
+    def __init__(self, returncode, tail, log_path, timed_out=False, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.returncode = returncode
+        self.tail = tail
+        self.log_path = log_path
+        self.timed_out = timed_out
+        self.idle_timeout = idle_timeout
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out
+
+    @property
+    def output(self):
+        return "\n".join(self.tail)
+
+
+def run_streaming(cmd, cwd, label, input=None, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                  tail_lines=DEFAULT_TAIL_LINES):
+    """Run a command while streaming its output
+
+    stdout and stderr are read line by line as they are produced. Every line
+    is appended to a log file, only the last `tail_lines` are kept in
+    memory, and the most recent line is shown in a live status spinner.
+    The process is killed only after `idle_timeout` seconds without any
+    output, so slow but healthy installs are never cut off.
+    """
+    log_path = _new_log_path(label)
+    tail = deque(maxlen=tail_lines)
+    lines = queue.Queue()
+
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    )
+
+    readers = [
+        threading.Thread(target=_pump, args=(process.stdout, "", lines), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, "stderr: ", lines), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    if input is not None:
+        try:
+            process.stdin.write(input)
+            process.stdin.close()
+        except OSError:
+            # The process may exit without reading its input
+            pass
+
+    timed_out = False
+    open_streams = len(readers)
+    last_activity = time.monotonic()
+
+    with open(log_path, "w") as log, _LiveStatus(label) as status:
+        log.write(f"$ {' '.join(cmd)}\n")
+        while open_streams:
+            try:
+                line = lines.get(timeout=0.25)
+            except queue.Empty:
+                if time.monotonic() - last_activity > idle_timeout:
+                    timed_out = True
+                    process.kill()
+                    break
+                continue
+
+            if line is None:
+                open_streams -= 1
+                continue
+
+            last_activity = time.monotonic()
+            log.write(line + "\n")
+            tail.append(line)
+            if line.strip():
+                status.update(f"[cyan]{label}[/cyan] [dim]{line.strip()[:80]}[/dim]")
+
+    returncode = process.wait()
+    for reader in readers:
+        reader.join(timeout=1)
+
+    return RunResult(returncode, list(tail), log_path, timed_out, idle_timeout)
+
+
+def print_failure_tail(result):
+    """Show the end of a failed command's output and where the full log is"""
+    if result.timed_out:
+        print_error(f"No output for {result.idle_timeout} seconds, process killed")
+    for line in result.tail:
+        print_error(line, markup=False)
+    print_error(f"Full log: {result.log_path}")
+
+
+_live_lock = threading.Lock()
+
+
+class _LiveStatus:
+    """A rich status spinner, or a silent stand-in when another is already live
+
+    rich allows one live display per console, and concurrent steps may
+    stream at the same time.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.status = None
+
+    def __enter__(self):
+        if _live_lock.acquire(blocking=False):
+            self.status = console.status(f"[cyan]{self.label}[/cyan]")
+            self.status.__enter__()
+        return self
+
+    def update(self, message):
+        if self.status is not None:
+            self.status.update(message)
+
+    def __exit__(self, *exc_info):
+        if self.status is not None:
+            self.status.__exit__(*exc_info)
+            _live_lock.release()
+        return False
+
+
+def _pump(stream, prefix, lines):
+    try:
+        for line in stream:
+            lines.put(prefix + line.rstrip("\n"))
+    finally:
+        lines.put(None)
+
+
+def _new_log_path(label):
+    logs_dir = cache_dir() / "logs"
+    logs_dir.mkdir(parents=True, exist_ok=True)
+
+    cutoff = time.time() - MAX_LOG_AGE_DAYS * 86400
+    for old_log in logs_dir.glob("*.log"):
+        try:
+            if old_log.stat().st_mtime < cutoff:
+                old_log.unlink()
+        except OSError:
+            pass
+
+    slug = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return logs_dir / f"{stamp}-{time.monotonic_ns() % 1_000_000:06d}-{slug}.log"
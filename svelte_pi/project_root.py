@@ -0,0 +1,113 @@
+# project_root.py
+import json
+import os
+from pathlib import Path
+
+from .paths import cache_dir
+
+CACHE_VERSION = 1
+MAX_CACHED_PACKAGES = 512
+
+# In-process memo: package.json path -> (mtime_ns, size, has_sveltekit)
+_memo = None
+_dirty = False
+
+
+def find_project_root(start=None):
+    """Walk up from start (default: cwd) to the nearest SvelteKit project
+
+    Like git, any subdirectory of a project works. Each level costs one
+    stat of package.json; the file is only parsed when its mtime or size
+    differ from the on-disk cache. Returns None when no project is found.
+    """
+    directory = Path(start or Path.cwd()).resolve()
+
+    try:
+        for candidate in (directory, *directory.parents):
+            if _has_sveltekit_dependency(candidate / "package.json") and (candidate / "src").is_dir():
+                return candidate
+        return None
+    finally:
+        _save_cache()
+
+
+def is_sveltekit_directory(directory):
+    """Check a single directory for package.json with @sveltejs/kit and src/"""
+    directory = Path(directory)
+    try:
+        return _has_sveltekit_dependency(directory / "package.json") and (directory / "src").is_dir()
+    finally:
+        _save_cache()
+
+
+def _has_sveltekit_dependency(package_json):
+    global _dirty
+
+    try:
+        stat = os.stat(package_json)
+    except OSError:
+        return False
+
+    key = str(package_json)
+    memo = _load_cache()
+    cached = memo.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    try:
+        with open(package_json, 'r') as f:
+            package_data = json.load(f)
+        dependencies = package_data.get('dependencies', {})
+        dev_dependencies = package_data.get('devDependencies', {})
+        has_sveltekit = '@sveltejs/kit' in dependencies or '@sveltejs/kit' in dev_dependencies
+    except (OSError, ValueError, AttributeError):
+        has_sveltekit = False
+
+    memo.pop(key, None)
+    memo[key] = [stat.st_mtime_ns, stat.st_size, has_sveltekit]
+    _dirty = True
+    return has_sveltekit
+
+
+def _cache_file():
+    return cache_dir() / "project-roots.json"
+
+
+def _load_cache():
+    global _memo
+    if _memo is None:
+        try:
+            data = json.loads(_cache_file().read_text())
+            _memo = data["packages"] if data.get("version") == CACHE_VERSION else {}
+        except (OSError, ValueError, KeyError, AttributeError):
+            _memo = {}
+    return _memo
+
+
+def _save_cache():
+    global _dirty
+    if not _dirty:
+        return
+    _dirty = False
+
+    # Dicts keep insertion order and entries are re-inserted on refresh,
+    # so the oldest entries are dropped first
+    while len(_memo) > MAX_CACHED_PACKAGES:
+        del _memo[next(iter(_memo))]
+
+    cache_file = _cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        temp_file.write_text(json.dumps({"version": CACHE_VERSION, "packages": _memo}))
+        os.replace(temp_file, cache_file)
+    except OSError:
+        # The cache is an optimization only
+        pass
+
+
+def reset_cache():
+    """Forget the in-process memo (the on-disk cache is reloaded lazily)"""
+    global _memo, _dirty
+    _memo = None
+    _dirty = False
@@ -1,58 +1,62 @@
 # project_setup.py
-import subprocess
 from pathlib import Path
-from rich.console import Console
 
-console = Console()
+from .console import console, print_error
+from .process_runner import print_failure_tail, run_streaming
+from .toolchain import sv_command, sv_version
 
+SV_TEMPLATE = "minimal"
+SV_TYPES = "ts"
+PACKAGE_MANAGER = "yarn"
+ADD_ONS = ("prettier", "sass-embedded")
 
-def create_sveltekit_project(project_name, parent_dir):
-    """Create a new SvelteKit project with custom defaults"""
+
+def skeleton_profile():
+    """Describe the toolchain inputs that determine a scaffolded project"""
+    return {
+        "template": SV_TEMPLATE,
+        "types": SV_TYPES,
+        "package_manager": PACKAGE_MANAGER,
+        "sv_version": sv_version(),
+        "add_ons": list(ADD_ONS),
+    }
+
+
+def create_sveltekit_project(project_name, parent_dir, install=True):
+    """Create a new SvelteKit project with custom defaults
+
+    With install=False dependencies are only declared in package.json, so a
+    later install_sass call can resolve and link everything in one pass.
+    """
     project_path = Path(parent_dir) / project_name
 
     console.print(f"[cyan]Creating SvelteKit project in {project_path}...[/cyan]")
 
     try:
         cmd = [
-            "npx", "sv", "create", project_name,
-            "--template", "minimal",
-            "--types", "ts",
-            "--install", "yarn",
+            *sv_command(), "create", project_name,
+            "--template", SV_TEMPLATE,
+            "--types", SV_TYPES,
+            *(["--install", PACKAGE_MANAGER] if install else ["--no-install"]),
             "--no-add-ons"
         ]
 
         console.print(f"[dim]Running command: {' '.join(cmd)}[/dim]")
         console.print(f"[dim]Working directory: {parent_dir}[/dim]")
 
-        # Use Popen to send "y" to npx prompt
-        process = subprocess.Popen(
-            cmd,
-            cwd=parent_dir,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        result = run_streaming(cmd, cwd=parent_dir, label="sv create")
 
-        # Send "y" to confirm npx package installation
-        stdout, stderr = process.communicate(input="y\n", timeout=120)
-
-        if process.returncode == 0:
+        if result.ok:
             console.print(f"[green]✓[/green] SvelteKit project created successfully")
             return project_path
         else:
-            console.print(f"[red]Error creating SvelteKit project:[/red]")
-            console.print(f"[red]Exit code: {process.returncode}[/red]")
-            console.print(f"[red]Stdout: {stdout}[/red]")
-            console.print(f"[red]Stderr: {stderr}[/red]")
+            print_error(f"Error creating SvelteKit project:")
+            print_error(f"Exit code: {result.returncode}")
+            print_failure_tail(result)
             return None
 
-    except subprocess.TimeoutExpired:
-        console.print(f"[red]Error: Command timed out after 2 minutes[/red]")
-        process.kill()
-        return None
     except Exception as e:
-        console.print(f"[red]Unexpected error: {str(e)}[/red]")
+        print_error(f"Unexpected error: {str(e)}")
         return None
 
 
@@ -61,44 +65,70 @@ def add_prettier(project_path):
     console.print(f"[cyan]Adding prettier...[/cyan]")
 
     try:
-        cmd = ["npx", "sv", "add", "prettier", "--no-install"]
-
-        result = subprocess.run(
-            cmd,
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        console.print(f"[green]✓[/green] Prettier added successfully")
-        return True
-
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Error adding prettier:[/red]")
-        console.print(f"[red]{e.stderr}[/red]")
+        cmd = [*sv_command(), "add", "prettier", "--no-install"]
+        result = run_streaming(cmd, cwd=project_path, label="sv add prettier")
+
+        if result.ok:
+            console.print(f"[green]✓[/green] Prettier added successfully")
+            return True
+
+        print_error(f"Error adding prettier:")
+        print_failure_tail(result)
+        return False
+
+    except Exception as e:
+        print_error(f"Error adding prettier:")
+        print_error(f"{str(e)}")
+        return False
+
+
+def install_sass(project_path, seeded=False):
+    """Install sass-embedded
+
+    `yarn add` links every dependency declared in package.json, so this also
+    installs anything added earlier with --no-install (such as prettier).
+    With seeded=True a lockfile seed has already declared sass-embedded and
+    pinned every range, so a frozen-lockfile install skips resolution.
+    """
+    console.print(f"[cyan]Installing sass-embedded{' from the lockfile seed' if seeded else ''}...[/cyan]")
+
+    try:
+        if seeded:
+            cmd, label = ["yarn", "install", "--frozen-lockfile"], "yarn install"
+        else:
+            cmd, label = ["yarn", "add", "-D", "sass-embedded"], "yarn add sass-embedded"
+        result = run_streaming(cmd, cwd=project_path, label=label)
+
+        if result.ok:
+            console.print(f"[green]✓[/green] sass-embedded installed successfully")
+            return True
+
+        print_error(f"Error installing sass-embedded:")
+        print_failure_tail(result)
+        return False
+
+    except Exception as e:
+        print_error(f"Error installing sass-embedded:")
+        print_error(f"{str(e)}")
         return False
 
 
-def install_sass(project_path):
-    """Install sass-embedded"""
-    console.print(f"[cyan]Installing sass-embedded...[/cyan]")
+def install_workspace(root):
+    """Install every member of a yarn workspace in one hoisted pass from its root"""
+    console.print(f"[cyan]Installing the workspace in {root}...[/cyan]")
 
     try:
-        cmd = ["yarn", "add", "-D", "sass-embedded"]
-
-        result = subprocess.run(
-            cmd,
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        console.print(f"[green]✓[/green] sass-embedded installed successfully")
-        return True
-
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Error installing sass-embedded:[/red]")
-        console.print(f"[red]{e.stderr}[/red]")
+        result = run_streaming(["yarn", "install"], cwd=root, label="yarn install (workspace)")
+
+        if result.ok:
+            console.print(f"[green]✓[/green] Workspace installed successfully")
+            return True
+
+        print_error(f"Error installing the workspace:")
+        print_failure_tail(result)
+        return False
+
+    except Exception as e:
+        print_error(f"Error installing the workspace:")
+        print_error(f"{str(e)}")
         return False
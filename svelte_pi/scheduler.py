@@ -0,0 +1,154 @@
+# scheduler.py
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .console import console, print_error
+from .tracing import trace_step
+
+
+class Step:
+    """A unit of work with declared inputs and outputs
+
+    Inputs and outputs are artifact names (for example "package_json" or
+    "node_modules"). A step becomes runnable once every step producing one
+    of its inputs has finished successfully. The callable takes no
+    arguments and returns a truthy value on success. `params` holds the
+    values that determine what the step does (names, versions, flags); it
+    is hashed into the step journal so a resumed run only skips steps
+    whose parameters are unchanged.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), params=None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.params = params
+
+    def __repr__(self):
+        return f"Step({self.name!r})"
+
+
+def resolve_dependencies(steps, available=()):
+    """Map each step name to the names of the steps it depends on
+
+    Raises ValueError for unknown inputs, duplicate producers or cycles.
+    """
+    producers = {}
+    for step in steps:
+        for output in step.outputs:
+            if output in producers:
+                raise ValueError(f"Artifact '{output}' is produced by both "
+                                 f"'{producers[output]}' and '{step.name}'")
+            producers[output] = step.name
+
+    dependencies = {}
+    for step in steps:
+        needs = set()
+        for artifact in step.inputs:
+            if artifact in producers:
+                needs.add(producers[artifact])
+            elif artifact not in available:
+                raise ValueError(f"Step '{step.name}' needs '{artifact}' but nothing produces it")
+        dependencies[step.name] = needs
+
+    # Kahn's algorithm purely to reject cycles before anything runs
+    remaining = {name: set(needs) for name, needs in dependencies.items()}
+    while remaining:
+        ready = [name for name, needs in remaining.items() if not needs]
+        if not ready:
+            raise ValueError(f"Dependency cycle between steps: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for needs in remaining.values():
+            needs.difference_update(ready)
+
+    return dependencies
+
+
+def topological_order(steps, available=()):
+    """Return the steps in an order that respects their dependencies"""
+    dependencies = resolve_dependencies(steps, available)
+    done = set()
+    ordered = []
+    pending = list(steps)
+    while pending:
+        for step in pending:
+            if dependencies[step.name] <= done:
+                ordered.append(step)
+                done.add(step.name)
+                pending.remove(step)
+                break
+    return ordered
+
+
+def run_steps(steps, jobs=1, available=(), journal=None):
+    """Run steps concurrently, at most `jobs` at a time
+
+    Returns True when every step succeeded. After the first failure no new
+    steps are started; steps already running are allowed to finish. With a
+    StepJournal, each successful step is recorded with its inputs hash and
+    steps the journal already holds with the same hash are skipped.
+    """
+    dependencies = resolve_dependencies(steps, available)
+    by_name = {step.name: step for step in steps}
+    order = [step.name for step in topological_order(steps, available)]
+    hashes = _inputs_hashes(order, by_name, dependencies) if journal is not None else {}
+
+    done = set()
+    running = {}
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while True:
+            if not failed:
+                for name in order:
+                    if len(running) >= max(1, jobs):
+                        break
+                    if name in done or name in running.values():
+                        continue
+                    if dependencies[name] <= done:
+                        if journal is not None and journal.is_complete(name, hashes[name]):
+                            console.print(f"[green]✓[/green] {name} already done [dim](journal)[/dim]")
+                            done.add(name)
+                            continue
+                        future = executor.submit(_run_traced, by_name[name])
+                        running[future] = name
+
+            if not running:
+                break
+
+            finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    print_error(f"Step '{name}' failed: {str(e)}")
+                    ok = False
+
+                if ok:
+                    done.add(name)
+                    if journal is not None:
+                        journal.record(name, hashes[name])
+                else:
+                    failed = True
+
+    return not failed and len(done) == len(steps)
+
+
+def _inputs_hashes(order, by_name, dependencies):
+    from .journal import step_hash
+
+    hashes = {}
+    for name in order:
+        upstream = [hashes[dependency] for dependency in dependencies[name]]
+        hashes[name] = step_hash(name, by_name[name].params, upstream)
+    return hashes
+
+
+def _run_traced(step):
+    with trace_step(step.name, inputs=list(step.inputs), outputs=list(step.outputs)) as details:
+        ok = step.func()
+        if not ok:
+            details["status"] = "failed"
+        return ok
@@ -0,0 +1,125 @@
+# seeds.py
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from .console import console
+from .paths import cache_dir
+
+METADATA_FILE = "seed.json"
+LOCKFILE = "yarn.lock"
+DEPENDENCY_SECTIONS = ("dependencies", "devDependencies")
+
+
+def seeds_dir():
+    """Directory holding one resolved lockfile per toolchain profile"""
+    return cache_dir() / "seeds"
+
+
+def lookup_seed(profile):
+    """Return the seed directory for a profile, or None if there is none"""
+    from .skeleton_cache import skeleton_key
+
+    seed_dir = seeds_dir() / skeleton_key(profile)
+    if _read_metadata(seed_dir) is None or not (seed_dir / LOCKFILE).is_file():
+        return None
+    return seed_dir
+
+
+def store_seed(project_path, profile):
+    """Keep a freshly installed project's lockfile and dependency ranges as the profile's seed
+
+    An existing seed for the profile is replaced.
+    """
+    from .skeleton_cache import skeleton_key
+
+    project_path = Path(project_path)
+    seed_dir = seeds_dir() / skeleton_key(profile)
+    staging_dir = seed_dir.with_name(f"{seed_dir.name}.tmp-{os.getpid()}")
+
+    try:
+        package_data = json.loads((project_path / "package.json").read_text())
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(project_path / LOCKFILE, staging_dir / LOCKFILE)
+        (staging_dir / METADATA_FILE).write_text(json.dumps({
+            "profile": profile,
+            "created": time.time(),
+            **{section: package_data.get(section, {}) for section in DEPENDENCY_SECTIONS},
+        }, indent=2))
+
+        shutil.rmtree(seed_dir, ignore_errors=True)
+        staging_dir.rename(seed_dir)
+    except (OSError, ValueError) as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        console.print(f"[yellow]Could not save the lockfile seed: {str(e)}[/yellow]")
+        return False
+
+    console.print(f"[green]✓[/green] Lockfile seed saved")
+    return True
+
+
+def apply_seed(seed_dir, project_path):
+    """Copy the seed lockfile into a project and pin its dependency ranges to the seed's
+
+    Returns False (leaving the project as it was) if the seed can't be used.
+    """
+    project_path = Path(project_path)
+    metadata = _read_metadata(seed_dir)
+    if metadata is None:
+        return False
+
+    try:
+        package_json = project_path / "package.json"
+        package_data = json.loads(package_json.read_text())
+        for section in DEPENDENCY_SECTIONS:
+            if metadata.get(section):
+                package_data[section] = dict(sorted({**package_data.get(section, {}), **metadata[section]}.items()))
+        shutil.copyfile(Path(seed_dir) / LOCKFILE, project_path / LOCKFILE)
+        package_json.write_text(json.dumps(package_data, indent="\t") + "\n")
+    except (OSError, ValueError) as e:
+        console.print(f"[yellow]Could not apply the lockfile seed: {str(e)}[/yellow]")
+        return False
+
+    return True
+
+
+def list_seeds():
+    """Return metadata for every stored seed, newest first"""
+    entries = []
+    root = seeds_dir()
+    if not root.is_dir():
+        return entries
+
+    for seed_dir in root.iterdir():
+        metadata = _read_metadata(seed_dir)
+        if metadata is None:
+            continue
+        metadata["key"] = seed_dir.name
+        metadata["path"] = seed_dir
+        entries.append(metadata)
+
+    entries.sort(key=lambda entry: entry.get("created", 0), reverse=True)
+    return entries
+
+
+def refresh_seed(profile):
+    """Resolve the profile's dependencies from scratch in a scratch project and store the result"""
+    import tempfile
+    from .project_setup import create_sveltekit_project, add_prettier, install_sass
+
+    with tempfile.TemporaryDirectory(prefix="svelte-pi-seed-") as parent_dir:
+        project_path = Path(parent_dir) / "seed"
+        if not create_sveltekit_project(project_path.name, parent_dir, install=False):
+            return False
+        if not add_prettier(project_path) or not install_sass(project_path):
+            return False
+        return store_seed(project_path, profile)
+
+
+def _read_metadata(seed_dir):
+    try:
+        return json.loads((Path(seed_dir) / METADATA_FILE).read_text())
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,355 @@
+# skeleton_cache.py
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from .console import console, print_error
+from .paths import PROJECT_STATE_DIR, cache_dir, ignore_project_state
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+DEFAULT_MAX_AGE_DAYS = 30
+
+METADATA_FILE = "skeleton.json"
+TREE_DIR = "tree"
+
+# A fresh project's src/, copied aside for the snapshot (see capture_sources)
+CAPTURED_SOURCES = Path(PROJECT_STATE_DIR) / "skeleton-src"
+
+# ioctl request number for FICLONE (share extents between two files)
+FICLONE = 0x40049409
+
+
+def skeletons_dir():
+    """Directory holding one sub-directory per cached skeleton"""
+    return cache_dir() / "skeletons"
+
+
+def skeleton_key(profile):
+    """Stable cache key for a skeleton profile dictionary"""
+    encoded = json.dumps(profile, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def lookup_skeleton(profile, touch=True):
+    """Return the cached tree for a profile, or None on a miss
+
+    A hit marks the entry as recently used for pruning; with touch=False
+    (planning, probing) the cache is left exactly as it was.
+    """
+    entry_dir = skeletons_dir() / skeleton_key(profile)
+    metadata = _read_metadata(entry_dir)
+    if metadata is None or not (entry_dir / TREE_DIR).is_dir():
+        return None
+    if not touch:
+        return entry_dir / TREE_DIR
+
+    metadata["last_used"] = time.time()
+    try:
+        _write_metadata(entry_dir, metadata)
+    except OSError:
+        # A hit is still a hit; only the LRU timestamp is stale
+        pass
+    return entry_dir / TREE_DIR
+
+
+def capture_sources(project_path):
+    """Copy a freshly scaffolded project's src/ aside for a later snapshot
+
+    The steps that edit src/ (reset.css, app.html, tokens) can then run
+    while the install is still going, and the snapshot taken after the
+    install still holds the untouched sources. Best effort: without a
+    capture the snapshot is skipped.
+    """
+    project_path = Path(project_path)
+    target = project_path / CAPTURED_SOURCES
+    try:
+        ignore_project_state(project_path, CAPTURED_SOURCES.name)
+        shutil.rmtree(target, ignore_errors=True)
+        shutil.copytree(project_path / "src", target, symlinks=True)
+    except OSError as e:
+        shutil.rmtree(target, ignore_errors=True)
+        console.print(f"[yellow]Could not capture sources for the skeleton cache: {str(e)}[/yellow]")
+    return True
+
+
+def store_skeleton(project_path, profile, sources=None):
+    """Snapshot a freshly scaffolded project into the skeleton cache
+
+    With sources, src/ is taken from that copy (see capture_sources)
+    instead of from the project.
+    """
+    project_path = Path(project_path)
+    entry_dir = skeletons_dir() / skeleton_key(profile)
+
+    if (entry_dir / METADATA_FILE).exists():
+        return True
+
+    if not project_path.is_dir():
+        console.print(f"[yellow]Skipping skeleton cache: {project_path} does not exist[/yellow]")
+        return False
+    if sources is not None and not Path(sources).is_dir():
+        console.print(f"[yellow]Skipping skeleton cache: the project's sources were not captured[/yellow]")
+        return False
+
+    console.print(f"[cyan]Caching project skeleton...[/cyan]")
+    staging_dir = entry_dir.with_name(f"{entry_dir.name}.tmp-{os.getpid()}")
+
+    try:
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        cloner = _FileCloner("auto")
+
+        def clone(source, target):
+            relative = Path(source).relative_to(project_path)
+            cloner.clone(source, target, _is_package_file(relative.parts))
+
+        # The project's own journal and indexes must not leak into other projects
+        ignored = [PROJECT_STATE_DIR] + (["src"] if sources is not None else [])
+
+        def ignore(directory, names):
+            return [name for name in ignored if name in names] if Path(directory) == project_path else []
+
+        shutil.copytree(project_path, staging_dir / TREE_DIR, symlinks=True, copy_function=clone, ignore=ignore)
+        if sources is not None:
+            shutil.copytree(sources, staging_dir / TREE_DIR / "src", symlinks=True,
+                            copy_function=lambda source, target: cloner.clone(source, target, False))
+
+        now = time.time()
+        _write_metadata(staging_dir, {
+            "profile": profile,
+            "size": _tree_size(staging_dir / TREE_DIR),
+            "created": now,
+            "last_used": now,
+        })
+
+        staging_dir.rename(entry_dir)
+        console.print(f"[green]✓[/green] Skeleton cached")
+
+    except OSError as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        console.print(f"[yellow]Could not cache skeleton: {str(e)}[/yellow]")
+        return False
+
+    prune_skeletons()
+    return True
+
+
+def materialize_skeleton(tree_path, project_path, project_name, mode="auto"):
+    """Create a project from a cached skeleton tree"""
+    project_path = Path(project_path)
+    console.print(f"[cyan]Creating SvelteKit project from cached skeleton in {project_path}...[/cyan]")
+
+    if project_path.exists():
+        print_error(f"Error: {project_path} already exists")
+        return None
+
+    try:
+        cloner = _FileCloner(mode)
+        tree_path = Path(tree_path)
+
+        for root, dirs, files in os.walk(tree_path):
+            relative = Path(root).relative_to(tree_path)
+            target_root = project_path / relative
+            target_root.mkdir(parents=True, exist_ok=True)
+
+            # os.walk lists symlinked directories under dirs; recreate them as links
+            for name in list(dirs):
+                source = Path(root) / name
+                if source.is_symlink():
+                    os.symlink(os.readlink(source), target_root / name)
+                    dirs.remove(name)
+
+            for name in files:
+                source = Path(root) / name
+                if source.is_symlink():
+                    os.symlink(os.readlink(source), target_root / name)
+                else:
+                    cloner.clone(source, target_root / name, _is_package_file(relative.parts + (name,)))
+
+        _rename_package(project_path / "package.json", project_name)
+
+        console.print(f"[green]✓[/green] SvelteKit project created from cache")
+        return project_path
+
+    except Exception as e:
+        print_error(f"Error materializing cached skeleton:")
+        print_error(f"{str(e)}")
+        shutil.rmtree(project_path, ignore_errors=True)
+        return None
+
+
+def remove_skeleton(profile):
+    """Drop the cached skeleton for a profile; returns True if there was one"""
+    entry_dir = skeletons_dir() / skeleton_key(profile)
+    if not entry_dir.is_dir():
+        return False
+    shutil.rmtree(entry_dir, ignore_errors=True)
+    return True
+
+
+def list_skeletons():
+    """Return metadata for every cached skeleton, most recently used first"""
+    entries = []
+    root = skeletons_dir()
+    if not root.is_dir():
+        return entries
+
+    for entry_dir in root.iterdir():
+        metadata = _read_metadata(entry_dir)
+        if metadata is None:
+            continue
+        metadata["key"] = entry_dir.name
+        metadata["path"] = entry_dir
+        entries.append(metadata)
+
+    entries.sort(key=lambda entry: entry.get("last_used", 0), reverse=True)
+    return entries
+
+
+def prune_skeletons(max_bytes=DEFAULT_MAX_BYTES, max_age_days=DEFAULT_MAX_AGE_DAYS):
+    """Evict stale skeletons, then least recently used ones until under max_bytes"""
+    removed = []
+    entries = list_skeletons()
+    now = time.time()
+
+    kept = []
+    for entry in entries:
+        age_days = (now - entry.get("last_used", 0)) / 86400
+        if max_age_days is not None and age_days > max_age_days:
+            removed.append(entry)
+        else:
+            kept.append(entry)
+
+    if max_bytes is not None:
+        total = sum(entry.get("size", 0) for entry in kept)
+        # kept is ordered most recently used first, so evict from the end
+        while kept and total > max_bytes:
+            entry = kept.pop()
+            total -= entry.get("size", 0)
+            removed.append(entry)
+
+    for entry in removed:
+        shutil.rmtree(entry["path"], ignore_errors=True)
+
+    _remove_abandoned_staging()
+    return removed
+
+
+def _remove_abandoned_staging():
+    """Remove staging directories left behind by interrupted runs"""
+    root = skeletons_dir()
+    if not root.is_dir():
+        return
+    for entry_dir in root.glob("*.tmp-*"):
+        pid = entry_dir.name.rsplit("-", 1)[-1]
+        if pid.isdigit() and not _pid_alive(int(pid)):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_metadata(entry_dir):
+    try:
+        return json.loads((entry_dir / METADATA_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_metadata(entry_dir, metadata):
+    """Replace the metadata atomically, so a concurrent lookup never reads half a file"""
+    data = {key: value for key, value in metadata.items() if key not in ("key", "path")}
+    temp_file = entry_dir / f"{METADATA_FILE}.{os.getpid()}.tmp"
+    temp_file.write_text(json.dumps(data, indent=2))
+    os.replace(temp_file, entry_dir / METADATA_FILE)
+
+
+def _tree_size(path):
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+
+def _is_package_file(parts):
+    """True for files inside an installed package under node_modules
+
+    Top-level dot entries (.bin, .vite, .yarn-integrity) are rewritten in
+    place by tools, so they are never shared between trees.
+    """
+    if "node_modules" not in parts:
+        return False
+    index = parts.index("node_modules")
+    return index + 1 < len(parts) and not parts[index + 1].startswith(".")
+
+
+def _rename_package(package_json, project_name):
+    """Rewrite the name field of a materialized package.json"""
+    if not package_json.exists():
+        return
+    package_data = json.loads(package_json.read_text())
+    package_data["name"] = project_name
+    package_json.write_text(json.dumps(package_data, indent="\t") + "\n")
+
+
+class _FileCloner:
+    """Copy files using the cheapest mechanism the filesystem supports
+
+    In "auto" mode installed package files are hardlinked (they are never
+    edited in place), and everything else is reflinked where possible so
+    edits in the new project can never leak back into the cache.
+    """
+
+    def __init__(self, mode):
+        if mode not in ("auto", "copy", "hardlink", "reflink"):
+            raise ValueError(f"Unknown materialize mode: {mode}")
+        self.mode = mode
+        self.reflink_ok = True
+        self.hardlink_ok = True
+
+    def clone(self, source, target, is_package_file):
+        if self.mode == "hardlink" or (self.mode == "auto" and is_package_file):
+            if self._hardlink(source, target):
+                return
+        if self.mode in ("auto", "reflink", "hardlink"):
+            if self._reflink(source, target):
+                return
+        shutil.copy2(source, target)
+
+    def _hardlink(self, source, target):
+        if not self.hardlink_ok:
+            return False
+        try:
+            os.link(source, target)
+            return True
+        except OSError:
+            # Cross-device or unsupported; stop trying for the rest of the tree
+            self.hardlink_ok = False
+            return False
+
+    def _reflink(self, source, target):
+        if not self.reflink_ok:
+            return False
+        try:
+            import fcntl
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source, target)
+            return True
+        except (ImportError, OSError):
+            self.reflink_ok = False
+            try:
+                os.unlink(target)
+            except OSError:
+                pass
+            return False
@@ -0,0 +1,59 @@
+# styles_audit.py
+from collections import Counter
+from pathlib import Path
+
+from .css import scss_declarations
+
+MODULE_PATTERN = "*.module.scss"
+
+
+def find_module_files(project_root):
+    """Every *.module.scss under src/, sorted"""
+    return sorted((Path(project_root) / "src").rglob(MODULE_PATTERN))
+
+
+def audit_styles(project_root, min_files=2, max_workers=8):
+    """Find declarations repeated across component modules
+
+    Files are read and parsed in a thread pool. Returns a dict with the
+    number of files and declarations scanned, the duplicates (declaration,
+    files, occurrences and the bytes saved by writing it once, largest
+    first) and the total estimated saving. A declaration is a duplicate
+    when it occurs more than once and in at least `min_files` files.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    project_root = Path(project_root)
+    files = find_module_files(project_root)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        counts = list(executor.map(_count_declarations, files))
+
+    occurrences = Counter()
+    found_in = {}
+    for path, file_counts in zip(files, counts):
+        relative = path.relative_to(project_root).as_posix()
+        occurrences.update(file_counts)
+        for declaration in file_counts:
+            found_in.setdefault(declaration, []).append(relative)
+
+    duplicates = []
+    for declaration, count in occurrences.items():
+        if count > 1 and len(found_in[declaration]) >= min_files:
+            # Each extra copy costs the declaration and its semicolon
+            duplicates.append({"declaration": declaration, "files": found_in[declaration], "occurrences": count,
+                               "bytes": (count - 1) * (len(declaration) + 1)})
+    duplicates.sort(key=lambda duplicate: (-duplicate["bytes"], duplicate["declaration"]))
+
+    return {
+        "files": len(files),
+        "declarations": sum(occurrences.values()),
+        "duplicates": duplicates,
+        "bytes": sum(duplicate["bytes"] for duplicate in duplicates),
+    }
+
+
+def _count_declarations(path):
+    try:
+        return Counter(scss_declarations(path.read_text()))
+    except (OSError, UnicodeDecodeError):
+        return Counter()
@@ -0,0 +1,204 @@
+# templates.py
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+from .paths import PROJECT_STATE_DIR, cache_dir, config_dir
+from .file_templates import BUILTIN_TEMPLATES
+
+CACHE_VERSION = 1
+MAX_CACHED_TEMPLATES = 256
+PROJECT_TEMPLATES_DIR = Path(PROJECT_STATE_DIR) / "templates"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+class TemplateError(ValueError):
+    """A template is missing or was rendered without one of its variables"""
+
+
+class CompiledTemplate:
+    """A template split once into literal text and {{variable}} segments
+
+    Segments alternate literal, variable, literal, ...; rendering is a
+    single join with no parsing.
+    """
+
+    def __init__(self, name, segments, source="builtin", path=None):
+        self.name = name
+        self.segments = segments
+        self.source = source
+        self.path = path
+        self.variables = frozenset(segments[1::2])
+
+    @classmethod
+    def compile(cls, name, text, source="builtin", path=None):
+        return cls(name, _PLACEHOLDER.split(text), source, path)
+
+    def render(self, **variables):
+        missing = self.variables - variables.keys()
+        if missing:
+            raise TemplateError(f"Template {self.name} needs {', '.join(sorted(missing))}")
+        segments = self.segments
+        parts = list(segments)
+        for index in range(1, len(parts), 2):
+            parts[index] = str(variables[segments[index]])
+        return "".join(parts)
+
+
+class TemplateRegistry:
+    """Look templates up in the project, user and built-in sources, in that order
+
+    Each name is resolved and compiled once per registry. Templates read
+    from disk are also kept compiled in cache_dir()/templates.json, keyed
+    by path and invalidated when the file's mtime or size changes.
+    """
+
+    def __init__(self, project_root=None):
+        self.project_root = Path(project_root) if project_root is not None else None
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def sources(self):
+        """Return (label, directory) pairs searched before the built-in templates"""
+        sources = []
+        if self.project_root is not None:
+            sources.append(("project", self.project_root / PROJECT_TEMPLATES_DIR))
+        sources.append(("user", config_dir() / "templates"))
+        return sources
+
+    def get(self, name):
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(name)
+                if compiled is None:
+                    compiled = self._compiled[name] = self._resolve(name)
+        return compiled
+
+    def render(self, template_name, /, **variables):
+        return self.get(template_name).render(**variables)
+
+    def list_templates(self):
+        """Return every visible template as (name, source, path), winners only"""
+        names = set(BUILTIN_TEMPLATES)
+        for _, directory in self.sources():
+            try:
+                names.update(entry.name for entry in os.scandir(directory)
+                             if entry.is_file() and not entry.name.startswith("."))
+            except OSError:
+                pass
+        templates = []
+        for name in sorted(names):
+            compiled = self.get(name)
+            templates.append((name, compiled.source, compiled.path))
+        return templates
+
+    def _resolve(self, name):
+        for label, directory in self.sources():
+            path = directory / name
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            return _compile_file(name, path, stat, label)
+
+        if name in BUILTIN_TEMPLATES:
+            return CompiledTemplate.compile(name, BUILTIN_TEMPLATES[name])
+        raise TemplateError(f"No template named {name}")
+
+
+def get_registry(project_root=None):
+    """Return the shared registry for a project (or for no project)"""
+    key = str(Path(project_root).resolve()) if project_root is not None else None
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = TemplateRegistry(project_root)
+        return registry
+
+
+def builtin_registry():
+    """Return a registry of only the templates shipped with svelte-pi"""
+    with _registries_lock:
+        registry = _registries.get("builtin")
+        if registry is None:
+            registry = _registries["builtin"] = _BuiltinRegistry()
+        return registry
+
+
+def reset_registries(keep_compiled=False):
+    """Forget resolved templates so template directories are looked at again
+
+    With keep_compiled, compiled file templates stay in memory and are
+    reused as long as their mtime and size match, so the next lookup costs
+    a few stat calls rather than a read and parse.
+    """
+    global _disk_cache
+    with _registries_lock:
+        _registries.clear()
+    if not keep_compiled:
+        with _disk_cache_lock:
+            _disk_cache = None
+
+
+class _BuiltinRegistry(TemplateRegistry):
+    """A registry that ignores template directories"""
+
+    def sources(self):
+        return []
+
+
+# On-disk compiled cache: template path -> [mtime_ns, size, segments]
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+
+def _compile_file(name, path, stat, source):
+    global _disk_cache
+    key = str(path)
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            _disk_cache = _load_disk_cache()
+        cached = _disk_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return CompiledTemplate(name, cached[2], source, path)
+
+        compiled = CompiledTemplate.compile(name, Path(path).read_text(), source, path)
+        _disk_cache.pop(key, None)
+        _disk_cache[key] = [stat.st_mtime_ns, stat.st_size, compiled.segments]
+        _save_disk_cache(_disk_cache)
+        return compiled
+
+
+def _cache_file():
+    return cache_dir() / "templates.json"
+
+
+def _load_disk_cache():
+    try:
+        data = json.loads(_cache_file().read_text())
+        return data["templates"] if data.get("version") == CACHE_VERSION else {}
+    except (OSError, ValueError, KeyError, AttributeError):
+        return {}
+
+
+def _save_disk_cache(entries):
+    # Oldest entries go first; refreshed entries are re-inserted at the end
+    while len(entries) > MAX_CACHED_TEMPLATES:
+        del entries[next(iter(entries))]
+
+    cache_file = _cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        temp_file.write_text(json.dumps({"version": CACHE_VERSION, "templates": entries}))
+        os.replace(temp_file, cache_file)
+    except OSError:
+        # The cache is an optimization only
+        pass
@@ -0,0 +1,121 @@
+# toolchain.py
+import json
+import os
+import shutil
+
+from .console import console, print_error
+from .paths import cache_dir, config_dir
+from .process_runner import print_failure_tail, run_streaming
+
+# The sv release svelte-pi scaffolds with, unless `toolchain update --version` pinned another
+SV_VERSION = "0.9.6"
+
+
+def tools_dir():
+    return cache_dir() / "tools"
+
+
+def pin_file():
+    return config_dir() / "toolchain.json"
+
+
+def sv_version():
+    """The pinned sv version: the one recorded by `toolchain update`, else SV_VERSION"""
+    try:
+        return json.loads(pin_file().read_text())["sv"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return SV_VERSION
+
+
+def sv_install_dir(version=None):
+    return tools_dir() / f"sv-{version or sv_version()}"
+
+
+def sv_binary(version=None):
+    return sv_install_dir(version) / "node_modules" / ".bin" / "sv"
+
+
+def sv_command():
+    """The command that runs the pinned sv
+
+    The first call installs sv into the tool cache; every later call runs
+    that binary directly, with no package resolution and no registry
+    access. If the install fails (no npm, offline on first use) the
+    pinned version is run through `npx --yes` instead.
+    """
+    version = sv_version()
+    binary = sv_binary(version)
+    if binary.exists() or install_sv(version):
+        return [str(binary)]
+
+    console.print(f"[yellow]Running sv {version} through npx instead "
+                  f"(run `svelte-pi toolchain update` to retry the install)[/yellow]")
+    return ["npx", "--yes", f"sv@{version}"]
+
+
+def install_sv(version=None, force=False):
+    """Install a version of sv into the tool cache; returns True on success
+
+    npm installs into a staging directory that is renamed into place once
+    the binary is there, so concurrent creates never run a half-installed
+    sv. With force an existing install is replaced.
+    """
+    version = version or sv_version()
+    target = sv_install_dir(version)
+    if sv_binary(version).exists() and not force:
+        return True
+
+    console.print(f"[cyan]Installing sv {version} into the tool cache...[/cyan]")
+    staging = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+
+    try:
+        staging.mkdir(parents=True, exist_ok=True)
+        cmd = ["npm", "install", "--prefix", str(staging), "--no-audit", "--no-fund", f"sv@{version}"]
+        result = run_streaming(cmd, cwd=staging, label=f"npm install sv@{version}")
+        if not result.ok:
+            print_error(f"Error installing sv {version}:")
+            print_failure_tail(result)
+            return False
+        if not (staging / "node_modules" / ".bin" / "sv").exists():
+            print_error(f"Error installing sv {version}: npm did not install an sv binary")
+            return False
+
+        # Replaced on purpose, or left without a binary by an interrupted install
+        if target.exists() and (force or not sv_binary(version).exists()):
+            retired = target.with_name(f"{target.name}.old-{os.getpid()}")
+            target.rename(retired)
+            shutil.rmtree(retired, ignore_errors=True)
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another process finished the same install first
+            if not target.exists():
+                raise
+        console.print(f"[green]✓[/green] sv {version} installed")
+        return True
+
+    except Exception as e:
+        print_error(f"Error installing sv {version}:")
+        print_error(f"{str(e)}")
+        return False
+
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def update_toolchain(version=None):
+    """Reinstall the pinned sv, or install and pin `version`; returns True on success"""
+    version = version or sv_version()
+    if not install_sv(version, force=True):
+        return False
+
+    if version != sv_version():
+        path = pin_file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"sv": version}, indent=2) + "\n")
+
+    # Installs for versions that are no longer pinned
+    for entry in tools_dir().glob("sv-*"):
+        if entry.name != f"sv-{version}" and ".tmp-" not in entry.name:
+            shutil.rmtree(entry, ignore_errors=True)
+    return True
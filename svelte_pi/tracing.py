@@ -0,0 +1,170 @@
+# tracing.py
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_events = []
+_sinks = []
+_lock = threading.Lock()
+_active = threading.local()
+
+
+@contextmanager
+def trace_step(name, category="step", **args):
+    """Record wall time, CPU time and peak RSS for a block of work
+
+    Yields a dict that the block can add details to (for example the files
+    it wrote). Child CPU time comes from RUSAGE_CHILDREN, which only
+    counts children that have been waited for; when steps run
+    concurrently, a child finishing during one step may be attributed to
+    another. Peak RSS is a high-water mark for the process and its
+    children, not a per-step delta.
+    """
+    details = dict(args)
+    status = "ok"
+    started_us = time.time_ns() // 1000
+    started = time.perf_counter()
+    cpu_before = time.process_time()
+    children_before = _children_cpu()
+
+    stack = _active.__dict__.setdefault("stack", [])
+    stack.append(details)
+    try:
+        yield details
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        stack.pop()
+        # Files and errors also belong to the enclosing step
+        if stack:
+            for key in ("files", "errors"):
+                if key in details:
+                    stack[-1].setdefault(key, []).extend(details[key])
+        wall = time.perf_counter() - started
+        details.update({
+            "status": details.get("status", status),
+            "wall_s": round(wall, 6),
+            "cpu_s": round(time.process_time() - cpu_before, 6),
+            "child_cpu_s": round(_children_cpu() - children_before, 6),
+            "peak_rss_kb": _peak_rss_kb(),
+        })
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": started_us,
+            "dur": int(wall * 1_000_000),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": details,
+        }
+        with _lock:
+            _events.append(event)
+            sinks = list(_sinks)
+        for sink in sinks:
+            sink(event)
+
+
+def record_files(*paths):
+    """Attach written files to the innermost step running in this thread"""
+    stack = getattr(_active, "stack", None)
+    if stack:
+        stack[-1].setdefault("files", []).extend(str(path) for path in paths)
+
+
+def record_error(message):
+    """Attach an error message to the innermost step running in this thread
+
+    Returns False when no step is running.
+    """
+    stack = getattr(_active, "stack", None)
+    if not stack:
+        return False
+    stack[-1].setdefault("errors", []).append(message)
+    return True
+
+
+def add_trace_sink(sink):
+    """Call sink(event) for every event as soon as it is recorded"""
+    with _lock:
+        if sink not in _sinks:
+            _sinks.append(sink)
+
+
+def remove_trace_sink(sink):
+    with _lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def trace_events():
+    """Return a copy of every event recorded in this process"""
+    with _lock:
+        return list(_events)
+
+
+def add_trace_events(events):
+    """Merge events recorded elsewhere (e.g. in worker processes)"""
+    with _lock:
+        _events.extend(events)
+
+
+def reset_trace():
+    with _lock:
+        _events.clear()
+
+
+def write_chrome_trace(path, events=None):
+    """Write events in Chrome trace-event format (chrome://tracing, Perfetto)"""
+    import platform
+    from . import __version__
+
+    events = trace_events() if events is None else events
+
+    # Small, stable thread ids read better in trace viewers than raw idents
+    thread_ids = {}
+    trace = []
+    for event in sorted(events, key=lambda event: event["ts"]):
+        key = (event["pid"], event["tid"])
+        thread_ids.setdefault(key, len(thread_ids) + 1)
+        trace.append(dict(event, tid=thread_ids[key]))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "traceEvents": trace,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "svelte_pi": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+    }, indent=1))
+    return path
+
+
+def _children_cpu():
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    if os.uname().sysname == "Darwin":
+        peak //= 1024
+    return peak
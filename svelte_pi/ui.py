@@ -1,8 +1,5 @@
 # ui.py
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-
-console = Console()
+from .console import console, get_console
 
 
 def show_welcome():
@@ -16,10 +13,12 @@ def show_welcome():
 
 def get_project_name():
     """Get the project name from user"""
+    from rich.prompt import Prompt
+
     while True:
         project_name = Prompt.ask(
             "[light_steel_blue1]What’s the name of your project?[/light_steel_blue1]",
-            console=console
+            console=get_console()
         )
 
         if project_name.strip():
@@ -31,22 +30,26 @@ def get_project_name():
 
 def ask_reset_css():
     """Ask if user wants to include reset.css"""
+    from rich.prompt import Confirm
+
     return Confirm.ask(
         "[powder_blue]Do you want to include reset.css?[/powder_blue]",
         default=True,
-        console=console
+        console=get_console()
     )
 
 
 def get_parent_directory():
     """Get the parent directory where the project should be created"""
     import os
+    from rich.prompt import Prompt
+
     default_dir = os.path.expanduser("~/dev")
 
     parent_dir = Prompt.ask(
         "[light_salmon1]Where should the project be created?[/light_salmon1]",
         default=default_dir,
-        console=console
+        console=get_console()
     )
 
     console.print(f"[khaki1]Directory set: {parent_dir}[/khaki1]")
@@ -65,3 +68,87 @@ def show_summary(project_name, use_reset_css, parent_dir):
     reset_status = "Yes" if use_reset_css else "No"
     console.print(f"[grey89]Project: {project_name}, Reset CSS: {reset_status}, Directory: {parent_dir}[/grey89]")
     console.print("[light_sea_green]All ready to launch.[/light_sea_green]")
+
+
+def show_component_summary(results):
+    """Show one table summarizing a bulk component run"""
+    from rich.table import Table
+
+    table = Table(title="Components")
+    table.add_column("Component")
+    table.add_column("Files", justify="right")
+    table.add_column("Status")
+
+    failures = 0
+    unchanged = 0
+    for component_path, created_files, error in results:
+        if error:
+            failures += 1
+            status = f"[red]✗ {error}[/red]"
+        elif not created_files:
+            unchanged += 1
+            status = "[dim]unchanged[/dim]"
+        else:
+            status = "[green]✓[/green]"
+        table.add_row(component_path, str(len(created_files)), status)
+
+    console.print(table)
+    console.print(f"[pale_green1]Created {len(results) - failures} of {len(results)} components[/pale_green1]")
+    if unchanged:
+        console.print(f"[dim]{unchanged} already up to date[/dim]")
+    return failures == 0
+
+
+def show_create_plan(rows, estimate):
+    """Show the steps a create would run with their predicted durations"""
+    from rich.table import Table
+
+    table = Table(title="Create plan")
+    table.add_column("Step")
+    table.add_column("Waits for")
+    table.add_column("Median", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Runs", justify="right")
+
+    for row in rows:
+        prediction = row["prediction"]
+        if row["done"]:
+            timing = ("[dim]done[/dim]", "[dim]-[/dim]", "[dim]journal[/dim]")
+        elif prediction is None:
+            timing = ("[dim]?[/dim]", "[dim]?[/dim]", "0")
+        else:
+            timing = (f"{prediction['median']:.1f}s", f"{prediction['p95']:.1f}s", str(prediction["runs"]))
+        table.add_row(row["step"], ", ".join(row["needs"]) or "-", *timing)
+
+    console.print(table)
+    console.print(f"[pale_green1]Estimated time: {estimate['median']:.1f}s "
+                  f"(p95 {estimate['p95']:.1f}s)[/pale_green1]")
+    if estimate["unknown"]:
+        console.print(f"[dim]No history yet for: {', '.join(estimate['unknown'])}[/dim]")
+
+
+def show_fleet_summary(results, report_path):
+    """Show one table summarizing a multi-project create"""
+    from rich.table import Table
+
+    table = Table(title="Projects")
+    table.add_column("Project")
+    table.add_column("Reset CSS")
+    table.add_column("Time", justify="right")
+    table.add_column("Status")
+    table.add_column("Log")
+
+    failures = 0
+    for result in results:
+        if result["status"] == "ok":
+            status = "[green]✓[/green]"
+        else:
+            failures += 1
+            status = f"[red]✗ {result['error'] or 'failed'}[/red]"
+        table.add_row(result["path"], "Yes" if result["reset_css"] else "No",
+                      f"{result['duration']:.1f}s", status, result["log"])
+
+    console.print(table)
+    console.print(f"[pale_green1]Created {len(results) - failures} of {len(results)} projects[/pale_green1]")
+    console.print(f"[grey89]Report: {report_path}[/grey89]")
+    return failures == 0
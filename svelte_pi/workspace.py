@@ -0,0 +1,125 @@
+# workspace.py
+import fnmatch
+import json
+import re
+from pathlib import Path, PurePosixPath
+
+from .console import console, print_error
+from .write_plan import WritePlan
+
+# Where members go when no --dir is given
+WORKSPACE_APPS_DIR = "apps"
+
+# Declared in a member's package.json instead of `yarn add`, which would
+# run a whole-workspace install per project
+SASS_EMBEDDED_RANGE = "^1.89.0"
+
+_INDENT = re.compile(r"^([ \t]+)\S", re.M)
+
+
+def workspace_member_path(root, project_path):
+    """Return a project's path relative to the workspace root, in posix form
+
+    Raises ValueError when the project is not inside the workspace.
+    """
+    root = Path(root).expanduser().resolve()
+    project_path = Path(project_path).expanduser().resolve()
+    try:
+        relative = project_path.relative_to(root)
+    except ValueError:
+        raise ValueError(f"{project_path} is not inside the workspace {root}")
+    if not relative.parts:
+        raise ValueError(f"The workspace root {root} cannot be a member of itself")
+    return relative.as_posix()
+
+
+def workspace_patterns(package_data):
+    """The `workspaces` globs of a root package.json, in either of yarn's forms"""
+    workspaces = package_data.get("workspaces", [])
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages", [])
+    return list(workspaces)
+
+
+def covers(pattern, relative):
+    """Whether a workspaces glob matches a member path; `*` stays within one directory"""
+    if "**" in pattern:
+        return fnmatch.fnmatchcase(relative, pattern)
+    pattern_parts = PurePosixPath(pattern.rstrip("/")).parts
+    parts = PurePosixPath(relative).parts
+    return len(pattern_parts) == len(parts) and all(
+        fnmatch.fnmatchcase(part, glob) for part, glob in zip(parts, pattern_parts))
+
+
+def add_workspace_members(root, project_paths):
+    """Register projects in the workspace root's package.json
+
+    A root without a package.json becomes a private workspace. A member
+    already matched by one of the `workspaces` globs is left as it is;
+    others are added by path. The file keeps its indentation.
+    """
+    root = Path(root).expanduser()
+    package_json = root / "package.json"
+    console.print(f"[cyan]Registering workspace members in {package_json}...[/cyan]")
+
+    try:
+        members = [workspace_member_path(root, path) for path in project_paths]
+        if package_json.exists():
+            text = package_json.read_text()
+            package_data = json.loads(text)
+            indent = _indent(text)
+        else:
+            package_data = {"name": root.resolve().name, "private": True, "workspaces": []}
+            indent = 2
+
+        patterns = workspace_patterns(package_data)
+        added = []
+        for member in members:
+            if member not in added and not any(covers(pattern, member) for pattern in patterns):
+                added.append(member)
+        patterns += added
+        if isinstance(package_data.get("workspaces"), dict):
+            package_data["workspaces"]["packages"] = patterns
+        else:
+            package_data["workspaces"] = patterns
+        # yarn refuses workspaces in a publishable root
+        package_data["private"] = True
+
+        plan = WritePlan(root)
+        plan.add(package_json, json.dumps(package_data, indent=indent) + "\n")
+        plan.apply()
+        console.print(f"[green]✓[/green] {len(members)} workspace members registered "
+                      f"({len(added)} added to workspaces)")
+        return True
+
+    except Exception as e:
+        print_error(f"Error registering workspace members:")
+        print_error(f"{str(e)}")
+        return False
+
+
+def declare_sass(project_path):
+    """Declare sass-embedded in a member's package.json without installing it"""
+    console.print(f"[cyan]Declaring sass-embedded for the workspace install...[/cyan]")
+
+    try:
+        package_json = Path(project_path) / "package.json"
+        text = package_json.read_text()
+        package_data = json.loads(text)
+        package_data.setdefault("devDependencies", {}).setdefault("sass-embedded", SASS_EMBEDDED_RANGE)
+
+        plan = WritePlan(project_path)
+        plan.add(package_json, json.dumps(package_data, indent=_indent(text)) + "\n")
+        plan.apply()
+        console.print(f"[green]✓[/green] sass-embedded declared")
+        return True
+
+    except Exception as e:
+        print_error(f"Error declaring sass-embedded:")
+        print_error(f"{str(e)}")
+        return False
+
+
+def _indent(text):
+    match = _INDENT.search(text)
+    return match.group(1) if match else "\t"
@@ -0,0 +1,192 @@
+# write_plan.py
+import hashlib
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+from .tracing import trace_step, record_files
+
+CREATE = "create"
+UPDATE = "update"
+UNCHANGED = "unchanged"
+
+
+class WritePlanError(Exception):
+    """A plan could not be staged; no planned file was changed"""
+
+
+class PlannedFile(NamedTuple):
+    path: Path
+    content: bytes
+    action: str
+
+
+class WritePlan:
+    """Files to write, diffed against the disk before anything is touched
+
+    apply() writes only files whose content hash differs from what is on
+    disk. Every changed file is first written to a temp file beside its
+    target; only when all of them are staged are they renamed into place,
+    so a failure while staging leaves the tree as it was.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root is not None else None
+        self._files = {}
+
+    def add(self, path, content):
+        """Plan `content` (str or bytes) for `path`; a later add replaces an earlier one"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self._files[Path(path)] = content
+
+    def __len__(self):
+        return len(self._files)
+
+    def diff(self, max_workers=1):
+        """Return a PlannedFile for every planned path, in the order they were added"""
+        items = list(self._files.items())
+        if max_workers > 1 and len(items) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                actions = list(executor.map(lambda item: _action(*item), items))
+        else:
+            actions = [_action(path, content) for path, content in items]
+        return [PlannedFile(path, content, action) for (path, content), action in zip(items, actions)]
+
+    def describe(self, planned=None):
+        """Return one rich-markup line per planned file"""
+        styles = {CREATE: "green", UPDATE: "yellow", UNCHANGED: "dim"}
+        planned = self.diff() if planned is None else planned
+        return [f"[{styles[entry.action]}]{entry.action:>9}[/{styles[entry.action]}]  {self.relative(entry.path)}"
+                for entry in planned]
+
+    def apply(self, max_workers=1):
+        """Write every changed file; return the full diff
+
+        Raises WritePlanError if any file cannot be staged, after removing
+        the temp files and any directories the plan created.
+        """
+        try:
+            planned = self.diff(max_workers)
+        except OSError as e:
+            raise WritePlanError(f"Could not read {e.filename}: {e.strerror}") from e
+
+        changed = [entry for entry in planned if entry.action != UNCHANGED]
+        if not changed:
+            return planned
+
+        created_dirs = []
+        staged = []
+        try:
+            created_dirs = _make_directories(entry.path.parent for entry in changed)
+            if max_workers > 1 and len(changed) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(self._stage, entry) for entry in changed]
+                    # Collect every result so no temp file is left unrecorded
+                    errors = []
+                    for future in futures:
+                        try:
+                            staged.append(future.result())
+                        except OSError as e:
+                            errors.append(e)
+                    if errors:
+                        raise errors[0]
+            else:
+                for entry in changed:
+                    staged.append(self._stage(entry))
+        except OSError as e:
+            for temp_path, _ in staged:
+                _remove(temp_path)
+            for directory in reversed(created_dirs):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    pass
+            raise WritePlanError(f"Could not write {e.filename or ''}: {e.strerror or e}".strip()) from e
+
+        # Renames within one directory are atomic; nothing is left to fail
+        # but the rename itself
+        for temp_path, target in staged:
+            os.replace(temp_path, target)
+        # Staging may run on pool threads; the caller's step owns the files
+        record_files(*(target for _, target in staged))
+        return planned
+
+    def relative(self, path):
+        if self.root is not None:
+            try:
+                return path.relative_to(self.root)
+            except ValueError:
+                pass
+        return path
+
+    def _stage(self, entry):
+        with trace_step(f"write {self.relative(entry.path)}", category="write"):
+            fd, temp_name = tempfile.mkstemp(dir=entry.path.parent, prefix=f".{entry.path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(entry.content)
+                if entry.action == UPDATE:
+                    mode = stat.S_IMODE(os.stat(entry.path).st_mode)
+                else:
+                    mode = 0o666 & ~_UMASK
+                os.chmod(temp_name, mode)
+            except OSError:
+                _remove(temp_name)
+                raise
+            return temp_name, entry.path
+
+
+def _action(path, content):
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        return CREATE
+    # A size mismatch settles it without reading the file
+    if size != len(content):
+        return UPDATE
+    with open(path, "rb") as handle:
+        on_disk = hashlib.sha256(handle.read()).digest()
+    return UNCHANGED if on_disk == hashlib.sha256(content).digest() else UPDATE
+
+
+def _make_directories(directories):
+    """Create missing directories; return the ones created, parents first"""
+    created = []
+    for directory in sorted(set(directories)):
+        missing = []
+        while not directory.exists():
+            missing.append(directory)
+            directory = directory.parent
+        for path in reversed(missing):
+            try:
+                path.mkdir()
+            except FileExistsError:
+                # Created by a plan running alongside this one, which owns it
+                if not path.is_dir():
+                    raise
+                continue
+            created.append(path)
+    return created
+
+
+def _read_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: os.umask can only be read by setting it, which is
+# not safe once other threads are creating files
+_UMASK = _read_umask()
+
+
+def _remove(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
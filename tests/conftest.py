@@ -0,0 +1,16 @@
+# tests/conftest.py
+import pytest
+
+from svelte_pi.templates import reset_registries
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep every test away from the real ~/.cache/svelte-pi and ~/.config/svelte-pi"""
+    cache = tmp_path / "svelte-pi-cache"
+    monkeypatch.setenv("SVELTE_PI_CACHE_DIR", str(cache))
+    monkeypatch.setenv("SVELTE_PI_CONFIG_DIR", str(tmp_path / "svelte-pi-config"))
+    # Never run the real npx/yarn just to tag timing history
+    monkeypatch.setattr("svelte_pi.history.detect_tool_versions", lambda: {})
+    reset_registries()
+    return cache
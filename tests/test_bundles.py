@@ -0,0 +1,127 @@
+# tests/test_bundles.py
+import io
+import json
+import os
+import tarfile
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.bundles import MANIFEST_FILE, extract_bundle, load_bundle
+
+PACKAGE_JSON = '{\n\t"name": "{{ project_name }}",\n\t"version": "{{bundle_version}}"\n}\n'
+PAGE = "<h1>{{project_name}}</h1>\n<p>{{ unknown }} and {a: {b}}</p>\n"
+
+
+def add_file(archive, name, data, mode=0o644):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    archive.addfile(info, io.BytesIO(data))
+
+
+def make_archive(path, manifest, extra=()):
+    """A .tar.gz with the manifest first, as `svelte-pi` bundles should be packed"""
+    with tarfile.open(path, "w:gz") as archive:
+        add_file(archive, f"starter/{MANIFEST_FILE}", json.dumps(manifest).encode())
+        add_file(archive, "starter/package.json", PACKAGE_JSON.encode())
+        add_file(archive, "starter/src/routes/+page.svelte", PAGE.encode())
+        add_file(archive, "starter/static/favicon.png", b"\x89PNG{{project_name}}")
+        add_file(archive, "starter/scripts/setup.sh", b"#!/bin/sh\n", mode=0o755)
+        for name, data in extra:
+            add_file(archive, name, data)
+    return path
+
+
+class TestBundles:
+    """Test suite for creating projects from local template bundles"""
+
+    def test_archive_is_streamed_with_placeholders(self, tmp_path):
+        """Known placeholders are replaced in text files only; the manifest stays behind"""
+        bundle = load_bundle(make_archive(tmp_path / "starter-1.2.0.tar.gz",
+                                          {"name": "starter", "version": "1.2.0", "post_steps": ["install_sass"]}))
+        assert bundle.prefix == "starter/" and bundle.post_steps == ("install_sass",)
+
+        project = extract_bundle(bundle, tmp_path / "shop", "shop")
+
+        assert json.loads((project / "package.json").read_text()) == {"name": "shop", "version": "1.2.0"}
+        assert (project / "src" / "routes" / "+page.svelte").read_text() == (
+            "<h1>shop</h1>\n<p>{{ unknown }} and {a: {b}}</p>\n")
+        assert (project / "static" / "favicon.png").read_bytes() == b"\x89PNG{{project_name}}"
+        assert os.access(project / "scripts" / "setup.sh", os.X_OK)
+        assert not (project / MANIFEST_FILE).exists()
+
+    def test_members_outside_the_project_are_refused(self, tmp_path):
+        """Path traversal fails the extraction and removes the partial project"""
+        archive = make_archive(tmp_path / "evil.tar.gz", {}, extra=[("starter/../../escaped.txt", b"x")])
+
+        assert extract_bundle(load_bundle(archive), tmp_path / "out" / "app", "app") is None
+
+        assert not (tmp_path / "out" / "app").exists()
+        assert not (tmp_path / "escaped.txt").exists()
+
+        archive = tmp_path / "link.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            add_file(tar, MANIFEST_FILE, b"{}")
+            link = tarfile.TarInfo("home")
+            link.type, link.linkname = tarfile.SYMTYPE, "../.."
+            tar.addfile(link)
+        assert extract_bundle(load_bundle(archive), tmp_path / "out" / "app", "app") is None
+
+    def test_chained_symlinks_cannot_escape(self, tmp_path):
+        """Members are not written through links that only escape once resolved on disk"""
+        archive = tmp_path / "chain.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            add_file(tar, MANIFEST_FILE, b"{}")
+            for name, linkname in (("s", "."), ("t", "s/..")):
+                link = tarfile.TarInfo(name)
+                link.type, link.linkname = tarfile.SYMTYPE, linkname
+                tar.addfile(link)
+            add_file(tar, "t/escaped.txt", b"x")
+
+        assert extract_bundle(load_bundle(archive), tmp_path / "out" / "app", "app") is None
+        assert not (tmp_path / "out" / "escaped.txt").exists()
+        assert not (tmp_path / "out" / "app").exists()
+
+    def test_invalid_bundles(self, tmp_path):
+        """A missing manifest or an unknown post step is reported before anything is created"""
+        (tmp_path / "plain").mkdir()
+        with pytest.raises(ValueError, match="not a bundle"):
+            load_bundle(tmp_path / "plain")
+
+        (tmp_path / "plain" / MANIFEST_FILE).write_text(json.dumps({"post_steps": ["sv_create"]}))
+        with pytest.raises(ValueError, match="Unknown post_steps"):
+            load_bundle(tmp_path / "plain")
+
+    def test_create_from_directory_bundle(self, tmp_path):
+        """A complete bundle runs no post steps, so create needs no toolchain"""
+        source = tmp_path / "kit"
+        (source / "src").mkdir(parents=True)
+        (source / ".git").mkdir()
+        (source / MANIFEST_FILE).write_text(json.dumps({"name": "kit", "version": "3", "post_steps": []}))
+        (source / "package.json").write_text(PACKAGE_JSON)
+        (source / "src" / "app.html").write_text("<title>{{project_name}}</title>\n")
+
+        result = CliRunner().invoke(cli, ['create', '--bundle', str(source), '--name', 'blog',
+                                          '--dir', str(tmp_path), '--no-input'])
+
+        assert result.exit_code == 0, result.output
+        project = tmp_path / "blog"
+        assert (project / "src" / "app.html").read_text() == "<title>blog</title>\n"
+        assert not (project / ".git").exists()
+        assert not (project / "src" / "lib" / "styles").exists()
+        assert "sv_create" not in result.output and "Installing" not in result.output
+
+    def test_zstd_bundle(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        tar_path = make_archive(tmp_path / "starter.tar.gz", {"post_steps": []})
+        with tarfile.open(tar_path) as source, tarfile.open(tmp_path / "starter.tar", "w") as target:
+            for member in source:
+                target.addfile(member, source.extractfile(member))
+        (tmp_path / "starter.tar.zst").write_bytes(
+            zstandard.ZstdCompressor().compress((tmp_path / "starter.tar").read_bytes()))
+
+        project = extract_bundle(load_bundle(tmp_path / "starter.tar.zst"), tmp_path / "z", "z")
+
+        assert json.loads((project / "package.json").read_text())["name"] == "z"
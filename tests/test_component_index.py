@@ -0,0 +1,101 @@
+# tests/test_component_index.py
+import json
+import shutil
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.component_index import ComponentIndex, load_index
+from svelte_pi.file_operations import create_components
+
+
+class TestComponentIndex:
+    """Test suite for the persistent component index"""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_index_is_built_and_refreshed_incrementally(self, project):
+        """Only directories whose mtime changed are scanned again"""
+        components = project / "src" / "lib" / "components"
+        for relative in ("ui/button/Button.svelte", "ui/card/Card.svelte", "layout/Header.svelte"):
+            (components / relative).parent.mkdir(parents=True, exist_ok=True)
+            (components / relative).write_text("")
+
+        index = load_index(project)
+        assert sorted(index.names()) == ["Button", "Card", "Header"]
+        assert (project / ".svelte-pi" / "components.json").exists()
+
+        (components / "ui" / "modal").mkdir()
+        (components / "ui" / "modal" / "Modal.svelte").write_text("")
+        shutil.rmtree(components / "ui" / "card")
+
+        index = ComponentIndex.load(project)
+        with patch.object(ComponentIndex, "_scan", autospec=True, side_effect=ComponentIndex._scan) as scan:
+            assert index.refresh()
+
+        assert sorted(index.names()) == ["Button", "Header", "Modal"]
+        assert sorted(call.args[1] for call in scan.call_args_list) == ["ui", "ui/modal"]
+
+    def test_unchanged_tree_is_not_rescanned(self, project):
+        """A fresh index costs stats only"""
+        create_components(["ui/a", "ui/b"])
+
+        index = ComponentIndex.load(project)
+        with patch.object(ComponentIndex, "_scan") as scan:
+            assert not index.refresh()
+        scan.assert_not_called()
+
+    def test_duplicate_names_are_refused(self, project):
+        """A name already used at another path needs --force"""
+        assert CliRunner().invoke(cli, ['component', 'ui/button']).exit_code == 0
+
+        result = CliRunner().invoke(cli, ['component', 'forms/button'])
+        assert "already exists" in result.output
+        assert not (project / "src" / "lib" / "components" / "forms").exists()
+
+        # Re-running the original path is not a conflict
+        assert "already exists" not in CliRunner().invoke(cli, ['component', 'ui/button']).output
+
+        CliRunner().invoke(cli, ['component', 'forms/button', '--force'])
+        assert (project / "src" / "lib" / "components" / "forms" / "button" / "Button.svelte").exists()
+
+    def test_bulk_collisions_within_the_batch(self, project):
+        """The second path with a name already in the batch is skipped"""
+        results = create_components(["ui/card", "shop/card", "ui/list"])
+
+        errors = {path: error for path, _, error in results}
+        assert errors["ui/card"] is None and errors["ui/list"] is None
+        assert "already exists at ui/card/Card.svelte" in errors["shop/card"]
+
+    def test_list_and_find_commands(self, project):
+        """components list/find read the index"""
+        create_components(["ui/button", "ui/icon-button", "layout/header"])
+
+        result = CliRunner().invoke(cli, ['components', 'find', 'button'])
+        assert result.exit_code == 0, result.output
+        assert "ui/button/Button.svelte" in result.output
+        assert "header" not in result.output
+
+        result = CliRunner().invoke(cli, ['components', 'list'])
+        assert "3 component file(s)" in result.output
+
+    def test_component_list_and_find_spelling(self, project):
+        """`component list/find` run the listings instead of creating components"""
+        create_components(["ui/button", "layout/header"])
+
+        result = CliRunner().invoke(cli, ['component', 'list'])
+        assert result.exit_code == 0, result.output
+        assert "2 component file(s)" in result.output
+        result = CliRunner().invoke(cli, ['component', 'find', 'head'])
+        assert "layout/header/Header.svelte" in result.output and "button" not in result.output
+
+        assert not (project / "src" / "lib" / "components" / "list").exists()
+        assert CliRunner().invoke(cli, ['component', 'list', 'ui/a']).exit_code == 2
+        assert CliRunner().invoke(cli, ['component', 'find']).exit_code == 2
@@ -0,0 +1,100 @@
+# tests/test_components.py
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.file_operations import create_components, load_component_manifest
+
+
+class TestComponentCreation:
+    """Test suite for single and bulk component generation"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.project = self.test_dir / "app"
+        (self.project / "src").mkdir(parents=True)
+        (self.project / "package.json").write_text(json.dumps({
+            "name": "app",
+            "devDependencies": {"@sveltejs/kit": "^2.0.0"}
+        }))
+        self.previous_cwd = os.getcwd()
+        os.chdir(self.project)
+
+    def teardown_method(self):
+        os.chdir(self.previous_cwd)
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_single_component(self):
+        """Direct mode still creates one component"""
+        result = CliRunner().invoke(cli, ['component', 'ui/button'])
+
+        assert result.exit_code == 0, result.output
+        component_dir = self.project / "src" / "lib" / "components" / "ui" / "button"
+        assert (component_dir / "Button.svelte").exists()
+        assert (component_dir / "Button.module.scss").exists()
+
+    def test_modules_use_the_tokens_partial(self):
+        """Module templates @use the tokens partial, which is added to projects that lack it"""
+        result = CliRunner().invoke(cli, ['component', 'ui/button', 'ui/card'])
+
+        assert result.exit_code == 0, result.output
+        scss = (self.project / "src" / "lib" / "components" / "ui" / "card" / "Card.module.scss").read_text()
+        assert scss.startswith("@use '$lib/styles/tokens' as tokens;")
+        tokens = self.project / "src" / "lib" / "styles" / "_tokens.scss"
+        assert "$space-4: 1rem;" in tokens.read_text()
+
+        tokens.write_text("$space-4: 2rem;\n")
+        assert CliRunner().invoke(cli, ['component', 'ui/modal']).exit_code == 0
+        assert tokens.read_text() == "$space-4: 2rem;\n"
+
+    def test_component_from_subdirectory(self):
+        """Components land under the project root even when run from a subdirectory"""
+        nested = self.project / "src" / "routes"
+        nested.mkdir(parents=True)
+        os.chdir(nested)
+
+        result = CliRunner().invoke(cli, ['component', 'ui/button'])
+
+        assert result.exit_code == 0, result.output
+        assert (self.project / "src" / "lib" / "components" / "ui" / "button" / "Button.svelte").exists()
+
+    def test_bulk_components_from_arguments_and_manifest(self):
+        """Paths from arguments and a manifest are created in one run"""
+        manifest = self.test_dir / "components.json"
+        manifest.write_text(json.dumps({"components": ["layout/header", {"path": "ui/modal"}]}))
+
+        result = CliRunner().invoke(cli, ['component', 'ui/button', 'ui/card', '--from', str(manifest)])
+
+        assert result.exit_code == 0, result.output
+        components = self.project / "src" / "lib" / "components"
+        for relative in ("ui/button/Button", "ui/card/Card", "layout/header/Header", "ui/modal/Modal"):
+            assert (components / f"{relative}.svelte").exists()
+            assert (components / f"{relative}.module.scss").exists()
+        assert "Created 4 of 4 components" in result.output
+
+    def test_bulk_results_keep_order_and_drop_duplicates(self):
+        """Each distinct path is reported once, in input order"""
+        results = create_components(["ui/a", "ui/b", "ui/a/"])
+
+        assert [path for path, _, _ in results] == ["ui/a", "ui/b"]
+        assert all(error is None and len(files) == 2 for _, files, error in results)
+
+    def test_bulk_outside_project(self):
+        """Bulk generation refuses to run outside a SvelteKit project"""
+        os.chdir(self.test_dir)
+        assert create_components(["ui/a", "ui/b"]) is None
+
+    def test_manifest_rejects_bad_entries(self):
+        """Manifest entries must be non-empty paths"""
+        manifest = self.test_dir / "bad.json"
+        manifest.write_text(json.dumps(["ui/a", 3]))
+
+        with pytest.raises(ValueError):
+            load_component_manifest(manifest)
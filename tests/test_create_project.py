@@ -3,11 +3,12 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from click.testing import CliRunner
 
 from svelte_pi.main import cli
 from svelte_pi.project_setup import create_sveltekit_project
+from svelte_pi.process_runner import RunResult
 from svelte_pi.file_operations import create_reset_css, update_app_html
 
 
@@ -30,18 +31,12 @@ class TestProjectCreation:
         runner = CliRunner()
 
         # Mock all the file operations that need real structure
-        with patch('svelte_pi.project_setup.subprocess.Popen') as mock_popen, \
-                patch('svelte_pi.project_setup.subprocess.run') as mock_run, \
-                patch('svelte_pi.file_operations.create_reset_css') as mock_reset, \
-                patch('svelte_pi.file_operations.update_app_html') as mock_update:
-            # Mock the sv create command
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = ("Success", "")
-            mock_popen.return_value = mock_process
-
-            # Mock other operations to return success
-            mock_run.return_value = MagicMock(returncode=0)
+        with patch('svelte_pi.project_setup.run_streaming') as mock_run, \
+                patch('svelte_pi.project_setup.sv_command', return_value=["/tools/sv"]), \
+                patch('svelte_pi.create_pipeline.create_reset_css') as mock_reset, \
+                patch('svelte_pi.create_pipeline.update_app_html') as mock_update:
+            # Mock sv create, sv add and yarn add
+            mock_run.return_value = RunResult(0, ["Success"], self.test_dir / "run.log")
             mock_reset.return_value = True
             mock_update.return_value = True
 
@@ -55,7 +50,9 @@ class TestProjectCreation:
             assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
             # Verify at least the main subprocess was called
-            mock_popen.assert_called_once()  # sv create was called
+            first_cmd = mock_run.call_args_list[0][0][0]
+            assert first_cmd[:2] == ["/tools/sv", "create"]  # the pinned sv was called directly
+            assert mock_run.call_args_list[0][1].get("input") is None
 
             # Don't be too strict about the other calls since the flow might exit early
             # The important thing is that the command completed successfully
@@ -65,12 +62,10 @@ class TestProjectCreation:
         project_name = "simple-test"
 
         # Just test our project setup function with mocked subprocess
-        with patch('svelte_pi.project_setup.subprocess.Popen') as mock_popen:
+        with patch('svelte_pi.project_setup.run_streaming') as mock_run, \
+                patch('svelte_pi.project_setup.sv_command', return_value=["/tools/sv"]):
             # Mock successful sv create
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = ("Success", "")
-            mock_popen.return_value = mock_process
+            mock_run.return_value = RunResult(0, ["Success"], self.test_dir / "run.log")
 
             # Manually create what sv create would make (just the basics)
             expected_project_path = self.test_dir / project_name
@@ -154,7 +149,7 @@ class TestProjectCreation:
         """Test behavior when target directory doesn't exist or is invalid"""
         invalid_dir = "/definitely/does/not/exist/anywhere"
 
-        with patch('svelte_pi.project_setup.subprocess.Popen') as mock_popen:
+        with patch('svelte_pi.process_runner.subprocess.Popen') as mock_popen:
             # Mock subprocess to fail due to invalid directory
             mock_popen.side_effect = FileNotFoundError("Directory not found")
 
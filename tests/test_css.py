@@ -0,0 +1,23 @@
+# tests/test_css.py
+from svelte_pi.css import minify_css
+from svelte_pi.file_templates import RESET_CSS_CONTENT
+
+
+class TestMinifyCss:
+    """Test suite for the stylesheet minifier used to inline the reset"""
+
+    def test_minifies_the_reset(self):
+        """Comments and layout whitespace go; rules and values stay"""
+        minified = minify_css(RESET_CSS_CONTENT)
+
+        assert len(minified) < len(RESET_CSS_CONTENT) / 2
+        assert "/*" not in minified and "\n" not in minified
+        assert minified.startswith("*,*::before,*::after{box-sizing:border-box}")
+        assert "@media (prefers-reduced-motion:reduce){html{scroll-behavior:auto}" in minified
+        assert "font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto" in minified
+
+    def test_strings_and_descendant_pseudo_classes_are_kept(self):
+        """Whitespace that changes meaning survives"""
+        assert minify_css('a::after { content: "  /* not a comment */ " ; }') == 'a::after{content:"  /* not a comment */ "}'
+        assert minify_css("nav  > a :hover { color : red; }") == "nav>a :hover{color :red}"
+        assert minify_css("a { width: calc(100% - 2rem) }") == "a{width:calc(100% - 2rem)}"
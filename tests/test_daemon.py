@@ -0,0 +1,88 @@
+# tests/test_daemon.py
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from svelte_pi.client import main as client_main, needs_terminal, send_request
+from svelte_pi.daemon import Daemon, daemon_status, stop_daemon
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestDaemon:
+    """Test suite for the warm daemon and its thin client"""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project = tmp_path / "app"
+        (project / "src").mkdir(parents=True)
+        (project / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        return project
+
+    @pytest.fixture
+    def daemon(self, tmp_path, monkeypatch):
+        socket_file = tmp_path / "d.sock"
+        monkeypatch.setenv("SVELTE_PI_SOCKET", str(socket_file))
+        daemon = Daemon(socket_file, idle_timeout=0)
+        thread = threading.Thread(target=daemon.serve, daemon=True)
+        thread.start()
+        for _ in range(200):
+            if daemon_status() is not None:
+                break
+            time.sleep(0.01)
+        yield daemon
+        stop_daemon()
+        thread.join(timeout=5)
+
+    def test_component_request_runs_in_the_daemon(self, daemon, project, capsys, monkeypatch):
+        """The client forwards the command and prints the daemon's output"""
+        monkeypatch.chdir(project)
+
+        exit_code = client_main(["component", "ui/button", "ui/card"])
+
+        assert exit_code == 0
+        assert daemon.requests == 1
+        assert "Created 2 of 2 components" in capsys.readouterr().out
+        assert (project / "src" / "lib" / "components" / "ui" / "card" / "Card.svelte").exists()
+
+    def test_failures_come_back_as_exit_codes(self, daemon, tmp_path):
+        """Running outside a project reports the error and a non-zero code from patch"""
+        reply = send_request({"command": "run", "argv": ["patch", "--vite-scss"], "cwd": str(tmp_path)})
+
+        assert reply["exit_code"] == 1
+        assert "Not in a SvelteKit project" in reply["output"]
+
+    def test_unserved_commands_fall_back(self, daemon, tmp_path):
+        """create and the interactive wizard are never run by the daemon"""
+        for argv in (["create", "--name", "x"], ["component"]):
+            reply = send_request({"command": "run", "argv": argv, "cwd": str(tmp_path)})
+            assert "fallback" in reply
+
+        assert needs_terminal(["component", "--trace", "t.json"])
+        assert not needs_terminal(["component", "--from", "c.json"])
+        assert daemon.requests == 0
+
+    def test_client_runs_in_process_without_daemon(self, project, tmp_path, monkeypatch):
+        """With no daemon listening the client still does the work"""
+        monkeypatch.setenv("SVELTE_PI_SOCKET", str(tmp_path / "missing.sock"))
+        monkeypatch.chdir(project)
+
+        with pytest.raises(SystemExit) as exit_info:
+            client_main(["component", "ui/a"])
+
+        assert exit_info.value.code == 0
+        assert (project / "src" / "lib" / "components" / "ui" / "a" / "A.svelte").exists()
+
+    def test_client_imports_only_the_standard_library(self):
+        """Loading the client does not import click or rich"""
+        script = ("import sys, svelte_pi.client\n"
+                  "print(sorted(m for m in sys.modules if m.split('.')[0] in ('click', 'rich')))")
+        result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
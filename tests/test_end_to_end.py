@@ -0,0 +1,136 @@
+# tests/test_end_to_end.py
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FAKE_TOOLCHAIN = REPO_ROOT / "benchmarks" / "fake_toolchain"
+
+
+@pytest.mark.integration
+class TestEndToEnd:
+    """Test suite running the real CLI against the offline fake toolchain"""
+
+    def setup_method(self):
+        self.env = dict(os.environ,
+                        PATH=os.pathsep.join([str(FAKE_TOOLCHAIN), os.environ.get("PATH", "")]),
+                        PYTHONPATH=str(REPO_ROOT),
+                        FAKE_TOOLCHAIN_LATENCY="0",
+                        FAKE_TOOLCHAIN_LINES="200",
+                        FAKE_TOOLCHAIN_PACKAGES="5")
+
+    def run_cli(self, *args, cwd):
+        return subprocess.run([sys.executable, "-m", "svelte_pi.main", *args], cwd=cwd, env=self.env,
+                              stdin=subprocess.DEVNULL, capture_output=True, text=True)
+
+    def test_create_then_component(self, tmp_path):
+        """create scaffolds, installs and styles a project; component writes into it"""
+        result = self.run_cli("create", "--name", "demo", "--reset", "--dir", str(tmp_path), "--no-input",
+                              cwd=tmp_path)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        project = tmp_path / "demo"
+        package_data = json.loads((project / "package.json").read_text())
+        assert "sass-embedded" in package_data["devDependencies"]
+        assert "prettier" in package_data["devDependencies"]
+        assert (project / "node_modules" / "fake-dep-0000" / "lib" / "index.js").exists()
+        assert (project / "src" / "lib" / "styles" / "reset.css").exists()
+        assert "reset.css" in (project / "src" / "app.html").read_text()
+        assert (project / "src" / "lib" / "styles" / "_tokens.scss").exists()
+
+        result = self.run_cli("component", "ui/button", cwd=project)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert (project / "src" / "lib" / "components" / "ui" / "button" / "Button.svelte").exists()
+
+    def test_reset_modes_skip_the_stylesheet_request(self, tmp_path):
+        """inline puts the minified reset in app.html; layout imports it from the root layout"""
+        for mode in ("inline", "layout"):
+            result = self.run_cli("create", "--name", mode, "--reset", "--reset-mode", mode, "--dir", str(tmp_path),
+                                  "--no-input", cwd=tmp_path)
+            assert result.returncode == 0, result.stdout + result.stderr
+
+        app_html = (tmp_path / "inline" / "src" / "app.html").read_text()
+        assert '<style id="reset-css">*,*::before,*::after{box-sizing:border-box}' in app_html
+        assert 'rel="stylesheet"' not in app_html
+        assert not (tmp_path / "inline" / "src" / "lib" / "styles" / "reset.css").exists()
+
+        project = tmp_path / "layout"
+        assert "reset.css" not in (project / "src" / "app.html").read_text()
+        assert "import '$lib/styles/reset.css';" in (project / "src" / "routes" / "+layout.svelte").read_text()
+        assert (project / "src" / "lib" / "styles" / "reset.css").exists()
+
+    def test_bundle_runs_only_its_post_steps(self, tmp_path):
+        """A bundle skips sv create and runs the steps its manifest asks for"""
+        bundle = tmp_path / "starter"
+        (bundle / "src").mkdir(parents=True)
+        (bundle / "svelte-pi.bundle.json").write_text(json.dumps({"post_steps": ["add_prettier", "install_sass"]}))
+        (bundle / "package.json").write_text(json.dumps({"name": "{{project_name}}", "scripts": {},
+                                                         "devDependencies": {"@sveltejs/kit": "^2.0.0"}}))
+
+        result = self.run_cli("create", "--bundle", str(bundle), "--name", "shop", "--dir", str(tmp_path),
+                              "--no-input", cwd=tmp_path)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Creating SvelteKit project" not in result.stdout
+        package_data = json.loads((tmp_path / "shop" / "package.json").read_text())
+        assert package_data["name"] == "shop"
+        assert {"prettier", "sass-embedded"} <= set(package_data["devDependencies"])
+        assert not (tmp_path / "shop" / "src" / "lib" / "styles" / "reset.css").exists()
+
+    def test_workspace_members_share_the_root_install(self, tmp_path):
+        """--workspace registers each app and installs everything hoisted at the root"""
+        root = tmp_path / "mono"
+        for name in ("shop", "admin"):
+            result = self.run_cli("create", "--name", name, "--no-reset", "--workspace", str(root), "--no-input",
+                                  cwd=tmp_path)
+            assert result.returncode == 0, result.stdout + result.stderr
+
+        package_data = json.loads((root / "package.json").read_text())
+        assert package_data["workspaces"] == ["apps/shop", "apps/admin"]
+        member = json.loads((root / "apps" / "shop" / "package.json").read_text())
+        assert {"prettier", "sass-embedded"} <= set(member["devDependencies"])
+        assert (root / "node_modules" / "sass-embedded" / "package.json").exists()
+        assert (root / "yarn.lock").exists()
+        assert not (root / "apps" / "shop" / "node_modules").exists()
+        assert not (root / "apps" / "shop" / "yarn.lock").exists()
+
+    def test_failed_install_reports_output_tail(self, tmp_path):
+        """A failing tool leaves its output tail on screen"""
+        self.env["FAKE_TOOLCHAIN_FAIL"] = "yarn"
+
+        result = self.run_cli("create", "--name", "demo", "--no-reset", "--dir", str(tmp_path), "--no-input",
+                              "--no-cache", cwd=tmp_path)
+
+        assert "simulated failure" in result.stdout
+
+    def test_resume_after_failed_install(self, tmp_path):
+        """--resume continues from the failed step without re-running sv create"""
+        self.env["FAKE_TOOLCHAIN_FAIL"] = "yarn"
+        args = ("create", "--name", "demo", "--reset", "--dir", str(tmp_path), "--no-input", "--no-cache")
+        result = self.run_cli(*args, cwd=tmp_path)
+        assert "--resume" in result.stdout
+
+        del self.env["FAKE_TOOLCHAIN_FAIL"]
+        result = self.run_cli(*args, "--resume", cwd=tmp_path)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "sv_create already done" in result.stdout
+        assert "Creating SvelteKit project" not in result.stdout
+        assert (tmp_path / "demo" / "node_modules" / "fake-dep-0000").is_dir()
+        assert (tmp_path / "demo" / "src" / "lib" / "styles" / "reset.css").exists()
+
+    def test_second_create_installs_from_the_lockfile_seed(self, tmp_path):
+        """The first install saves a seed; the next create skips resolution"""
+        for name in ("first", "second"):
+            result = self.run_cli("create", "--name", name, "--no-reset", "--dir", str(tmp_path), "--no-input",
+                                  "--no-cache", cwd=tmp_path)
+            assert result.returncode == 0, result.stdout + result.stderr
+
+        assert "from the lockfile seed" in result.stdout
+        assert (tmp_path / "second" / "yarn.lock").read_text() == (tmp_path / "first" / "yarn.lock").read_text()
+        assert (tmp_path / "second" / "node_modules" / "sass-embedded").is_dir()
@@ -0,0 +1,163 @@
+# tests/test_fleet.py
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.fleet import load_fleet_spec, scaffold_project
+
+
+class TestFleet:
+    """Test suite for non-interactive and multi-project creation"""
+
+    def test_spec_defaults_and_overrides(self, tmp_path):
+        """Projects inherit defaults unless they override them"""
+        spec = tmp_path / "cohort.json"
+        spec.write_text(json.dumps({
+            "defaults": {"parent_dir": str(tmp_path / "apps"), "reset_css": False},
+            "projects": ["alpha", {"name": "beta", "reset_css": True, "reset_mode": "inline"}],
+        }))
+
+        projects = load_fleet_spec(spec)
+
+        assert projects == [
+            {"name": "alpha", "parent_dir": str(tmp_path / "apps"), "reset_css": False, "reset_mode": "link",
+             "perf": False},
+            {"name": "beta", "parent_dir": str(tmp_path / "apps"), "reset_css": True, "reset_mode": "inline",
+             "perf": False},
+        ]
+
+    def test_spec_rejects_duplicates(self, tmp_path):
+        """The same target directory cannot be listed twice"""
+        spec = tmp_path / "cohort.json"
+        spec.write_text(json.dumps({"defaults": {"parent_dir": str(tmp_path)}, "projects": ["a", "a"]}))
+
+        with pytest.raises(ValueError):
+            load_fleet_spec(spec)
+
+    def test_scaffold_project_logs_to_its_own_file(self, tmp_path):
+        """A worker writes its output to the project log and reports a result"""
+        log_path = tmp_path / "alpha.log"
+        task = {"name": "alpha", "parent_dir": str(tmp_path), "reset_css": True, "reset_mode": "link", "perf": False,
+                "use_cache": False, "use_store": False, "jobs": 2, "log_path": str(log_path)}
+
+        def fake_pipeline(name, parent_dir, use_reset_css, use_cache, jobs, use_store, reset_mode, perf, workspace,
+                          join_workspace):
+            from svelte_pi.console import console
+            console.print("scaffolding alpha")
+            return os.path.join(parent_dir, name)
+
+        with patch("svelte_pi.create_pipeline.run_create_pipeline", side_effect=fake_pipeline):
+            result = scaffold_project(task)
+
+        assert result["status"] == "ok"
+        assert result["path"] == str(tmp_path / "alpha")
+        assert "scaffolding alpha" in log_path.read_text()
+
+    def test_spec_falls_back_to_command_line_flags(self, tmp_path):
+        """--dir, --no-reset, --reset-mode and --perf fill what the spec leaves unset"""
+        spec = tmp_path / "cohort.json"
+        spec.write_text(json.dumps({"defaults": {"reset_mode": "layout"},
+                                    "projects": ["a", {"name": "b", "perf": False}]}))
+        created = []
+
+        def fake_fleet(projects, workers, jobs, use_cache, use_store, workspace):
+            created.extend(projects)
+            return [dict(project, path=os.path.join(project["parent_dir"], project["name"]), status="ok",
+                         error=None, duration=0.1, log=str(tmp_path / f"{project['name']}.log"))
+                    for project in projects]
+
+        with patch("svelte_pi.fleet.run_fleet", side_effect=fake_fleet):
+            result = CliRunner().invoke(cli, ['create', '--spec', str(spec), '--dir', str(tmp_path / "out"),
+                                              '--no-reset', '--reset-mode', 'inline', '--perf'])
+
+        assert result.exit_code == 0, result.output
+        assert created == [
+            {"name": "a", "parent_dir": str(tmp_path / "out"), "reset_css": False, "reset_mode": "layout",
+             "perf": True},
+            {"name": "b", "parent_dir": str(tmp_path / "out"), "reset_css": False, "reset_mode": "layout",
+             "perf": False},
+        ]
+
+    def test_in_process_project_emits_no_step_events(self, tmp_path, capsys):
+        """Under --json the cache-warming project reports only through its result"""
+        from svelte_pi.console import restore_output_mode, set_output_mode
+        from svelte_pi.tracing import trace_step
+
+        task = {"name": "alpha", "parent_dir": str(tmp_path), "reset_css": True, "reset_mode": "link", "perf": False,
+                "use_cache": True, "use_store": False, "jobs": 2, "log_path": str(tmp_path / "alpha.log")}
+
+        def fake_pipeline(name, parent_dir, *args, **kwargs):
+            with trace_step("sv_create"):
+                pass
+            return os.path.join(parent_dir, name)
+
+        previous = set_output_mode("json")
+        try:
+            with patch("svelte_pi.create_pipeline.run_create_pipeline", side_effect=fake_pipeline):
+                result = scaffold_project(task)
+        finally:
+            restore_output_mode(previous)
+
+        assert result["status"] == "ok"
+        assert capsys.readouterr().out == ""
+
+    def test_create_with_flags_never_prompts(self, tmp_path):
+        """All answers can be given as flags"""
+        with patch("svelte_pi.create_pipeline.run_create_pipeline", return_value=tmp_path / "demo") as mock_run:
+            result = CliRunner().invoke(cli, ['create', '--name', 'demo', '--no-reset',
+                                              '--dir', str(tmp_path), '--no-input'])
+
+        assert result.exit_code == 0, result.output
+        mock_run.assert_called_once_with('demo', str(tmp_path), False, use_cache=True, jobs=None, use_store=True,
+                                         resume=False, reset_mode="link", perf=False, bundle=None,
+                                         workspace=None)
+
+    def test_create_from_spec_writes_report(self, tmp_path):
+        """--spec creates every project and writes a JSON report"""
+        spec = tmp_path / "cohort.json"
+        spec.write_text(json.dumps({"defaults": {"parent_dir": str(tmp_path)}, "projects": ["a", "b"]}))
+        report = tmp_path / "report.json"
+
+        def fake_fleet(projects, workers, jobs, use_cache, use_store, workspace):
+            return [dict(project, path=os.path.join(project["parent_dir"], project["name"]),
+                         status="ok" if project["name"] == "a" else "failed", error=None,
+                         duration=0.1, log=str(tmp_path / f"{project['name']}.log"))
+                    for project in projects]
+
+        with patch("svelte_pi.fleet.run_fleet", side_effect=fake_fleet):
+            result = CliRunner().invoke(cli, ['create', '--spec', str(spec), '--report', str(report)])
+
+        assert result.exit_code == 1
+        data = json.loads(report.read_text())
+        assert data["succeeded"] == 1 and data["failed"] == 1
+        assert [project["name"] for project in data["projects"]] == ["a", "b"]
+
+    def test_workspace_fleet_installs_once(self, tmp_path):
+        """Fleet members go under the workspace's apps/ and share one hoisted install"""
+        spec = tmp_path / "cohort.json"
+        spec.write_text(json.dumps(["a", "b", "c"]))
+        root = tmp_path / "mono"
+        created = []
+
+        def fake_fleet(projects, workers, jobs, use_cache, use_store, workspace):
+            created.extend(projects)
+            return [dict(project, path=os.path.join(project["parent_dir"], project["name"]),
+                         status="failed" if project["name"] == "c" else "ok", error=None,
+                         duration=0.1, log=str(tmp_path / f"{project['name']}.log"))
+                    for project in projects]
+
+        with patch("svelte_pi.fleet.run_fleet", side_effect=fake_fleet), \
+                patch("svelte_pi.create_pipeline.install_workspace", return_value=True) as install:
+            result = CliRunner().invoke(cli, ['create', '--spec', str(spec), '--workspace', str(root),
+                                              '--report', str(tmp_path / "report.json")])
+
+        assert result.exit_code == 1
+        assert {project["parent_dir"] for project in created} == {str(root / "apps")}
+        install.assert_called_once_with(str(root))
+        package_data = json.loads((root / "package.json").read_text())
+        assert package_data["private"] is True
+        assert package_data["workspaces"] == ["apps/a", "apps/b"]
@@ -0,0 +1,91 @@
+# tests/test_history.py
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.history import predict, record_runs, summarize, trends
+
+
+def step_event(name, wall_s, status="ok", category="step", pid=None):
+    return {"name": name, "cat": category, "ph": "X", "ts": 1_700_000_000_000_000, "dur": int(wall_s * 1e6),
+            "pid": pid or os.getpid(), "tid": 1, "args": {"status": status, "wall_s": wall_s, "cpu_s": 0.01}}
+
+
+class TestHistory:
+    """Test suite for the timing history and the estimates built on it"""
+
+    def test_summarize_median_and_p95(self):
+        """p95 is the nearest-rank percentile"""
+        assert summarize([3.0, 1.0, 2.0]) == {"median": 2.0, "p95": 3.0, "runs": 3}
+        assert summarize([float(value) for value in range(1, 21)])["p95"] == 19.0
+        assert summarize([1.0, 2.0])["median"] == 1.5
+
+    def test_runs_are_recorded_and_predicted(self):
+        """Successful steps feed the predictions; failed ones and file writes do not"""
+        for wall_s in (1.0, 2.0, 3.0):
+            record_runs("create", [step_event("install", wall_s), step_event("write x", 0.5, category="write")],
+                        {"sv": "0.9.0", "yarn": "1.22.22"})
+        record_runs("create", [step_event("install", 60.0, status="failed")])
+
+        predictions = predict(["install", "sv_create", "write x"])
+        assert predictions == {"install": {"median": 2.0, "p95": 3.0, "runs": 3}}
+
+    def test_fleet_events_become_one_run_per_process(self):
+        """Events merged from worker processes are stored as separate runs"""
+        events = [step_event("install", 1.0, pid=101), step_event("install", 2.0, pid=102)]
+        assert record_runs("create", events) == 2
+
+    def test_plan_shows_predicted_steps(self, tmp_path):
+        """create --plan lists the steps with history and runs nothing"""
+        record_runs("create", [step_event("sv_create", 4.0), step_event("add_prettier", 1.0),
+                               step_event("install", 10.0)])
+
+        result = CliRunner().invoke(cli, ['create', '--plan', '--no-cache', '--no-reset', '--dir', str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "install" in result.output and "10.0s" in result.output
+        assert "Estimated time: 15.0s" in result.output
+        assert "link_store" in result.output
+        assert not (tmp_path / "my-app").exists()
+
+    def test_plan_leaves_the_skeleton_cache_alone(self, tmp_path):
+        """A cache hit while planning does not count as a use for pruning"""
+        from svelte_pi.project_setup import skeleton_profile
+        from svelte_pi.skeleton_cache import store_skeleton
+
+        project = tmp_path / "original"
+        (project / "src").mkdir(parents=True)
+        (project / "package.json").write_text('{"name": "original"}')
+        assert store_skeleton(project, skeleton_profile())
+        (metadata_file,) = (tmp_path / "svelte-pi-cache").rglob("skeleton.json")
+        before = metadata_file.read_bytes()
+
+        result = CliRunner().invoke(cli, ['create', '--plan', '--no-reset', '--dir', str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "materialize" in result.output
+        assert metadata_file.read_bytes() == before
+
+    def test_stats_compares_tool_versions(self):
+        """A slower step after a yarn upgrade is shown as a change"""
+        record_runs("create", [step_event("install", 10.0)], {"sv": "0.9.0", "yarn": "1.22.19"})
+        record_runs("create", [step_event("install", 15.0)], {"sv": "0.9.0", "yarn": "1.22.22"})
+
+        result = CliRunner().invoke(cli, ['stats', '--step', 'install'])
+
+        assert result.exit_code == 0, result.output
+        assert "1.22.19" in result.output and "1.22.22" in result.output
+        assert "+50%" in result.output
+
+    def test_component_runs_are_recorded(self, tmp_path, monkeypatch):
+        """The component command appends its timing to the history"""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(tmp_path)
+
+        assert CliRunner().invoke(cli, ['component', 'ui/a', 'ui/b']).exit_code == 0
+
+        assert [row["step"] for row in trends("component")] == ["components"]
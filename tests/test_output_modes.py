@@ -0,0 +1,145 @@
+# tests/test_output_modes.py
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.console import console, output_mode, print_error, restore_output_mode, set_output_mode
+from svelte_pi.scheduler import Step, run_steps
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestOutputModes:
+    """Test suite for the --json and --quiet output modes"""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_json_emits_one_event_per_component(self, project):
+        """Bulk components are reported as newline-delimited JSON without markup"""
+        result = CliRunner().invoke(cli, ['--json', 'component', 'ui/a', 'ui/b', 'forms/a'])
+
+        assert result.exit_code == 1, result.output
+        events = [json.loads(line) for line in result.output.splitlines()]
+        components = {event["path"]: event for event in events if event["event"] == "component"}
+        assert components["ui/a"]["status"] == "ok"
+        assert components["ui/a"]["files"] == ["src/lib/components/ui/a/A.svelte",
+                                               "src/lib/components/ui/a/A.module.scss"]
+        assert components["forms/a"]["status"] == "failed"
+        assert "already exists" in components["forms/a"]["error"]
+        (step,) = [event for event in events if event["event"] == "step" and event["name"] == "components"]
+        assert sorted(Path(path).relative_to(project).as_posix() for path in step["files"]) == [
+            "src/lib/components/ui/a/A.module.scss", "src/lib/components/ui/a/A.svelte",
+            "src/lib/components/ui/b/B.module.scss", "src/lib/components/ui/b/B.svelte",
+            "src/lib/styles/_tokens.scss"]
+        assert output_mode() == "rich"
+
+    def test_quiet_prints_only_errors(self, project, tmp_path):
+        """Successful runs print nothing; errors come without markup"""
+        result = CliRunner().invoke(cli, ['--quiet', 'component', 'ui/a', 'ui/b'])
+        assert result.exit_code == 0
+        assert result.output == ""
+
+        result = CliRunner().invoke(cli, ['-q', 'component', 'ui/c', 'shop/c'])
+        assert result.output == "✗ shop/c: C already exists at ui/c/C.svelte\n"
+        assert result.exit_code == 1
+
+    def test_failures_exit_non_zero(self, project, tmp_path, monkeypatch):
+        """Scripts can tell a failed create or component from the exit code alone"""
+        result = CliRunner().invoke(cli, ['--quiet', 'component', 'ui/a'])
+        assert result.exit_code == 0
+        result = CliRunner().invoke(cli, ['--quiet', 'component', 'shop/a'])
+        assert result.exit_code == 1
+
+        monkeypatch.chdir(tmp_path.parent)
+        result = CliRunner().invoke(cli, ['--json', 'component', 'q', 'r'])
+        assert result.exit_code == 1
+
+        monkeypatch.setattr("svelte_pi.create_pipeline.run_create_pipeline", lambda *args, **kwargs: None)
+        result = CliRunner().invoke(cli, ['--json', 'create', '--name', 'd', '--no-reset', '--dir', str(tmp_path)])
+        assert result.exit_code == 1
+
+    def test_listings_emit_json_rows(self, project, tmp_path):
+        """Listing commands print one JSON row per entry and refuse --quiet"""
+        CliRunner().invoke(cli, ['--quiet', 'component', 'ui/a'])
+
+        result = CliRunner().invoke(cli, ['--json', 'components', 'list'])
+        assert result.exit_code == 0, result.output
+        assert [json.loads(line) for line in result.output.splitlines()] == [
+            {"event": "component", "name": "A", "path": "src/lib/components/ui/a/A.svelte"}]
+
+        result = CliRunner().invoke(cli, ['--json', 'templates', 'list'])
+        events = [json.loads(line) for line in result.output.splitlines()]
+        assert events and all(event["event"] == "template" for event in events)
+
+        result = CliRunner().invoke(cli, ['--quiet', 'components', 'list'])
+        assert result.exit_code == 2
+        assert "--json" in result.output
+
+        (project / "package.json").unlink()
+        result = CliRunner().invoke(cli, ['--json', 'components', 'list'])
+        assert result.exit_code == 1
+
+    def test_patch_reports_every_file(self, project):
+        """--json gives one patch event per file; --quiet still shows anchors that were not found"""
+        (project / "src" / "app.html").write_text("<html><body></body></html>\n")
+
+        result = CliRunner().invoke(cli, ['-q', 'patch', '--preconnect', 'https://cdn.example.com'])
+        assert result.exit_code == 1
+        assert "no anchor found in src/app.html" in result.output
+
+        result = CliRunner().invoke(cli, ['--json', 'patch', '--preconnect', 'https://cdn.example.com',
+                                          '--vite-scss'])
+        assert result.exit_code == 1
+        events = [json.loads(line) for line in result.output.splitlines()]
+        patches = {event["file"]: event for event in events if event["event"] == "patch"}
+        assert patches["src/app.html"]["status"] == "failed"
+        assert patches["src/app.html"]["failed"] == ["preconnect https://cdn.example.com"]
+        assert patches["vite.config.ts"]["status"] == "failed" and patches["vite.config.ts"]["error"]
+
+    def test_step_errors_are_attached_to_the_step(self, capsys):
+        """Errors printed while a step runs become part of its JSON event"""
+        def failing():
+            console.print("[cyan]Installing...[/cyan]")
+            print_error("Error installing sass-embedded:")
+            return False
+
+        previous = set_output_mode("json")
+        try:
+            assert not run_steps([Step("install", failing)])
+        finally:
+            restore_output_mode(previous)
+
+        (event,) = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert event["name"] == "install" and event["status"] == "failed"
+        assert event["errors"] == ["Error installing sass-embedded:"]
+        assert isinstance(event["duration_s"], float)
+
+    def test_json_and_quiet_are_exclusive(self):
+        result = CliRunner().invoke(cli, ['--json', '--quiet', 'components', 'list'])
+        assert result.exit_code == 2
+
+    def test_quiet_components_never_import_rich(self, project):
+        """The machine-readable modes skip rich entirely"""
+        script = ("import sys\n"
+                  "from svelte_pi.main import cli\n"
+                  "try:\n"
+                  "    cli(['--quiet', 'component', 'ui/a', 'ui/b'])\n"
+                  "except SystemExit:\n"
+                  "    pass\n"
+                  "print(sorted(m for m in sys.modules if m.split('.')[0] == 'rich'))\n")
+        result = subprocess.run([sys.executable, "-c", script], cwd=project, capture_output=True, text=True,
+                                check=True, env={"PYTHONPATH": str(REPO_ROOT), "PATH": "/usr/bin:/bin",
+                                                 "SVELTE_PI_CACHE_DIR": str(project / "cache")})
+
+        assert result.stdout.strip() == "[]"
+        assert (project / "src" / "lib" / "components" / "ui" / "b" / "B.svelte").exists()
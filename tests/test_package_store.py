@@ -0,0 +1,77 @@
+# tests/test_package_store.py
+import os
+import shutil
+
+from svelte_pi.package_store import link_node_modules, store_stats, gc_store
+
+
+class TestPackageStore:
+    """Test suite for the content-addressed package store"""
+
+    def test_identical_files_share_one_inode(self, tmp_path):
+        """The same package file in two projects ends up as one inode"""
+        first = self._create_project(tmp_path / "first")
+        second = self._create_project(tmp_path / "second")
+
+        first_stats = link_node_modules(first)
+        second_stats = link_node_modules(second)
+
+        assert first_stats["added"] == 3
+        assert second_stats["linked"] == 3
+        for relative in ("vite/index.js", "vite/bin/vite.js", "kit/package.json"):
+            first_file = first / "node_modules" / relative
+            second_file = second / "node_modules" / relative
+            assert os.stat(first_file).st_ino == os.stat(second_file).st_ino
+            assert first_file.read_text() == second_file.read_text()
+
+    def test_executable_bit_is_part_of_the_key(self, tmp_path):
+        """Same bytes with different modes are stored separately"""
+        first = self._create_project(tmp_path / "first")
+        second = self._create_project(tmp_path / "second")
+        os.chmod(second / "node_modules" / "vite" / "index.js", 0o644)
+        os.chmod(first / "node_modules" / "vite" / "index.js", 0o755)
+
+        link_node_modules(first)
+        link_node_modules(second)
+
+        assert os.stat(first / "node_modules" / "vite" / "index.js").st_mode & 0o111
+        assert not os.stat(second / "node_modules" / "vite" / "index.js").st_mode & 0o111
+
+    def test_tool_managed_entries_are_not_shared(self, tmp_path):
+        """Dot entries such as .yarn-integrity and .vite stay private"""
+        project = self._create_project(tmp_path / "first")
+        (project / "node_modules" / ".yarn-integrity").write_text("{}")
+        (project / "node_modules" / ".vite").mkdir()
+        (project / "node_modules" / ".vite" / "deps.json").write_text("{}")
+
+        stats = link_node_modules(project)
+
+        assert stats["files"] == 3
+        assert os.stat(project / "node_modules" / ".yarn-integrity").st_nlink == 1
+
+    def test_gc_removes_unreferenced_files(self, tmp_path):
+        """Files are collected once no project links to them"""
+        first = self._create_project(tmp_path / "first")
+        second = self._create_project(tmp_path / "second")
+        (second / "node_modules" / "only-second.js").write_text("// unique")
+        link_node_modules(first)
+        link_node_modules(second)
+
+        assert store_stats()["files"] == 4
+
+        shutil.rmtree(second)
+        removed, freed = gc_store()
+
+        assert removed == 1
+        assert freed == len("// unique")
+        assert store_stats()["files"] == 3
+
+    def _create_project(self, root):
+        vite = root / "node_modules" / "vite"
+        (vite / "bin").mkdir(parents=True)
+        (vite / "index.js").write_text("export default {};")
+        (vite / "bin" / "vite.js").write_text("#!/usr/bin/env node")
+        os.chmod(vite / "bin" / "vite.js", 0o755)
+        (root / "node_modules" / "kit").mkdir()
+        (root / "node_modules" / "kit" / "package.json").write_text('{"name": "kit"}')
+        return root
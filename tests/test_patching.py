@@ -0,0 +1,154 @@
+# tests/test_patching.py
+import json
+import os
+
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.file_operations import update_app_html
+from svelte_pi.patching import (apply_patches, patch_text, stylesheet_link, inline_style, preconnect, preload,
+                                svelte_import, svelte_config_alias, vite_scss_options, vite_plugin,
+                                module_import, export_const)
+
+APP_HTML = """<!doctype html>
+<html lang="en">
+\t<head>
+\t\t<meta charset="utf-8" />
+\t\t<meta name="viewport" content="width=device-width, initial-scale=1" />
+\t\t%sveltekit.head%
+\t</head>
+\t<body>%sveltekit.body%</body>
+</html>
+"""
+
+SVELTE_CONFIG = """const config = {
+\tpreprocess: vitePreprocess(),
+
+\tkit: {
+\t\tadapter: adapter()
+\t}
+};
+"""
+
+VITE_CONFIG = """export default defineConfig({
+\tplugins: [sveltekit()]
+});
+"""
+
+
+class TestPatching:
+    """Test suite for anchored, idempotent file patches"""
+
+    def test_app_html_patches_in_one_pass(self, tmp_path):
+        """Several head edits land in place with the surrounding indentation"""
+        app_html = tmp_path / "app.html"
+        app_html.write_text(APP_HTML)
+        patches = [stylesheet_link("/reset.css"), preconnect("https://fonts.gstatic.com"),
+                   preload("/fonts/inter.woff2")]
+
+        report = apply_patches(app_html, patches)
+
+        assert report.applied == ["stylesheet /reset.css", "preconnect https://fonts.gstatic.com",
+                                  "preload /fonts/inter.woff2"]
+        lines = app_html.read_text().splitlines()
+        assert lines[4] == '\t\t<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />'
+        assert lines[6] == '\t\t<link rel="stylesheet" href="/reset.css" />'
+        assert lines[7] == '\t\t<link rel="preload" href="/fonts/inter.woff2" as="font" type="font/woff2" crossorigin />'
+        assert lines[8] == "\t\t%sveltekit.head%"
+
+    def test_second_run_reports_present_and_does_not_write(self, tmp_path):
+        """Re-applying is a no-op that leaves the file untouched"""
+        app_html = tmp_path / "app.html"
+        app_html.write_text(APP_HTML)
+        apply_patches(app_html, [stylesheet_link("/reset.css")])
+        os.utime(app_html, (1, 1))
+
+        report = apply_patches(app_html, [stylesheet_link("/reset.css")])
+
+        assert report.applied == [] and report.present == ["stylesheet /reset.css"]
+        assert app_html.stat().st_mtime == 1
+        assert app_html.read_text().count("/reset.css") == 1
+
+    def test_fallback_anchor_and_missing_anchor(self):
+        """Without a viewport meta the link goes before %sveltekit.head%; without either it fails"""
+        content, report = patch_text("<head>\n  %sveltekit.head%\n</head>", [stylesheet_link("/a.css")])
+        assert content == '<head>\n  <link rel="stylesheet" href="/a.css" />\n  %sveltekit.head%\n</head>'
+        assert report.ok
+
+        content, report = patch_text("<div></div>", [stylesheet_link("/a.css")])
+        assert content == "<div></div>"
+        assert report.failed == ["stylesheet /a.css"]
+
+    def test_inline_style_is_placed_once(self):
+        """An inlined stylesheet goes where the link would and is recognised by its id"""
+        content, report = patch_text(APP_HTML, [inline_style("reset-css", "*{margin:0}")])
+        assert report.applied == ["inline style reset-css"]
+        assert content.splitlines()[5] == '\t\t<style id="reset-css">*{margin:0}</style>'
+
+        _, report = patch_text(content, [inline_style("reset-css", "*{padding:0}")])
+        assert report.present == ["inline style reset-css"]
+
+    def test_svelte_import(self):
+        """The import joins the instance script, or gets a script of its own"""
+        layout = ('<script module>\n\texport const x = 1;\n</script>\n\n<script lang="ts">\n'
+                  '\tlet { children } = $props();\n</script>\n\n{@render children()}\n')
+        content, _ = patch_text(layout, [svelte_import("$lib/styles/reset.css")])
+        assert '<script lang="ts">\n\timport \'$lib/styles/reset.css\';\n\tlet { children }' in content
+
+        content, _ = patch_text("<slot />\n", [svelte_import("$lib/styles/reset.css")])
+        assert content == "<script>\n\timport '$lib/styles/reset.css';\n</script>\n\n<slot />\n"
+
+    def test_config_patches(self):
+        """Alias and Sass options are added to the config objects"""
+        content, report = patch_text(SVELTE_CONFIG, [svelte_config_alias("$styles", "src/lib/styles"),
+                                                     svelte_config_alias("$ui", "src/lib/ui")])
+        assert report.applied == ["alias $styles", "alias $ui"]
+        assert "\tkit: {\n\t\talias: {\n\t\t\t'$ui': 'src/lib/ui',\n\t\t\t'$styles': 'src/lib/styles'\n\t\t}," in content
+
+        content, _ = patch_text(VITE_CONFIG, [vite_scss_options()])
+        assert "\tcss: {\n\t\tpreprocessorOptions: {\n\t\t\tscss: { api: 'modern-compiler' }" in content
+
+    def test_module_patches(self):
+        """Imports follow the last (possibly multi-line) import; plugins join the array in place"""
+        config = "import {\n\ta,\n\tb\n} from 'x';\n\nexport default defineConfig({\n\tplugins: [\n\t\tsveltekit(),\n\t]\n});\n"
+        content, report = patch_text(config, [module_import("import { perf } from './vite.perf';", "./vite.perf"),
+                                              vite_plugin("perf()")])
+        assert report.ok
+        assert "} from 'x';\nimport { perf } from './vite.perf';\n\nexport" in content
+        assert "\t\tsveltekit(), perf(),\n\t]" in content
+
+        content, _ = patch_text("import type { LayoutLoad } from './$types';\n", [export_const("ssr", "false")])
+        assert content == "import type { LayoutLoad } from './$types';\nexport const ssr = false;\n"
+
+        _, report = patch_text("export default {};\n", [vite_plugin("perf()")])
+        assert report.failed == ["vite plugin perf()"]
+
+    def test_update_app_html_tolerates_other_formatting(self, tmp_path):
+        """The reset.css link is placed even when the viewport meta differs"""
+        (tmp_path / "src").mkdir()
+        app_html = tmp_path / "src" / "app.html"
+        app_html.write_text("<head>\n    <meta name='viewport' content='width=device-width'>\n</head>\n")
+
+        assert update_app_html(tmp_path)
+        assert update_app_html(tmp_path)
+
+        assert app_html.read_text() == ("<head>\n    <meta name='viewport' content='width=device-width'>\n"
+                                        '    <link rel="stylesheet" href="/src/lib/styles/reset.css" />\n</head>\n')
+
+    def test_patch_command(self, tmp_path, monkeypatch):
+        """patch applies edits across files and reports them"""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        (tmp_path / "src" / "app.html").write_text(APP_HTML)
+        (tmp_path / "svelte.config.js").write_text(SVELTE_CONFIG)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ['patch', '--preconnect', 'https://cdn.example.com',
+                                          '--alias', '$styles=src/lib/styles'])
+
+        assert result.exit_code == 0, result.output
+        assert "https://cdn.example.com" in (tmp_path / "src" / "app.html").read_text()
+        assert "'$styles': 'src/lib/styles'" in (tmp_path / "svelte.config.js").read_text()
+
+        result = CliRunner().invoke(cli, ['patch', '--vite-scss'])
+        assert result.exit_code == 1
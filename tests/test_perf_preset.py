@@ -0,0 +1,62 @@
+# tests/test_perf_preset.py
+import json
+
+import pytest
+
+from svelte_pi.perf_preset import apply_perf_preset
+
+SVELTE_CONFIG = """import adapter from '@sveltejs/adapter-auto';
+
+const config = {
+\tkit: {
+\t\tadapter: adapter()
+\t}
+};
+
+export default config;
+"""
+
+VITE_CONFIG = """import { sveltekit } from '@sveltejs/kit/vite';
+import { defineConfig } from 'vite';
+
+export default defineConfig({
+\tplugins: [sveltekit()]
+});
+"""
+
+
+class TestPerfPreset:
+    """Test suite for the build-tuning preset of create --perf"""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / "src" / "routes").mkdir(parents=True)
+        (tmp_path / "svelte.config.js").write_text(SVELTE_CONFIG)
+        (tmp_path / "vite.config.ts").write_text(VITE_CONFIG)
+        (tmp_path / "package.json").write_text(json.dumps({"scripts": {"build": "vite build"}}, indent="\t"))
+        return tmp_path
+
+    def test_preset_patches_configs_and_adds_scripts(self, project):
+        """The Vite plugin, kit option, page option and scripts land once, however often it runs"""
+        assert apply_perf_preset(project)
+        assert apply_perf_preset(project)
+
+        vite_config = (project / "vite.config.ts").read_text()
+        assert "import { defineConfig } from 'vite';\nimport { perf } from './vite.perf';\n" in vite_config
+        assert "plugins: [sveltekit(), perf()]" in vite_config
+        assert "export function perf(): Plugin" in (project / "vite.perf.ts").read_text()
+        assert "\tkit: {\n\t\tinlineStyleThreshold: 5120,\n\t\tadapter: adapter()" in (
+            project / "svelte.config.js").read_text()
+        assert (project / "src" / "routes" / "+layout.ts").read_text() == "export const prerender = 'auto';\n"
+        assert (project / "scripts" / "size-report.js").exists()
+        scripts = json.loads((project / "package.json").read_text())["scripts"]
+        assert scripts["build:size"] == "vite build && node scripts/size-report.js"
+
+    def test_unpatchable_config_leaves_the_project_untouched(self, project):
+        """A Vite config without a plugins array fails the step before anything is written"""
+        (project / "vite.config.ts").write_text("export default {};\n")
+
+        assert not apply_perf_preset(project)
+
+        assert not (project / "vite.perf.ts").exists()
+        assert "inlineStyleThreshold" not in (project / "svelte.config.js").read_text()
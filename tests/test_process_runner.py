@@ -0,0 +1,88 @@
+# tests/test_process_runner.py
+import os
+import sys
+import time
+
+from svelte_pi.console import restore_output_mode, set_output_mode
+from svelte_pi.process_runner import MAX_LOG_AGE_DAYS, print_failure_tail, run_streaming
+
+
+class TestProcessRunner:
+    """Test suite for the streaming subprocess runner"""
+
+    def test_tail_is_bounded_and_log_is_complete(self, tmp_path):
+        """Only the tail stays in memory while the log keeps every line"""
+        script = "import sys\nfor i in range(500): print(f'line {i}')\nprint('oops', file=sys.stderr)"
+        result = run_streaming([sys.executable, "-c", script], cwd=tmp_path, label="noisy", tail_lines=10)
+
+        assert result.ok
+        assert len(result.tail) == 10
+
+        log = result.log_path.read_text()
+        assert "line 0\n" in log and "line 499\n" in log
+        assert "stderr: oops\n" in log
+
+    def test_only_old_logs_are_pruned(self, tmp_path, isolated_cache_dir):
+        """Logs of earlier failures survive any number of later commands"""
+        logs_dir = isolated_cache_dir / "logs"
+        logs_dir.mkdir(parents=True)
+        recent = [logs_dir / f"recent-{i:03d}.log" for i in range(60)]
+        for log in recent:
+            log.write_text("")
+        stale = logs_dir / "stale.log"
+        stale.write_text("")
+        old = time.time() - (MAX_LOG_AGE_DAYS + 1) * 86400
+        os.utime(stale, (old, old))
+
+        run_streaming([sys.executable, "-c", "pass"], cwd=tmp_path, label="quick")
+
+        assert all(log.exists() for log in recent)
+        assert not stale.exists()
+
+    def test_input_is_forwarded(self, tmp_path):
+        """Text passed as input reaches the child's stdin"""
+        script = "print('got', input())"
+        result = run_streaming([sys.executable, "-c", script], cwd=tmp_path, label="echo", input="y\n")
+
+        assert result.ok
+        assert result.tail == ["got y"]
+
+    def test_failure_exit_code(self, tmp_path):
+        """Non-zero exit codes are reported, not raised"""
+        result = run_streaming([sys.executable, "-c", "raise SystemExit(3)"], cwd=tmp_path, label="fail")
+
+        assert not result.ok
+        assert result.returncode == 3
+        assert not result.timed_out
+
+    def test_idle_timeout_ignores_steady_progress(self, tmp_path):
+        """A slow process that keeps printing outlives the idle timeout"""
+        script = "import time\nfor i in range(6):\n    print(i, flush=True)\n    time.sleep(0.1)"
+        result = run_streaming([sys.executable, "-c", script], cwd=tmp_path, label="slow", idle_timeout=0.4)
+
+        assert result.ok
+        assert result.tail == [str(i) for i in range(6)]
+
+    def test_idle_timeout_kills_silent_process(self, tmp_path):
+        """A process that stops producing output is killed"""
+        script = "import time\nprint('start', flush=True)\ntime.sleep(30)"
+        result = run_streaming([sys.executable, "-c", script], cwd=tmp_path, label="stuck", idle_timeout=0.3)
+
+        assert result.timed_out
+        assert not result.ok
+        assert result.tail == ["start"]
+
+    def test_failure_tail_reports_the_timeout_used(self, tmp_path, capsys):
+        """The kill message names the idle timeout the command actually ran with"""
+        script = "import time\nprint('start', flush=True)\ntime.sleep(30)"
+        result = run_streaming([sys.executable, "-c", script], cwd=tmp_path, label="stuck", idle_timeout=0.3)
+
+        previous = set_output_mode("quiet")
+        try:
+            print_failure_tail(result)
+        finally:
+            restore_output_mode(previous)
+
+        errors = capsys.readouterr().err
+        assert "No output for 0.3 seconds, process killed\nstart\n" in errors
+        assert f"Full log: {result.log_path}" in errors
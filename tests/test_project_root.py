@@ -0,0 +1,69 @@
+# tests/test_project_root.py
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from svelte_pi.project_root import find_project_root, reset_cache
+
+
+class TestProjectRoot:
+    """Test suite for upward SvelteKit project discovery"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        reset_cache()
+
+    def teardown_method(self):
+        reset_cache()
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_finds_root_from_subdirectory(self):
+        """Discovery walks up like git does"""
+        root = self._create_project(self.test_dir / "app")
+        nested = root / "src" / "lib" / "components" / "ui"
+        nested.mkdir(parents=True)
+
+        assert find_project_root(nested) == root
+        assert find_project_root(self.test_dir) is None
+
+    def test_skips_nested_non_sveltekit_packages(self):
+        """A plain package.json in between does not stop the walk"""
+        root = self._create_project(self.test_dir / "app")
+        package = root / "src" / "tools"
+        package.mkdir()
+        (package / "package.json").write_text(json.dumps({"name": "tools"}))
+
+        assert find_project_root(package) == root
+
+    def test_cached_packages_are_not_reparsed(self):
+        """A fresh process reuses the on-disk cache while package.json is unchanged"""
+        root = self._create_project(self.test_dir / "app")
+        assert find_project_root(root / "src") == root
+
+        reset_cache()
+        with patch("svelte_pi.project_root.open", side_effect=AssertionError("re-parsed"), create=True):
+            assert find_project_root(root / "src") == root
+
+    def test_changed_package_json_is_reparsed(self):
+        """Editing package.json invalidates the cached result"""
+        root = self._create_project(self.test_dir / "app")
+        assert find_project_root(root) == root
+
+        package_json = root / "package.json"
+        package_json.write_text(json.dumps({"name": "app", "dependencies": {}}))
+        stat = package_json.stat()
+        os.utime(package_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert find_project_root(root) is None
+
+    def _create_project(self, root):
+        (root / "src").mkdir(parents=True)
+        (root / "package.json").write_text(json.dumps({
+            "name": root.name,
+            "devDependencies": {"@sveltejs/kit": "^2.0.0"}
+        }))
+        return root
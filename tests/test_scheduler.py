@@ -0,0 +1,153 @@
+# tests/test_scheduler.py
+import threading
+import time
+
+import pytest
+
+from svelte_pi.scheduler import Step, run_steps, resolve_dependencies
+from svelte_pi.create_pipeline import build_create_steps
+
+
+class TestScheduler:
+    """Test suite for the dependency-aware step scheduler"""
+
+    def test_steps_run_after_their_inputs(self):
+        """A step only starts once the producers of its inputs finished"""
+        finished = []
+
+        def record(name):
+            def run():
+                finished.append(name)
+                return True
+            return run
+
+        steps = [
+            Step("install", record("install"), inputs=("package_json",), outputs=("node_modules",)),
+            Step("scaffold", record("scaffold"), outputs=("package_json",)),
+            Step("snapshot", record("snapshot"), inputs=("node_modules",)),
+        ]
+
+        assert run_steps(steps, jobs=4)
+        assert finished == ["scaffold", "install", "snapshot"]
+
+    def test_independent_steps_overlap(self):
+        """Steps without dependencies between them run concurrently"""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def meet():
+            barrier.wait()
+            return True
+
+        steps = [Step("a", meet, outputs=("a",)), Step("b", meet, outputs=("b",))]
+        assert run_steps(steps, jobs=2)
+
+    def test_jobs_caps_concurrency(self):
+        """No more than `jobs` steps are ever in flight"""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def work():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return True
+
+        steps = [Step(f"s{i}", work, outputs=(f"s{i}",)) for i in range(6)]
+        assert run_steps(steps, jobs=2)
+        assert peak[0] <= 2
+
+    def test_failure_stops_dependents(self):
+        """Dependents of a failed step never run"""
+        ran = []
+        steps = [
+            Step("scaffold", lambda: False, outputs=("project",)),
+            Step("install", lambda: ran.append("install") or True, inputs=("project",)),
+        ]
+
+        assert not run_steps(steps)
+        assert ran == []
+
+    def test_cycles_are_rejected(self):
+        """Cyclic declarations fail before anything runs"""
+        steps = [
+            Step("a", lambda: True, inputs=("b",), outputs=("a",)),
+            Step("b", lambda: True, inputs=("a",), outputs=("b",)),
+        ]
+        with pytest.raises(ValueError):
+            resolve_dependencies(steps)
+
+    def test_create_steps_overlap_reset_with_install(self, tmp_path):
+        """Without the cache, reset.css only waits for the scaffold"""
+        steps = build_create_steps("demo", str(tmp_path), use_reset_css=True, use_cache=False)
+        dependencies = resolve_dependencies(steps)
+
+        assert dependencies["install"] == {"sv_create", "add_prettier"}
+        assert dependencies["reset_css"] == {"sv_create"}
+        assert dependencies["app_html"] == {"sv_create"}
+        assert dependencies["tokens"] == {"sv_create", "reset_css"}
+        inline = build_create_steps("demo", str(tmp_path), use_reset_css=True, use_cache=False, reset_mode="inline")
+        assert resolve_dependencies(inline)["tokens"] == {"sv_create"}
+
+    def test_store_linking_is_off_the_critical_path(self, tmp_path):
+        """The snapshot does not wait for deduplication; deduplication waits for the snapshot"""
+        dependencies = resolve_dependencies(build_create_steps("demo", str(tmp_path), use_reset_css=True))
+
+        assert dependencies["snapshot"] == {"install", "add_prettier", "capture_src"}
+        assert dependencies["link_store"] == {"install", "snapshot"}
+
+    def test_cache_miss_still_overlaps_reset_with_install(self, tmp_path):
+        """With the cache on, the src/ edits wait for a copy of src/, not for the snapshot"""
+        dependencies = resolve_dependencies(build_create_steps("demo", str(tmp_path), use_reset_css=True))
+
+        assert dependencies["capture_src"] == {"sv_create"}
+        assert dependencies["reset_css"] == {"sv_create", "capture_src"}
+        assert dependencies["app_html"] == {"sv_create", "capture_src"}
+        assert dependencies["tokens"] == {"sv_create", "capture_src", "reset_css"}
+
+    def test_create_steps_follow_the_reset_mode(self, tmp_path):
+        """inline needs no reset.css file; layout imports it instead of linking it"""
+        inline = build_create_steps("demo", str(tmp_path), use_reset_css=True, use_cache=False, reset_mode="inline")
+        layout = build_create_steps("demo", str(tmp_path), use_reset_css=True, use_cache=False, reset_mode="layout")
+
+        assert "reset_css" not in [step.name for step in inline]
+        assert [step.params for step in inline if step.name == "app_html"] == [{"mode": "inline"}]
+        assert "app_html" not in [step.name for step in layout]
+        assert resolve_dependencies(layout)["layout"] == {"sv_create"}
+
+    def test_journal_skips_completed_steps(self, tmp_path):
+        """A resumed run skips recorded steps and re-runs those whose params changed"""
+        from svelte_pi.journal import StepJournal
+
+        ran = []
+
+        def steps(install_version):
+            return [
+                Step("scaffold", lambda: ran.append("scaffold") or True, outputs=("project",), params={"v": 1}),
+                Step("install", lambda: ran.append("install") or False, inputs=("project",),
+                     outputs=("node_modules",), params={"v": install_version}),
+                Step("reset", lambda: ran.append("reset") or True, inputs=("node_modules",)),
+            ]
+
+        assert not run_steps(steps(1), journal=StepJournal(tmp_path))
+        assert ran == ["scaffold", "install"]
+
+        journal = StepJournal.load(tmp_path)
+        assert journal.completed("scaffold") and not journal.completed("install")
+        assert "journal.json" in (tmp_path / ".svelte-pi" / ".gitignore").read_text()
+
+        ran.clear()
+        resumed = steps(1)
+        resumed[1].func = lambda: ran.append("install") or True
+        assert run_steps(resumed, journal=journal)
+        assert ran == ["install", "reset"]
+
+        # Changing a step's params invalidates it and everything after it
+        ran.clear()
+        changed = steps(2)
+        changed[1].func = lambda: ran.append("install") or True
+        assert run_steps(changed, journal=StepJournal.load(tmp_path))
+        assert ran == ["install", "reset"]
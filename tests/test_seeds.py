@@ -0,0 +1,74 @@
+# tests/test_seeds.py
+import json
+from unittest.mock import patch
+
+import pytest
+
+from svelte_pi.create_pipeline import _install
+from svelte_pi.seeds import apply_seed, list_seeds, lookup_seed, store_seed
+
+PROFILE = {"template": "minimal", "types": "ts", "package_manager": "yarn",
+           "sv_version": "latest", "add_ons": ["prettier", "sass-embedded"]}
+
+
+class TestSeeds:
+    """Test suite for the per-profile lockfile seeds"""
+
+    @pytest.fixture
+    def installed(self, tmp_path):
+        project = tmp_path / "installed"
+        project.mkdir()
+        (project / "package.json").write_text(json.dumps({
+            "name": "installed", "devDependencies": {"svelte": "^5.1.0", "sass-embedded": "^1.89.2"},
+        }))
+        (project / "yarn.lock").write_text("# yarn lockfile v1\n")
+        return project
+
+    @pytest.fixture
+    def scaffolded(self, tmp_path):
+        project = tmp_path / "new"
+        project.mkdir()
+        (project / "package.json").write_text(json.dumps({
+            "name": "new", "scripts": {"dev": "vite dev"}, "devDependencies": {"svelte": "^5.0.0"},
+        }))
+        return project
+
+    def test_seed_is_stored_and_applied(self, installed, scaffolded):
+        """A new project gets the seed lockfile and its pinned ranges, keeping everything else"""
+        assert lookup_seed(PROFILE) is None
+        assert store_seed(installed, PROFILE)
+
+        seed_dir = lookup_seed(PROFILE)
+        assert seed_dir is not None
+        assert [entry["key"] for entry in list_seeds()] == [seed_dir.name]
+
+        assert apply_seed(seed_dir, scaffolded)
+        package_data = json.loads((scaffolded / "package.json").read_text())
+        assert package_data["name"] == "new"
+        assert package_data["scripts"] == {"dev": "vite dev"}
+        assert package_data["devDependencies"] == {"sass-embedded": "^1.89.2", "svelte": "^5.1.0"}
+        assert (scaffolded / "yarn.lock").read_text() == "# yarn lockfile v1\n"
+
+    def test_first_install_saves_seed_and_later_ones_use_it(self, installed, scaffolded):
+        """Without a seed the install resolves and saves one; with one it installs frozen"""
+        def fake_install(project_path, seeded=False):
+            calls.append(seeded)
+            (project_path / "yarn.lock").write_text("# yarn lockfile v1\n")
+            return True
+
+        calls = []
+        with patch("svelte_pi.create_pipeline.install_sass", side_effect=fake_install):
+            assert _install(installed, PROFILE, use_seed=True)
+            assert _install(scaffolded, PROFILE, use_seed=True)
+
+        assert calls == [False, True]
+
+    def test_stale_seed_falls_back_to_resolving(self, installed, scaffolded):
+        """A frozen install that fails is retried as a normal install"""
+        store_seed(installed, PROFILE)
+
+        with patch("svelte_pi.create_pipeline.install_sass", side_effect=[False, True]) as install:
+            assert _install(scaffolded, PROFILE, use_seed=True)
+
+        assert [call.kwargs.get("seeded", False) for call in install.call_args_list] == [True, False]
+        assert not (scaffolded / "yarn.lock").exists()
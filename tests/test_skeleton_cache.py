@@ -0,0 +1,123 @@
+# tests/test_skeleton_cache.py
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from svelte_pi.skeleton_cache import (
+    CAPTURED_SOURCES, capture_sources, lookup_skeleton, store_skeleton, materialize_skeleton, list_skeletons,
+    prune_skeletons
+)
+
+
+PROFILE = {"template": "minimal", "types": "ts", "package_manager": "yarn",
+           "sv_version": "latest", "add_ons": ["prettier", "sass-embedded"]}
+
+
+class TestSkeletonCache:
+    """Test suite for the project skeleton cache"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_miss_then_hit(self):
+        """A stored skeleton is found for the same profile only"""
+        assert lookup_skeleton(PROFILE) is None
+
+        project = self._create_project("original")
+        (project / ".svelte-pi").mkdir()
+        (project / ".svelte-pi" / "journal.json").write_text("{}")
+        assert store_skeleton(project, PROFILE)
+
+        assert lookup_skeleton(PROFILE) is not None
+        # Per-project state (the step journal) is not part of the skeleton
+        assert not (lookup_skeleton(PROFILE) / ".svelte-pi").exists()
+        assert lookup_skeleton(dict(PROFILE, sv_version="0.1.0")) is None
+
+    def test_hit_replaces_metadata_atomically(self):
+        """Recording last_used swaps in a new file instead of truncating the one being read"""
+        store_skeleton(self._create_project("original"), PROFILE)
+        tree = lookup_skeleton(PROFILE)
+        metadata_file = tree.parent / "skeleton.json"
+        inode = metadata_file.stat().st_ino
+
+        assert lookup_skeleton(PROFILE) == tree
+        assert metadata_file.stat().st_ino != inode
+        assert [path.name for path in tree.parent.iterdir() if path.name.endswith(".tmp")] == []
+
+    def test_snapshot_takes_src_from_the_capture(self):
+        """Edits made to src/ after the capture stay out of the cached skeleton"""
+        project = self._create_project("original")
+        (project / "src" / "app.html").write_text("<head></head>")
+        capture_sources(project)
+        (project / "src" / "app.html").write_text("<head><link rel=\"stylesheet\"></head>")
+        (project / "src" / "reset.css").write_text("*{}")
+
+        assert store_skeleton(project, PROFILE, sources=project / CAPTURED_SOURCES)
+
+        tree = lookup_skeleton(PROFILE)
+        assert (tree / "src" / "app.html").read_text() == "<head></head>"
+        assert not (tree / "src" / "reset.css").exists()
+        assert not (tree / ".svelte-pi").exists()
+
+    def test_materialize_rewrites_package_name(self):
+        """Materialized projects get their own name and an independent package.json"""
+        project = self._create_project("original")
+        store_skeleton(project, PROFILE)
+
+        target = self.test_dir / "copy"
+        result = materialize_skeleton(lookup_skeleton(PROFILE), target, "copy")
+
+        assert result == target
+        assert json.loads((target / "package.json").read_text())["name"] == "copy"
+        assert (target / "src" / "app.html").exists()
+        assert (target / "node_modules" / ".bin" / "vite").is_symlink()
+
+        # The cached tree must not be affected by the rename
+        cached_package = lookup_skeleton(PROFILE) / "package.json"
+        assert json.loads(cached_package.read_text())["name"] == "original"
+
+    def test_materialize_refuses_existing_directory(self):
+        """An existing target directory is never overwritten"""
+        store_skeleton(self._create_project("original"), PROFILE)
+
+        target = self.test_dir / "taken"
+        target.mkdir()
+        assert materialize_skeleton(lookup_skeleton(PROFILE), target, "taken") is None
+        assert target.exists()
+
+    def test_prune_evicts_least_recently_used(self):
+        """Size-based pruning removes the oldest entries first"""
+        old_profile = dict(PROFILE, sv_version="old")
+        store_skeleton(self._create_project("old"), old_profile)
+        store_skeleton(self._create_project("new"), PROFILE)
+
+        for entry in list_skeletons():
+            if entry["profile"]["sv_version"] == "old":
+                metadata_path = entry["path"] / "skeleton.json"
+                metadata = json.loads(metadata_path.read_text())
+                metadata["last_used"] = time.time() - 3600
+                metadata_path.write_text(json.dumps(metadata))
+
+        one_entry = list_skeletons()[0]["size"]
+        removed = prune_skeletons(max_bytes=one_entry, max_age_days=None)
+
+        assert [entry["profile"]["sv_version"] for entry in removed] == ["old"]
+        assert lookup_skeleton(PROFILE) is not None
+
+    def _create_project(self, name):
+        project = self.test_dir / name
+        (project / "src").mkdir(parents=True)
+        (project / "src" / "app.html").write_text("<html></html>")
+        (project / "package.json").write_text(json.dumps({"name": name}))
+        bin_dir = project / "node_modules" / ".bin"
+        bin_dir.mkdir(parents=True)
+        (project / "node_modules" / "vite.js").write_text("// vite")
+        os.symlink("../vite.js", bin_dir / "vite")
+        return project
@@ -0,0 +1,70 @@
+# tests/test_styles_audit.py
+import json
+
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.css import scss_declarations
+from svelte_pi.styles_audit import audit_styles
+
+CARD_SCSS = """@use '$lib/styles/tokens' as tokens;
+
+.container {
+  display: flex;
+  padding: tokens.$space-4; // spacing
+  &:hover { color: red }
+}
+"""
+
+PANEL_SCSS = """.container {
+  display:   flex;
+  padding: tokens.$space-4;
+  @media (min-width: 600px) { display: flex; }
+}
+"""
+
+
+class TestStylesAudit:
+    """Test suite for the duplicated-declaration audit of component modules"""
+
+    def write_modules(self, project):
+        components = project / "src" / "lib" / "components"
+        (components / "card").mkdir(parents=True)
+        (components / "panel").mkdir(parents=True)
+        (components / "card" / "Card.module.scss").write_text(CARD_SCSS)
+        (components / "panel" / "Panel.module.scss").write_text(PANEL_SCSS)
+        (project / "src" / "lib" / "styles").mkdir()
+        (project / "src" / "lib" / "styles" / "_tokens.scss").write_text("$space-4: 1rem;\n")
+
+    def test_scss_declarations_skip_selectors_and_variables(self):
+        """Pseudo-classes, media conditions, variables and comments are not declarations"""
+        assert scss_declarations(CARD_SCSS) == ["display:flex", "padding:tokens.$space-4", "color:red"]
+        assert scss_declarations("$map: (a: 1, b: 2);\n$x: 1;\n--gap : 2px;") == ["--gap:2px"]
+
+    def test_audit_counts_copies_across_files(self, tmp_path):
+        """Savings count every copy after the first; single-file declarations are left out"""
+        self.write_modules(tmp_path)
+
+        report = audit_styles(tmp_path)
+
+        assert report["files"] == 2
+        assert report["declarations"] == 6
+        assert [(d["declaration"], d["occurrences"], d["bytes"]) for d in report["duplicates"]] == [
+            ("display:flex", 3, 2 * len("display:flex;")),
+            ("padding:tokens.$space-4", 2, len("padding:tokens.$space-4;")),
+        ]
+        assert report["duplicates"][0]["files"] == ["src/lib/components/card/Card.module.scss",
+                                                    "src/lib/components/panel/Panel.module.scss"]
+
+    def test_audit_command_json(self, tmp_path, monkeypatch):
+        """--json reports one event per duplicate and a summary"""
+        self.write_modules(tmp_path)
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ['--json', 'styles', 'audit'])
+
+        assert result.exit_code == 0, result.output
+        events = [json.loads(line) for line in result.output.splitlines()]
+        assert [event["event"] for event in events] == ["duplicate", "duplicate", "audit"]
+        assert events[-1]["bytes"] == 50
@@ -0,0 +1,113 @@
+# tests/test_templates.py
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.file_templates import get_svelte_component_template
+from svelte_pi.templates import CompiledTemplate, TemplateError, get_registry, reset_registries
+
+
+class TestTemplates:
+    """Test suite for the layered, compiled template registry"""
+
+    def test_builtin_templates_render_as_before(self):
+        """The file_templates helpers keep producing the same output"""
+        content = get_svelte_component_template("Button")
+
+        assert "import styles from './Button.module.scss';" in content
+        assert "<div class={styles.container}>" in content
+        assert "<h1>Button</h1>" in content
+
+    def test_compiled_segments_and_missing_variables(self):
+        """Placeholders are split out once; single braces are left alone"""
+        template = CompiledTemplate.compile("t", "<p class={x}>{{ name }}/{{path}}</p>")
+
+        assert template.segments == ["<p class={x}>", "name", "/", "path", "</p>"]
+        assert template.render(name="A", path="ui/a") == "<p class={x}>A/ui/a</p>"
+        with pytest.raises(TemplateError):
+            template.render(name="A")
+
+    def test_project_overrides_user_overrides_builtin(self, tmp_path, monkeypatch):
+        """Project templates win over user templates, which win over built-ins"""
+        user_dir = tmp_path / "svelte-pi-config" / "templates"
+        user_dir.mkdir(parents=True)
+        (user_dir / "component.svelte").write_text("user {{name}}")
+        (user_dir / "component.module.scss").write_text("user scss")
+        project = tmp_path / "app"
+        (project / ".svelte-pi" / "templates").mkdir(parents=True)
+        (project / ".svelte-pi" / "templates" / "component.svelte").write_text("project {{name}}")
+
+        registry = get_registry(project)
+
+        assert registry.render("component.svelte", name="X") == "project X"
+        assert registry.render("component.module.scss") == "user scss"
+        assert registry.get("reset.css").source == "builtin"
+
+    def test_bulk_render_reads_each_template_once(self, tmp_path):
+        """Hundreds of renders parse each template file a single time"""
+        project = tmp_path / "app"
+        (project / ".svelte-pi" / "templates").mkdir(parents=True)
+        (project / ".svelte-pi" / "templates" / "component.svelte").write_text("<h1>{{name}}</h1>")
+        registry = get_registry(project)
+
+        with patch.object(CompiledTemplate, "compile", wraps=CompiledTemplate.compile) as compile_spy:
+            for index in range(300):
+                registry.render("component.svelte", name=f"C{index}")
+
+        assert compile_spy.call_count == 1
+
+    def test_disk_cache_is_invalidated_by_mtime(self, tmp_path, isolated_cache_dir):
+        """A fresh process reuses the compiled cache until the file changes"""
+        project = tmp_path / "app"
+        template = project / ".svelte-pi" / "templates" / "component.svelte"
+        template.parent.mkdir(parents=True)
+        template.write_text("v1 {{name}}")
+
+        assert get_registry(project).render("component.svelte", name="A") == "v1 A"
+        cached = json.loads((isolated_cache_dir / "templates.json").read_text())
+        assert cached["templates"][str(template)][2] == ["v1 ", "name", ""]
+
+        reset_registries()
+        with patch.object(CompiledTemplate, "compile", wraps=CompiledTemplate.compile) as compile_spy:
+            assert get_registry(project).render("component.svelte", name="A") == "v1 A"
+        assert compile_spy.call_count == 0
+
+        template.write_text("version 2 {{name}}")
+        reset_registries()
+        assert get_registry(project).render("component.svelte", name="A") == "version 2 A"
+
+    def test_eject_failures_exit_non_zero(self, tmp_path, monkeypatch):
+        """An unknown template or an existing copy fails the command"""
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ['templates', 'eject', 'nope.svelte'])
+        assert result.exit_code == 1
+
+        assert CliRunner().invoke(cli, ['templates', 'eject', 'component.svelte']).exit_code == 0
+        result = CliRunner().invoke(cli, ['templates', 'eject', 'component.svelte'])
+        assert result.exit_code == 1
+        assert "already exists" in result.output
+
+        result = CliRunner().invoke(cli, ['templates', 'eject', 'component.svelte', '--project'])
+        assert result.exit_code == 1
+
+    def test_component_uses_project_templates(self, tmp_path, monkeypatch):
+        """component renders through the project's template directory"""
+        project = tmp_path / "app"
+        (project / "src").mkdir(parents=True)
+        (project / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(project)
+
+        result = CliRunner().invoke(cli, ['templates', 'eject', 'component.svelte', '--project'])
+        assert result.exit_code == 0, result.output
+        ejected = project / ".svelte-pi" / "templates" / "component.svelte"
+        ejected.write_text("<!-- {{path}} -->\n" + ejected.read_text())
+
+        result = CliRunner().invoke(cli, ['component', 'ui/button'])
+
+        assert result.exit_code == 0, result.output
+        created = project / "src" / "lib" / "components" / "ui" / "button" / "Button.svelte"
+        assert created.read_text().startswith("<!-- ui/button -->\n")
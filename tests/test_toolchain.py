@@ -0,0 +1,53 @@
+# tests/test_toolchain.py
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.process_runner import RunResult
+from svelte_pi.project_setup import skeleton_profile
+from svelte_pi.toolchain import SV_VERSION, install_sv, pin_file, sv_binary, sv_command, sv_version, tools_dir
+
+
+def fake_npm(installed=True):
+    """A run_streaming stand-in that lays out what `npm install --prefix` would"""
+    def run(cmd, cwd, label):
+        if installed:
+            bin_dir = Path(cmd[cmd.index("--prefix") + 1]) / "node_modules" / ".bin"
+            bin_dir.mkdir(parents=True)
+            (bin_dir / "sv").write_text("#!/bin/sh\n")
+        return RunResult(0 if installed else 1, ["npm error 404"], cwd / "npm.log")
+    return run
+
+
+class TestToolchain:
+    """Test suite for the pinned sv in the tool cache"""
+
+    def test_first_use_installs_then_runs_the_binary(self):
+        """sv is installed once; later commands run the cached binary with no npm call"""
+        with patch("svelte_pi.toolchain.run_streaming", side_effect=fake_npm()) as npm:
+            assert sv_command() == [str(sv_binary())]
+            assert sv_command() == [str(sv_binary())]
+
+        assert npm.call_count == 1
+        cmd = npm.call_args[0][0]
+        assert cmd[:2] == ["npm", "install"] and cmd[-1] == f"sv@{SV_VERSION}"
+        assert [entry.name for entry in tools_dir().iterdir()] == [f"sv-{SV_VERSION}"]
+
+    def test_failed_install_falls_back_to_npx(self):
+        with patch("svelte_pi.toolchain.run_streaming", side_effect=fake_npm(installed=False)):
+            assert sv_command() == ["npx", "--yes", f"sv@{SV_VERSION}"]
+        assert not tools_dir().exists() or not any(tools_dir().iterdir())
+
+    def test_update_pins_a_version(self):
+        """`toolchain update --version` pins it, drops the old install and changes the skeleton profile"""
+        with patch("svelte_pi.toolchain.run_streaming", side_effect=fake_npm()):
+            assert install_sv()
+            result = CliRunner().invoke(cli, ["toolchain", "update", "--version", "0.10.0"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(pin_file().read_text()) == {"sv": "0.10.0"}
+        assert sv_version() == "0.10.0" and skeleton_profile()["sv_version"] == "0.10.0"
+        assert [entry.name for entry in tools_dir().iterdir()] == ["sv-0.10.0"]
@@ -0,0 +1,72 @@
+# tests/test_tracing.py
+import json
+import os
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.scheduler import Step, run_steps
+from svelte_pi.tracing import trace_step, trace_events, reset_trace, record_files, write_chrome_trace
+
+
+class TestTracing:
+    """Test suite for per-step timing and resource accounting"""
+
+    def setup_method(self):
+        reset_trace()
+
+    def test_step_records_time_and_child_cpu(self):
+        """A traced step carries wall time, child CPU time and peak RSS"""
+        with trace_step("spin", category="test") as details:
+            subprocess.run([sys.executable, "-c", "sum(range(2_000_000))"], check=True)
+            record_files("a.txt")
+            details["extra"] = 1
+
+        (event,) = trace_events()
+        assert event["name"] == "spin" and event["ph"] == "X"
+        assert event["dur"] > 0
+        assert event["args"]["status"] == "ok"
+        assert event["args"]["child_cpu_s"] > 0
+        assert event["args"]["peak_rss_kb"] > 0
+        assert event["args"]["files"] == ["a.txt"]
+        assert event["args"]["extra"] == 1
+
+    def test_scheduler_traces_failed_steps(self):
+        """Steps that return False are recorded as failed"""
+        run_steps([Step("ok", lambda: True, outputs=("a",)),
+                   Step("broken", lambda: False, inputs=("a",))])
+
+        statuses = {event["name"]: event["args"]["status"] for event in trace_events()}
+        assert statuses == {"ok": "ok", "broken": "failed"}
+
+    def test_chrome_trace_file(self, tmp_path):
+        """The trace file loads as Chrome trace-event JSON"""
+        with trace_step("one"):
+            pass
+        trace_file = write_chrome_trace(tmp_path / "trace.json")
+
+        data = json.loads(trace_file.read_text())
+        assert [event["name"] for event in data["traceEvents"]] == ["one"]
+        assert data["traceEvents"][0]["tid"] == 1
+        assert "svelte_pi" in data["otherData"]
+
+    def test_component_trace_option(self, tmp_path):
+        """component --trace writes one event per file (and the missing tokens partial) plus the batch"""
+        project = tmp_path / "app"
+        (project / "src").mkdir(parents=True)
+        (project / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        trace_file = tmp_path / "trace.json"
+
+        previous_cwd = os.getcwd()
+        os.chdir(project)
+        try:
+            result = CliRunner().invoke(cli, ['component', 'ui/a', 'ui/b', '--trace', str(trace_file)])
+        finally:
+            os.chdir(previous_cwd)
+
+        assert result.exit_code == 0, result.output
+        names = [event["name"] for event in json.loads(trace_file.read_text())["traceEvents"]]
+        assert "components" in names
+        assert sum(name.startswith("write ") for name in names) == 5
@@ -0,0 +1,73 @@
+# tests/test_workspace.py
+import json
+
+import pytest
+
+from svelte_pi.create_pipeline import build_create_steps
+from svelte_pi.scheduler import resolve_dependencies
+from svelte_pi.workspace import (SASS_EMBEDDED_RANGE, add_workspace_members, covers, declare_sass,
+                                 workspace_member_path)
+
+
+class TestWorkspace:
+    """Test suite for yarn workspace membership"""
+
+    def test_new_root_becomes_a_private_workspace(self, tmp_path):
+        """A root without package.json is initialized with the members listed by path"""
+        root = tmp_path / "mono"
+        root.mkdir()
+
+        assert add_workspace_members(root, [root / "apps" / "shop", root / "apps" / "admin"])
+
+        package_data = json.loads((root / "package.json").read_text())
+        assert package_data == {"name": "mono", "private": True, "workspaces": ["apps/shop", "apps/admin"]}
+
+    def test_existing_globs_and_indentation_are_kept(self, tmp_path):
+        """Members matched by a glob are not added again; the file keeps its format"""
+        (tmp_path / "package.json").write_text(json.dumps(
+            {"name": "mono", "private": True, "workspaces": {"packages": ["apps/*"], "nohoist": ["**/x"]}},
+            indent=4) + "\n")
+
+        assert add_workspace_members(tmp_path, [tmp_path / "apps" / "shop", tmp_path / "tools" / "cli"])
+
+        text = (tmp_path / "package.json").read_text()
+        assert text.startswith('{\n    "name"')
+        assert json.loads(text)["workspaces"] == {"packages": ["apps/*", "tools/cli"], "nohoist": ["**/x"]}
+
+    def test_globs_match_one_directory_per_star(self):
+        assert covers("apps/*", "apps/shop")
+        assert not covers("apps/*", "apps/shop/web")
+        assert covers("apps/**", "apps/shop/web")
+        assert covers("apps/shop/", "apps/shop")
+
+    def test_members_must_be_inside_the_root(self, tmp_path):
+        with pytest.raises(ValueError):
+            workspace_member_path(tmp_path / "mono", tmp_path / "elsewhere" / "shop")
+        with pytest.raises(ValueError):
+            workspace_member_path(tmp_path, tmp_path)
+
+    def test_declare_sass_keeps_an_existing_range(self, tmp_path):
+        package_json = tmp_path / "package.json"
+        package_json.write_text(json.dumps({"devDependencies": {"vite": "^7.0.0"}}, indent="\t") + "\n")
+        assert declare_sass(tmp_path)
+        assert json.loads(package_json.read_text())["devDependencies"]["sass-embedded"] == SASS_EMBEDDED_RANGE
+
+        package_json.write_text(json.dumps({"devDependencies": {"sass-embedded": "1.80.0"}}))
+        assert declare_sass(tmp_path)
+        assert json.loads(package_json.read_text())["devDependencies"]["sass-embedded"] == "1.80.0"
+
+    def test_create_steps_install_from_the_root(self, tmp_path):
+        """Members skip the per-project install, cache and store; the root installs once"""
+        root = tmp_path / "mono"
+        steps = build_create_steps("shop", str(root / "apps"), use_reset_css=True, workspace=str(root), perf=True)
+        names = [step.name for step in steps]
+        dependencies = resolve_dependencies(steps)
+
+        assert "install" not in names and "snapshot" not in names and "link_store" not in names
+        assert "materialize" not in names
+        assert dependencies["workspace_install"] == {"declare_sass", "workspace"}
+        assert dependencies["perf"] == {"declare_sass"}
+
+        deferred = build_create_steps("shop", str(root / "apps"), use_reset_css=True, workspace=str(root),
+                                      join_workspace=False)
+        assert not {"workspace", "workspace_install"} & {step.name for step in deferred}
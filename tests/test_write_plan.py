@@ -0,0 +1,141 @@
+# tests/test_write_plan.py
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from svelte_pi.main import cli
+from svelte_pi.file_operations import create_components, update_app_html
+from svelte_pi.write_plan import WritePlan, WritePlanError, CREATE, UPDATE, UNCHANGED
+
+
+class TestWritePlan:
+    """Test suite for diffed, all-or-nothing file writes"""
+
+    def test_only_changed_files_are_written(self, tmp_path):
+        """Unchanged files keep their inode and mtime"""
+        same = tmp_path / "same.txt"
+        same.write_text("same")
+        os.utime(same, (1, 1))
+        changed = tmp_path / "changed.txt"
+        changed.write_text("old")
+
+        plan = WritePlan(tmp_path)
+        plan.add(same, "same")
+        plan.add(changed, "new")
+        plan.add(tmp_path / "nested" / "new.txt", "fresh")
+        planned = plan.apply()
+
+        assert [entry.action for entry in planned] == [UNCHANGED, UPDATE, CREATE]
+        assert same.stat().st_mtime == 1
+        assert changed.read_text() == "new"
+        assert (tmp_path / "nested" / "new.txt").read_text() == "fresh"
+
+    def test_updates_keep_the_file_mode(self, tmp_path):
+        """A rewritten file keeps the permissions it had"""
+        script = tmp_path / "run.sh"
+        script.write_text("echo old")
+        os.chmod(script, 0o750)
+
+        plan = WritePlan(tmp_path)
+        plan.add(script, "echo new")
+        plan.apply()
+
+        assert script.stat().st_mode & 0o777 == 0o750
+
+    def test_failure_while_staging_applies_nothing(self, tmp_path):
+        """If one file cannot be staged, no file changes and no temp files remain"""
+        existing = tmp_path / "a.txt"
+        existing.write_text("old")
+        plan = WritePlan(tmp_path)
+        plan.add(existing, "new")
+        plan.add(tmp_path / "new-dir" / "b.txt", "b")
+
+        real_chmod = os.chmod
+
+        def failing_chmod(path, mode):
+            if "b.txt" in str(path):
+                raise PermissionError(13, "Permission denied", str(path))
+            real_chmod(path, mode)
+
+        with patch("svelte_pi.write_plan.os.chmod", side_effect=failing_chmod):
+            with pytest.raises(WritePlanError):
+                plan.apply(max_workers=4)
+
+        assert existing.read_text() == "old"
+        assert sorted(os.listdir(tmp_path)) == ["a.txt"]
+
+    def test_concurrent_plans_share_a_new_directory(self, tmp_path):
+        """Two plans creating the same missing parent both succeed"""
+        from pathlib import Path
+        from threading import Barrier, Thread
+
+        (tmp_path / "src" / "lib").mkdir(parents=True)
+        barrier = Barrier(2, timeout=5)
+        real_mkdir = Path.mkdir
+
+        def racing_mkdir(path, *args, **kwargs):
+            # Both plans have seen the directory missing before either creates it
+            barrier.wait()
+            return real_mkdir(path, *args, **kwargs)
+
+        errors = []
+
+        def write(name):
+            plan = WritePlan(tmp_path)
+            plan.add(tmp_path / "src" / "lib" / "styles" / name, "x")
+            try:
+                plan.apply()
+            except WritePlanError as e:
+                errors.append(e)
+
+        with patch.object(Path, "mkdir", racing_mkdir):
+            threads = [Thread(target=write, args=(name,)) for name in ("_tokens.scss", "reset.css")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert errors == []
+        assert sorted(path.name for path in (tmp_path / "src" / "lib" / "styles").iterdir()) == [
+            "_tokens.scss", "reset.css"]
+
+    def test_update_app_html_is_idempotent(self, tmp_path):
+        """Running the reset.css link step twice adds the link once"""
+        (tmp_path / "src").mkdir()
+        app_html = tmp_path / "src" / "app.html"
+        app_html.write_text('<head>\n\t<meta name="viewport" content="width=device-width, initial-scale=1" />\n</head>\n')
+
+        assert update_app_html(tmp_path)
+        first = app_html.read_text()
+        assert update_app_html(tmp_path)
+
+        assert app_html.read_text() == first
+        assert first.count("reset.css") == 1
+
+    def test_rerunning_components_writes_nothing(self, tmp_path, monkeypatch):
+        """A second bulk run finds every file up to date"""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(tmp_path)
+
+        first = create_components(["ui/a", "ui/b"])
+        second = create_components(["ui/a", "ui/b"])
+
+        assert all(len(files) == 2 for _, files, _ in first)
+        assert all(files == [] and error is None for _, files, error in second)
+
+    def test_component_dry_run_writes_nothing(self, tmp_path, monkeypatch):
+        """--dry-run prints the plan and leaves the tree alone"""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"@sveltejs/kit": "^2"}}))
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ['component', 'ui/a', 'ui/b', '--dry-run'])
+
+        assert result.exit_code == 0, result.output
+        # Two files per component plus the tokens partial the modules @use
+        assert "5 of 5 files would be written" in result.output
+        assert not (tmp_path / "src" / "lib").exists()